@@ -0,0 +1,88 @@
+// ClipChimp/backend/src/analysis/ai-analysis.service.spec.ts
+import { closeTruncatedJson, findObjectEnd, parseSrtToSegments } from './ai-analysis.service';
+
+describe('AI analysis JSON helpers', () => {
+  describe('findObjectEnd', () => {
+    it('returns the index of the closing brace', () => {
+      const text = 'Here it is: {"a": {"b": 1}} done';
+      const start = text.indexOf('{');
+      expect(text.substring(start, findObjectEnd(text, start) + 1)).toBe('{"a": {"b": 1}}');
+    });
+
+    it('ignores braces inside quoted strings', () => {
+      const text = '{"quote": "he said } and {", "n": 1} trailing }';
+      const end = findObjectEnd(text, 0);
+      expect(JSON.parse(text.substring(0, end + 1))).toEqual({ quote: 'he said } and {', n: 1 });
+    });
+
+    it('ignores escaped quotes inside strings', () => {
+      const text = '{"quote": "a \\"}\\" b"}';
+      expect(findObjectEnd(text, 0)).toBe(text.length - 1);
+    });
+
+    it('returns -1 when the object never closes', () => {
+      expect(findObjectEnd('{"flags": [{"a": 1}', 0)).toBe(-1);
+    });
+  });
+
+  describe('closeTruncatedJson', () => {
+    it('leaves complete JSON unchanged', () => {
+      const json = '{"title": "A", "flags": []}';
+      expect(closeTruncatedJson(json)).toBe(json);
+    });
+
+    it('closes a reply cut off inside the flags array', () => {
+      const repaired = closeTruncatedJson('{"title": "A", "flags": [{"category": "x", "quote": "q"}');
+      expect(JSON.parse(repaired)).toEqual({
+        title: 'A',
+        flags: [{ category: 'x', quote: 'q' }],
+      });
+    });
+
+    it('completes a dangling key', () => {
+      expect(JSON.parse(closeTruncatedJson('{"title": "A", "summary"'))).toEqual({ title: 'A', summary: null });
+      expect(JSON.parse(closeTruncatedJson('{"title": "A", "summary":'))).toEqual({ title: 'A', summary: null });
+    });
+
+    it('completes a key cut off mid-string', () => {
+      expect(JSON.parse(closeTruncatedJson('{"title": "A", "summ'))).toEqual({ title: 'A', summ: null });
+    });
+
+    it('drops a dangling comma', () => {
+      expect(JSON.parse(closeTruncatedJson('{"flags": [1, 2, '))).toEqual({ flags: [1, 2] });
+    });
+
+    it('closes an unterminated string value', () => {
+      expect(JSON.parse(closeTruncatedJson('{"title": "Half a tit'))).toEqual({ title: 'Half a tit' });
+    });
+
+    it('drops a lone trailing backslash in an unterminated string', () => {
+      expect(JSON.parse(closeTruncatedJson('{"title": "ends with \\'))).toEqual({ title: 'ends with ' });
+    });
+
+    it('does not count braces inside quoted strings', () => {
+      const repaired = closeTruncatedJson('{"flags": [{"quote": "a { b [ c"}, {"quote": "} ]"');
+      expect(JSON.parse(repaired)).toEqual({ flags: [{ quote: 'a { b [ c' }, { quote: '} ]' }] });
+    });
+  });
+});
+
+describe('parseSrtToSegments', () => {
+  it('parses multi-line cues with Windows line endings', () => {
+    const srt = '1\r\n00:00:01,000 --> 00:00:02,500\r\nHello\r\nthere\r\n\r\n2\r\n00:01:00,000 --> 00:01:03,000\r\nBye\r\n';
+    expect(parseSrtToSegments(srt)).toEqual([
+      { start: 1, end: 2.5, text: 'Hello there' },
+      { start: 60, end: 63, text: 'Bye' },
+    ]);
+  });
+
+  it('keeps the first cue when the file starts with a BOM', () => {
+    const srt = '\uFEFF1\n00:00:01,000 --> 00:00:02,000\nFirst\n\n2\n00:00:03,000 --> 00:00:04,000\nSecond\n';
+    expect(parseSrtToSegments(srt).map((s) => s.text)).toEqual(['First', 'Second']);
+  });
+
+  it('skips cues with no text', () => {
+    const srt = '1\n00:00:01,000 --> 00:00:02,000\n\n2\n00:00:03,000 --> 00:00:04,000\nSpoken\n';
+    expect(parseSrtToSegments(srt)).toEqual([{ start: 3, end: 4, text: 'Spoken' }]);
+  });
+});
@@ -19,6 +19,7 @@ import {
   DESCRIPTION_FROM_CHAPTERS_PROMPT,
   TAGS_FROM_CHAPTERS_PROMPT,
   TITLE_FROM_CHAPTERS_PROMPT,
+  METADATA_FROM_CHAPTERS_PROMPT,
   DEFAULT_PROMPTS,
   AnalysisCategory,
 } from './prompts/analysis-prompts';
@@ -47,6 +48,17 @@ interface Chunk {
   endTime: number;
   text: string;
   segments: Segment[];
+  segmentStart: number;  // Index of segments[0] in the full transcript
+}
+
+// A chapter's time range and transcript, ready for Pass 2 analysis
+interface ChapterInput {
+  number: number;
+  startTime: number;
+  endTime: number;
+  segments: Segment[];
+  segmentStart: number;  // Index of segments[0] in the full transcript
+  text: string;
 }
 
 export interface Quote {
@@ -116,6 +128,7 @@ export interface AnalysisOptions {
   categories?: AnalysisCategory[];
   apiKey?: string;
   ollamaEndpoint?: string;
+  bypassCache?: boolean; // Re-analysis: ask the provider again instead of reusing cached replies
   onProgress?: (progress: AnalysisProgress) => void;
 }
 
@@ -135,6 +148,7 @@ export interface AnalysisResult {
   description?: string;
   suggested_title?: string;
   tokenStats?: TokenStats;
+  report: string;            // Full text report, as written to outputFile
 }
 
 // =============================================================================
@@ -143,11 +157,29 @@ export interface AnalysisResult {
 
 const MAX_RETRIES = 3;
 const JSON_PARSE_RETRIES = 2;
+// Boundary replies are a short JSON object; cap generation so a rambling model can't run on
+const BOUNDARY_MAX_TOKENS = 800;
+const SECTION_DIVIDER = '-'.repeat(80) + '\n\n';
+// Chunks with less speech than this can't contain a topic change worth a model call
+const MIN_CHUNK_SPOKEN_WORDS = 20;
+// Whisper annotations for non-speech audio: [Music], [BLANK_AUDIO], (applause), ♪
+const NON_SPEECH_REGEX = /\[[^\]]*\]|\([^)]*\)|[♪♫]/g;
+// Title openers that mean the model answered with commentary instead of a title
+const META_COMMENTARY_TITLE_REGEX =
+  /^(?:based on|the transcript|this video|i would|i suggest|here is|the suggested)/i;
+// Description openers that mean the model refused instead of describing the video
+const REFUSAL_REGEX = /^(?:i apologize|i'm sorry|i cannot|unfortunately|as an ai)/i;
 
 // =============================================================================
 // JSON EXTRACTION AND VALIDATION HELPERS
 // =============================================================================
 
+// Markdown code block around a JSON reply, with or without a json language tag
+const CODE_BLOCK_REGEX = /```(?:json)?\s*([\s\S]*?)```/;
+
+// A lone ``` fence line (unclosed block), removed in one pass instead of split/filter/join
+const FENCE_LINE_REGEX = /^[^\S\n]*```[^\n]*(?:\n|$)/gm;
+
 /**
  * Extract JSON from AI response text, handling various formats
  * Tries multiple strategies to find valid JSON in the response
@@ -162,43 +194,61 @@ function extractJsonFromResponse(response: string): string | null {
   // Strategy 1: Remove markdown code blocks
   if (text.includes('```')) {
     // Try to extract content between ```json and ``` or just ``` and ```
-    const jsonBlockMatch = text.match(/```(?:json)?\s*([\s\S]*?)```/);
+    const jsonBlockMatch = text.match(CODE_BLOCK_REGEX);
     if (jsonBlockMatch) {
       text = jsonBlockMatch[1].trim();
     } else {
       // Fallback: remove all ``` lines
-      text = text.split('\n').filter(l => !l.trim().startsWith('```')).join('\n').trim();
+      text = text.replace(FENCE_LINE_REGEX, '').trim();
     }
   }
 
   // Strategy 2: Find JSON object with balanced braces
   const firstBrace = text.indexOf('{');
+  if (firstBrace === -1) {
+    return null;
+  }
+
+  const endBrace = findObjectEnd(text, firstBrace);
+  if (endBrace !== -1) {
+    return text.substring(firstBrace, endBrace + 1);
+  }
+
+  // Unbalanced: keep up to the last closed brace so a half-written entry is dropped
   const lastBrace = text.lastIndexOf('}');
+  if (lastBrace > firstBrace) {
+    return text.substring(firstBrace, lastBrace + 1);
+  }
 
-  if (firstBrace !== -1 && lastBrace > firstBrace) {
-    // Extract the portion that looks like JSON
-    let jsonCandidate = text.substring(firstBrace, lastBrace + 1);
-
-    // Try to balance braces if needed
-    let braceCount = 0;
-    let endIndex = -1;
-    for (let i = 0; i < jsonCandidate.length; i++) {
-      if (jsonCandidate[i] === '{') braceCount++;
-      if (jsonCandidate[i] === '}') braceCount--;
-      if (braceCount === 0) {
-        endIndex = i;
-        break;
-      }
-    }
+  // An object that never closes was cut off; hand it on so repair can close it
+  return text.substring(firstBrace);
+}
 
-    if (endIndex !== -1) {
-      jsonCandidate = jsonCandidate.substring(0, endIndex + 1);
+/**
+ * Index of the brace that closes the object opening at `start`, or -1 if it never closes
+ * One forward pass; braces inside string values (quotes often have them) don't count
+ */
+export function findObjectEnd(text: string, start: number): number {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+
+  for (let i = start; i < text.length; i++) {
+    const ch = text[i];
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === '\\') escaped = true;
+      else if (ch === '"') inString = false;
+    } else if (ch === '"') {
+      inString = true;
+    } else if (ch === '{') {
+      depth++;
+    } else if (ch === '}' && --depth === 0) {
+      return i;
     }
-
-    return jsonCandidate;
   }
 
-  return null;
+  return -1;
 }
 
 /**
@@ -225,23 +275,85 @@ function attemptJsonRepair(jsonStr: string): string {
     return ''; // Remove others
   });
 
-  // Fix truncated strings - if we have an unclosed quote, try to close it
-  const quoteCount = (fixed.match(/(?<!\\)"/g) || []).length;
-  if (quoteCount % 2 !== 0) {
-    // Odd number of quotes - likely truncated
-    // Try to close the last open string and the object
-    if (!fixed.endsWith('"')) {
-      fixed = fixed + '"';
+  // Close whatever a truncated reply (token limit, early stop) left open
+  return closeTruncatedJson(fixed);
+}
+
+/**
+ * Close an unterminated string and any open arrays/objects, innermost first
+ * A reply cut off mid-way through its flags list keeps every complete flag
+ * this way, instead of failing to parse and costing another model call
+ */
+export function closeTruncatedJson(json: string): string {
+  const open: string[] = [];
+  let inString = false;
+  let escaped = false;
+  // Whether the string being read (or the last one read) is an object key
+  let stringIsKey = false;
+  // Last non-whitespace character outside a string ('"' once a string closes)
+  let previous = '';
+
+  for (let i = 0; i < json.length; i++) {
+    const ch = json[i];
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === '\\') escaped = true;
+      else if (ch === '"') {
+        inString = false;
+        previous = ch;
+      }
+      continue;
+    }
+
+    if (ch === ' ' || ch === '\n' || ch === '\r' || ch === '\t') continue;
+
+    if (ch === '"') {
+      inString = true;
+      stringIsKey = open[open.length - 1] === '}' && (previous === '{' || previous === ',');
+    } else if (ch === '{') {
+      open.push('}');
+    } else if (ch === '[') {
+      open.push(']');
+    } else if ((ch === '}' || ch === ']') && open.length > 0) {
+      open.pop();
     }
-    // Count braces
-    const openBraces = (fixed.match(/{/g) || []).length;
-    const closeBraces = (fixed.match(/}/g) || []).length;
-    for (let i = 0; i < openBraces - closeBraces; i++) {
-      fixed = fixed + '}';
+    previous = ch;
+  }
+
+  if (!inString && open.length === 0) {
+    return json;
+  }
+
+  let closed: string;
+  if (inString) {
+    // A lone trailing backslash would escape the closing quote
+    closed = (escaped ? json.slice(0, -1) : json) + '"';
+    if (stringIsKey) closed += ':null';
+  } else {
+    closed = json.trimEnd();
+    // A dangling separator or key can't be closed as is
+    if (previous === ',') {
+      closed = closed.slice(0, -1);
+    } else if (previous === ':') {
+      closed += 'null';
+    } else if (previous === '"' && stringIsKey) {
+      closed += ':null';
     }
   }
 
-  return fixed;
+  for (let i = open.length - 1; i >= 0; i--) {
+    closed += open[i];
+  }
+  return closed;
+}
+
+/**
+ * Whether the reply's JSON object closes on its own, i.e. it wasn't cut off
+ * Truncated replies are still repaired for use, but aren't cached
+ */
+function isJsonReplyComplete(response: string): boolean {
+  const firstBrace = response.indexOf('{');
+  return firstBrace !== -1 && findObjectEnd(response, firstBrace) !== -1;
 }
 
 /**
@@ -253,6 +365,17 @@ function safeJsonParse<T>(response: string, logger?: Logger): T | null {
     return null;
   }
 
+  // Fast path: the reply is already a bare JSON object (the common case now
+  // that streaming stops at the closing brace)
+  const trimmed = response.trim();
+  if (trimmed.startsWith('{') && trimmed.endsWith('}')) {
+    try {
+      return JSON.parse(trimmed) as T;
+    } catch {
+      // Fall through to extraction and repair
+    }
+  }
+
   // Step 1: Extract JSON from response
   const jsonStr = extractJsonFromResponse(response);
   if (!jsonStr) {
@@ -363,6 +486,53 @@ function validateBoundaryResult(data: unknown): BoundaryDetectionResult | null {
   };
 }
 
+// =============================================================================
+// SRT PARSING
+// =============================================================================
+
+/**
+ * Matches one SRT block: sequence number, timestamp line, then text lines up to the blank line
+ * Groups 1-4: start h/m/s/ms, groups 5-8: end h/m/s/ms, group 9: text
+ */
+const SRT_BLOCK_REGEX =
+  /^[ \t]*\d+[ \t]*\n(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})[^\n]*\n((?:[ \t]*\S[^\n]*(?:\n|$))*)/gm;
+
+/**
+ * Parse SRT content into transcript segments (for AI analysis timestamp correlation)
+ * Shared by every analysis entry point so they all handle \r\n line endings and
+ * multi-line cues the same way
+ */
+export function parseSrtToSegments(srtContent: string): Segment[] {
+  const segments: Segment[] = [];
+
+  if (!srtContent || typeof srtContent !== 'string') {
+    return segments;
+  }
+
+  // Drop a leading UTF-8 BOM, which would stop the first block matching, and
+  // normalize line endings: convert \r\n (Windows) and \r to \n (Unix)
+  const normalizedContent = srtContent.replace(/^\uFEFF/, '').replace(/\r\n?/g, '\n');
+
+  // One pass over the whole file instead of splitting into blocks and lines
+  for (const match of normalizedContent.matchAll(SRT_BLOCK_REGEX)) {
+    // Cues with no text carry nothing to match quotes against
+    if (!match[9]) {
+      continue;
+    }
+
+    const start = (+match[1]) * 3600 + (+match[2]) * 60 + (+match[3]) + (+match[4]) / 1000;
+    const end = (+match[5]) * 3600 + (+match[6]) * 60 + (+match[7]) + (+match[8]) / 1000;
+
+    segments.push({
+      start,
+      end,
+      text: match[9].trimEnd().replace(/\n/g, ' '),
+    });
+  }
+
+  return segments;
+}
+
 // =============================================================================
 // FUZZY STRING MATCHING
 // =============================================================================
@@ -370,52 +540,103 @@ function validateBoundaryResult(data: unknown): BoundaryDetectionResult | null {
 /**
  * Calculate Levenshtein distance between two strings
  * Returns the minimum number of single-character edits needed
+ * Keeps only two rows of the DP table, reused across calls, since this runs
+ * for every segment a quote is compared against
+ * With maxDistance set, stops as soon as the distance must exceed it and
+ * returns a value over maxDistance instead of the exact distance
  */
-function levenshteinDistance(str1: string, str2: string): number {
+let levenshteinPrevRow = new Uint32Array(64);
+let levenshteinCurrRow = new Uint32Array(64);
+
+function levenshteinDistance(str1: string, str2: string, maxDistance: number = Infinity): number {
   const m = str1.length;
   const n = str2.length;
 
-  // Create a matrix of distances
-  const dp: number[][] = Array(m + 1)
-    .fill(null)
-    .map(() => Array(n + 1).fill(0));
+  if (m === 0) return n;
+  if (n === 0) return m;
 
-  // Initialize first column and row
-  for (let i = 0; i <= m; i++) dp[i][0] = i;
-  for (let j = 0; j <= n; j++) dp[0][j] = j;
+  // Every edit script needs at least the length difference in insertions/deletions
+  const lengthDifference = Math.abs(m - n);
+  if (lengthDifference > maxDistance) return lengthDifference;
 
-  // Fill in the rest of the matrix
+  if (levenshteinPrevRow.length <= n) {
+    levenshteinPrevRow = new Uint32Array(n + 1);
+    levenshteinCurrRow = new Uint32Array(n + 1);
+  }
+  let prev = levenshteinPrevRow;
+  let curr = levenshteinCurrRow;
+
+  // Initialize first row
+  for (let j = 0; j <= n; j++) prev[j] = j;
+
+  // Fill in the rest of the table one row at a time
   for (let i = 1; i <= m; i++) {
+    curr[0] = i;
+    let rowMin = i;
+    const c1 = str1.charCodeAt(i - 1);
     for (let j = 1; j <= n; j++) {
-      if (str1[i - 1] === str2[j - 1]) {
-        dp[i][j] = dp[i - 1][j - 1];
+      if (c1 === str2.charCodeAt(j - 1)) {
+        curr[j] = prev[j - 1];
       } else {
-        dp[i][j] = 1 + Math.min(
-          dp[i - 1][j],     // deletion
-          dp[i][j - 1],     // insertion
-          dp[i - 1][j - 1], // substitution
+        curr[j] = 1 + Math.min(
+          prev[j],     // deletion
+          curr[j - 1], // insertion
+          prev[j - 1], // substitution
         );
       }
+      if (curr[j] < rowMin) rowMin = curr[j];
     }
+    // Row minimums never decrease, so the final distance is at least this
+    if (rowMin > maxDistance) return rowMin;
+    const swap = prev;
+    prev = curr;
+    curr = swap;
   }
 
-  return dp[m][n];
+  return prev[n];
 }
 
 /**
  * Calculate similarity ratio between two strings (0 to 1)
  * Uses Levenshtein distance normalized by the longer string length
+ * Callers that only act on scores above minSimilarity can pass it so hopeless
+ * pairs are abandoned early; scores above it are still exact
  */
-function stringSimilarity(str1: string, str2: string): number {
+function stringSimilarity(str1: string, str2: string, minSimilarity: number = 0): number {
   if (str1 === str2) return 1;
   if (str1.length === 0 || str2.length === 0) return 0;
 
-  const distance = levenshteinDistance(str1, str2);
   const maxLength = Math.max(str1.length, str2.length);
+  const distance = levenshteinDistance(str1, str2, Math.floor((1 - minSimilarity) * maxLength));
 
   return 1 - distance / maxLength;
 }
 
+// Common words ignored by distinctive-word phrase matching
+const COMMON_WORDS = new Set([
+  'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+  'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+  'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
+  'into', 'through', 'during', 'before', 'after', 'above', 'below',
+  'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
+  'not', 'only', 'own', 'same', 'than', 'too', 'very', 'just',
+  'that', 'this', 'these', 'those', 'what', 'which', 'who', 'whom',
+  'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+  'my', 'your', 'his', 'its', 'our', 'their', 'mine', 'yours', 'hers', 'ours', 'theirs',
+  'about', 'also', 'back', 'because', 'come', 'could', 'day', 'even',
+  'first', 'get', 'give', 'go', 'good', 'know', 'like', 'look', 'make',
+  'new', 'now', 'one', 'people', 'say', 'see', 'some', 'take', 'think',
+  'time', 'two', 'use', 'want', 'way', 'well', 'work', 'year',
+]);
+
+// How a transcript word compares to a distinctive word from a quote
+enum WordMatch {
+  None,
+  Exact,  // Equal, or one contains the other
+  Fuzzy,  // Over 75% similar
+}
+
 /**
  * Normalize text for fuzzy comparison
  * Removes punctuation, extra spaces, and lowercases
@@ -428,6 +649,175 @@ function normalizeForComparison(text: string): string {
     .trim();
 }
 
+/**
+ * Column layout of the transcript, built once per analysis run and shared by
+ * both passes: start times in a flat Float64Array for range searches, and
+ * normalized text for phrase lookups. Word lists are split lazily since only
+ * the distinctive-word strategy needs them
+ */
+interface SegmentIndex {
+  starts: Float64Array;
+  // texts and words are the whole run's arrays, shared by every slice: entry i
+  // of this index is at offset + i, so a word list split for one chunk or
+  // chapter is kept for the rest of the run
+  texts: string[];
+  words: Array<string[] | undefined>;
+  offset: number;
+  // All texts joined with '\n' (never inside a normalized text) plus each text's
+  // offset, built on first use so exact lookups are one native search
+  joined?: { text: string; offsets: Uint32Array };
+}
+
+function buildSegmentIndex(segments: Segment[]): SegmentIndex {
+  const starts = new Float64Array(segments.length);
+  const texts = new Array<string>(segments.length);
+  for (let i = 0; i < segments.length; i++) {
+    starts[i] = segments[i].start;
+    texts[i] = normalizeForComparison(segments[i].text);
+  }
+  return { starts, texts, words: new Array(segments.length), offset: 0 };
+}
+
+/**
+ * Index entries for a contiguous range of segments (one chunk or chapter)
+ * A view over the parent's arrays; nothing is copied
+ */
+function sliceSegmentIndex(index: SegmentIndex, start: number, end: number): SegmentIndex {
+  return {
+    starts: index.starts.subarray(start, end),
+    texts: index.texts,
+    words: index.words,
+    offset: index.offset + start,
+  };
+}
+
+/**
+ * Index of the first segment whose normalized text contains `needle`, or -1
+ * Searches the joined texts once instead of calling includes() per segment;
+ * the separator can't be part of a needle, so a hit never spans two segments
+ */
+function findSegmentContaining(index: SegmentIndex, needle: string): number {
+  if (!index.joined) {
+    const count = index.starts.length;
+    const offsets = new Uint32Array(count);
+    let text = '';
+    for (let i = 0; i < count; i++) {
+      offsets[i] = text.length + (i > 0 ? 1 : 0);
+      text += (i > 0 ? '\n' : '') + index.texts[index.offset + i];
+    }
+    index.joined = { text, offsets };
+  }
+
+  const position = index.joined.text.indexOf(needle);
+  if (position === -1) {
+    return -1;
+  }
+
+  // Last segment starting at or before the hit
+  const offsets = index.joined.offsets;
+  let lo = 0;
+  let hi = offsets.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >>> 1;
+    if (offsets[mid] <= position) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return lo;
+}
+
+function getSegmentWords(index: SegmentIndex, i: number): string[] {
+  const entry = index.offset + i;
+  let words = index.words[entry];
+  if (!words) {
+    words = index.texts[entry].split(/\s+/);
+    index.words[entry] = words;
+  }
+  return words;
+}
+
+// =============================================================================
+// SEGMENT LOOKUP
+// =============================================================================
+
+/**
+ * Find the index of the first segment starting at or after `time`
+ * Whisper segments are sorted by start time, so this is a binary search
+ */
+function lowerBoundByStart(starts: Float64Array, time: number, from: number = 0): number {
+  let lo = from;
+  let hi = starts.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (starts[mid] < time) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
+/**
+ * Count words of actual speech, ignoring whisper's non-speech annotations
+ */
+function countSpokenWords(text: string): number {
+  const words = text.replace(NON_SPEECH_REGEX, ' ').match(/\S+/g);
+  return words ? words.length : 0;
+}
+
+/**
+ * Clip text to a prompt budget without leaving a partial word at the end
+ * A cut-off word fragment is just extra tokens the model has to read past,
+ * so back up to the last whitespace (within the final 20% of the budget)
+ */
+function clipToBudget(text: string, maxChars: number): string {
+  if (text.length <= maxChars) {
+    return text;
+  }
+
+  const minCut = Math.floor(maxChars * 0.8);
+  for (let i = maxChars; i > minCut; i--) {
+    const code = text.charCodeAt(i);
+    if (code === 32 || code === 10) { // space or newline
+      return text.substring(0, i);
+    }
+  }
+  return text.substring(0, maxChars);
+}
+
+/**
+ * Join segment texts with spaces, only materializing the first maxChars
+ * Returns the truncated text plus the length the full join would have had
+ */
+function joinSegmentText(
+  segments: Segment[],
+  maxChars: number,
+  trimEach: boolean = false,
+): { text: string; fullLength: number } {
+  const parts: string[] = [];
+  let builtLength = 0;
+  let fullLength = 0;
+
+  for (let i = 0; i < segments.length; i++) {
+    const text = trimEach ? segments[i].text.trim() : segments[i].text;
+    const length = text.length + (i > 0 ? 1 : 0);
+    fullLength += length;
+    if (builtLength < maxChars) {
+      parts.push(text);
+      builtLength += length;
+    }
+  }
+
+  const joined = parts.join(' ');
+  return {
+    text: clipToBudget(joined, maxChars),
+    fullLength,
+  };
+}
+
 // Model size limits - conservative estimates based on typical context windows
 // These ensure chunks fit comfortably with room for prompts and output
 interface ModelLimits {
@@ -492,6 +882,50 @@ function getModelLimits(modelName: string): ModelLimits {
   };
 }
 
+/**
+ * How many AI requests may be in flight at once for a provider
+ * Ollama serves concurrent generate calls when started with OLLAMA_NUM_PARALLEL
+ * (e.g. OLLAMA_NUM_PARALLEL=4), so the same variable opts analysis into
+ * concurrent requests. Claude and OpenAI opt in with AI_API_PARALLEL, kept
+ * within the account's rate limit by the user. The local model stays sequential.
+ */
+function getRequestParallelism(provider: AIProviderConfig['provider']): number {
+  let variable: string | undefined;
+  if (provider === 'ollama') {
+    variable = process.env.OLLAMA_NUM_PARALLEL;
+  } else if (provider === 'claude' || provider === 'openai') {
+    variable = process.env.AI_API_PARALLEL;
+  } else {
+    return 1;
+  }
+  const configured = parseInt(variable || '', 10);
+  return Number.isFinite(configured) && configured > 1 ? configured : 1;
+}
+
+/**
+ * Map items through an async function with at most `limit` calls in flight
+ * Results are returned in input order
+ */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  mapper: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await mapper(items[index], index);
+    }
+  };
+
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+  return results;
+}
+
 // =============================================================================
 // SERVICE
 // =============================================================================
@@ -565,17 +999,13 @@ export class AIAnalysisService {
    *   Pass 2: Analyze each chapter with full context (title, summary, flags)
    */
   async analyzeTranscript(options: AnalysisOptions): Promise<AnalysisResult> {
-    console.log('=== AIAnalysisService.analyzeTranscript CALLED (Two-Pass) ===');
-    console.log(`Provider: ${options.provider}, Model: ${options.model}`);
-    console.log(`[analyzeTranscript] SEGMENTS RECEIVED: ${options.segments?.length || 0}`);
+    this.logger.log('=== AIAnalysisService.analyzeTranscript CALLED (Two-Pass) ===');
+    this.logger.log(`Provider: ${options.provider}, Model: ${options.model}`);
     if (options.segments && options.segments.length > 0) {
-      console.log(`[analyzeTranscript] First segment: start=${options.segments[0].start}, end=${options.segments[0].end}, text="${options.segments[0].text?.substring(0, 50)}"`);
-      console.log(`[analyzeTranscript] Last segment: start=${options.segments[options.segments.length - 1].start}, end=${options.segments[options.segments.length - 1].end}`);
+      this.logger.debug(`[analyzeTranscript] Segments received: ${options.segments.length}`);
     } else {
-      console.log(`[analyzeTranscript] WARNING: No segments or empty segments array!`);
+      this.logger.warn(`[analyzeTranscript] No segments or empty segments array!`);
     }
-    this.logger.log('=== AIAnalysisService.analyzeTranscript CALLED (Two-Pass) ===');
-    this.logger.log(`Provider: ${options.provider}, Model: ${options.model}`);
 
     let {
       provider,
@@ -590,18 +1020,20 @@ export class AIAnalysisService {
       ollamaEndpoint,
       onProgress,
     } = options;
+    const bypassCache = !!options.bypassCache;
 
     // Safety: Strip provider prefix from model if present (e.g., "local:cogito-8b" -> "cogito-8b")
     const validProviders = ['local', 'ollama', 'claude', 'openai'];
-    if (model && model.includes(':')) {
-      const parts = model.split(':');
-      if (validProviders.includes(parts[0])) {
-        const extractedProvider = parts[0] as 'local' | 'ollama' | 'claude' | 'openai';
+    const colonIndex = model ? model.indexOf(':') : -1;
+    if (colonIndex > 0) {
+      const possibleProvider = model.substring(0, colonIndex);
+      if (validProviders.includes(possibleProvider)) {
+        const extractedProvider = possibleProvider as 'local' | 'ollama' | 'claude' | 'openai';
         if (provider !== extractedProvider) {
           this.logger.log(`[analyzeTranscript] Correcting provider: ${provider} -> ${extractedProvider}`);
           provider = extractedProvider;
         }
-        model = parts.slice(1).join(':');
+        model = model.substring(colonIndex + 1);
         this.logger.log(`[analyzeTranscript] Stripped model prefix: ${model}`);
       }
     }
@@ -641,13 +1073,11 @@ export class AIAnalysisService {
     };
 
     const trackTokens = (response: { inputTokens?: number; outputTokens?: number; estimatedCost?: number }) => {
-      console.log(`[trackTokens] Received: inputTokens=${response.inputTokens}, outputTokens=${response.outputTokens}, cost=${response.estimatedCost}`);
       if (response.inputTokens) tokenStats.inputTokens += response.inputTokens;
       if (response.outputTokens) tokenStats.outputTokens += response.outputTokens;
       tokenStats.totalTokens = tokenStats.inputTokens + tokenStats.outputTokens;
       if (response.estimatedCost) tokenStats.estimatedCost += response.estimatedCost;
       tokenStats.apiCalls++;
-      console.log(`[trackTokens] Running total: apiCalls=${tokenStats.apiCalls}, totalTokens=${tokenStats.totalTokens}`);
     };
 
     try {
@@ -655,6 +1085,8 @@ export class AIAnalysisService {
 
       // Check model availability (only for Ollama)
       if (provider === 'ollama') {
+        // Callers that preload the model resolve it first; a resolved tag maps to itself
+        model = await this.ollamaService.resolvePreferredModel(model, ollamaEndpoint);
         const available = await this.ollamaService.isModelAvailable(
           model,
           ollamaEndpoint,
@@ -666,17 +1098,6 @@ export class AIAnalysisService {
         }
       }
 
-      // Write header to file
-      fs.writeFileSync(
-        outputFile,
-        '='.repeat(80) +
-          '\n' +
-          'VIDEO ANALYSIS RESULTS\n' +
-          '='.repeat(80) +
-          '\n\n',
-        'utf-8',
-      );
-
       const aiConfig: AIProviderConfig = {
         provider,
         model,
@@ -691,13 +1112,18 @@ export class AIAnalysisService {
         `maxChunkChars=${modelLimits.maxChunkChars}, maxChapterChars=${modelLimits.maxChapterChars}`,
       );
 
+      // Normalize every segment once; both passes match phrases against it
+      const transcriptIndex = buildSegmentIndex(segments || []);
+
       // =========================================================================
       // PASS 1: Detect chapter boundaries
       // =========================================================================
       sendProgress('analysis', 5, 'Detecting chapter boundaries...');
       const boundaries = await this.detectChapterBoundaries(
         aiConfig,
+        bypassCache,
         segments,
+        transcriptIndex,
         videoTitle,
         modelLimits,
         trackTokens,
@@ -705,8 +1131,8 @@ export class AIAnalysisService {
       sendProgress('analysis', 25, `Found ${boundaries.length} chapters`);
 
       // Calculate total API calls for accurate progress reporting
-      // Pass 2 = 1 call per chapter, plus 3 more for description, tags, title
-      totalApiCalls = boundaries.length + 3;
+      // Pass 2 = 1 call per chapter, plus 1 more for description, tags and title
+      totalApiCalls = boundaries.length + 1;
       completedApiCalls = 0;
       pass2StartTime = Date.now();  // Start timing from Pass 2 for accurate ETA
 
@@ -722,7 +1148,9 @@ export class AIAnalysisService {
       sendProgress('analysis', 26, `Analyzing ${boundaries.length} chapters (0/${totalApiCalls} API calls)...`);
       const { chapters, flags } = await this.analyzeChaptersPass2(
         aiConfig,
+        bypassCache,
         segments,
+        transcriptIndex,
         boundaries,
         videoTitle,
         categories || [],
@@ -738,42 +1166,70 @@ export class AIAnalysisService {
       );
       sendProgress('analysis', calculateProgress(), `Analyzed ${chapters.length} chapters, found ${flags.length} flags`);
 
-      // Write chapter flags to file
-      for (const flag of flags) {
-        this.writeSectionToFile(outputFile, flag);
-      }
-
       // =========================================================================
       // Generate metadata FROM chapters
       // =========================================================================
       completedApiCalls++;
-      sendProgress('analysis', calculateProgress(), `Generating description (${completedApiCalls}/${totalApiCalls} API calls)...`);
-      const description = await this.generateDescriptionFromChapters(
+      sendProgress('analysis', calculateProgress(), `Generating description, tags and title (${completedApiCalls}/${totalApiCalls} API calls)...`);
+      const metadata = await this.generateMetadataFromChapters(
         aiConfig,
         chapters,
         videoTitle,
         trackTokens,
       );
 
-      completedApiCalls++;
-      sendProgress('analysis', calculateProgress(), `Extracting tags (${completedApiCalls}/${totalApiCalls} API calls)...`);
-      const tags = await this.generateTagsFromChapters(
-        aiConfig,
-        chapters,
-        trackTokens,
-      );
+      let description: string;
+      let tags: Tags;
+      let suggestedTitle: string | null;
 
-      completedApiCalls++;
-      sendProgress('analysis', calculateProgress(), `Generating title (${completedApiCalls}/${totalApiCalls} API calls)...`);
-      const suggestedTitle = await this.generateTitleFromChapters(
-        aiConfig,
-        chapters,
-        videoTitle,
-        trackTokens,
-      );
+      if (metadata) {
+        ({ description, tags, suggestedTitle } = metadata);
+      } else {
+        // Combined response unusable - fall back to one request per field
+        totalApiCalls += 3;
+
+        if (getRequestParallelism(aiConfig.provider) > 1) {
+          // The three prompts are independent, so let the server run them side by side
+          sendProgress('analysis', calculateProgress(), `Generating description, tags and title separately (${completedApiCalls}/${totalApiCalls} API calls)...`);
+          [description, tags, suggestedTitle] = await Promise.all([
+            this.generateDescriptionFromChapters(aiConfig, chapters, videoTitle, trackTokens),
+            this.generateTagsFromChapters(aiConfig, chapters, trackTokens),
+            this.generateTitleFromChapters(aiConfig, chapters, videoTitle, trackTokens),
+          ]);
+          completedApiCalls += 3;
+        } else {
+          completedApiCalls++;
+          sendProgress('analysis', calculateProgress(), `Generating description (${completedApiCalls}/${totalApiCalls} API calls)...`);
+          description = await this.generateDescriptionFromChapters(
+            aiConfig,
+            chapters,
+            videoTitle,
+            trackTokens,
+          );
 
-      // Prepend summary to file
-      this.prependSummaryToFile(outputFile, description);
+          completedApiCalls++;
+          sendProgress('analysis', calculateProgress(), `Extracting tags (${completedApiCalls}/${totalApiCalls} API calls)...`);
+          tags = await this.generateTagsFromChapters(
+            aiConfig,
+            chapters,
+            trackTokens,
+          );
+
+          completedApiCalls++;
+          sendProgress('analysis', calculateProgress(), `Generating title (${completedApiCalls}/${totalApiCalls} API calls)...`);
+          suggestedTitle = await this.generateTitleFromChapters(
+            aiConfig,
+            chapters,
+            videoTitle,
+            trackTokens,
+          );
+        }
+      }
+
+      // Write the finished report once and hand the text back with the result,
+      // so callers don't have to read the file again
+      const report = this.buildReport(description, flags);
+      fs.writeFileSync(outputFile, report, 'utf-8');
 
       // Log token usage summary
       console.log('');
@@ -798,11 +1254,7 @@ export class AIAnalysisService {
 
       sendProgress('analysis', 100, 'Analysis complete!');
 
-      // Debug: Log what we're returning
-      console.log(`[analyzeTranscript] RETURNING: sections=${flags.length}, chapters=${chapters.length}, tags=${JSON.stringify(tags)}`);
-      if (chapters.length > 0) {
-        console.log(`[analyzeTranscript] Chapters being returned: ${JSON.stringify(chapters)}`);
-      }
+      this.logger.debug(`[analyzeTranscript] Returning ${flags.length} sections, ${chapters.length} chapters`);
 
       return {
         sections_count: flags.length,
@@ -812,6 +1264,7 @@ export class AIAnalysisService {
         description,
         suggested_title: suggestedTitle || undefined,
         tokenStats: tokenStats.apiCalls > 0 ? tokenStats : undefined,
+        report,
       };
     } catch (error) {
       const message = `AI analysis failed: ${(error as Error).message}`;
@@ -822,50 +1275,72 @@ export class AIAnalysisService {
 
   /**
    * Split transcript into time-based chunks
+   * `starts` holds each segment's start time (SegmentIndex.starts)
+   * A chunk also ends early once its text would pass maxChars, the most a
+   * boundary prompt can use
    */
   private chunkTranscript(
     segments: Segment[],
+    starts: Float64Array,
     chunkMinutes: number = 15,
+    maxChars: number = Infinity,
   ): Chunk[] {
-    console.log(`[chunkTranscript] Input segments: ${segments?.length || 0}, chunkMinutes: ${chunkMinutes}`);
     const chunks: Chunk[] = [];
 
     if (!segments || segments.length === 0) {
-      console.log(`[chunkTranscript] WARNING: No segments to chunk!`);
+      this.logger.warn(`[chunkTranscript] No segments to chunk`);
       return [];
     }
 
     const chunkDuration = chunkMinutes * 60;
     const totalDuration = segments[segments.length - 1].end;
-    console.log(`[chunkTranscript] Total duration: ${totalDuration}s, chunk duration: ${chunkDuration}s`);
 
     let currentStart = 0;
     let chunkNum = 1;
+    let segmentIndex = lowerBoundByStart(starts, currentStart);
 
     while (currentStart < totalDuration) {
       const chunkEnd = currentStart + chunkDuration;
 
-      const chunkSegments = segments.filter(
-        (seg) => seg.start >= currentStart && seg.start < chunkEnd,
-      );
+      // Segments are time-ordered, so each chunk is the contiguous slice up to chunkEnd
+      const startIndex = segmentIndex;
+      let endIndex = lowerBoundByStart(starts, chunkEnd, startIndex);
+
+      // Fast speech can fill the prompt budget before the window ends. Close the chunk
+      // at the last segment that fits and start the next one there, so no transcript
+      // is clipped off (untrimmed lengths, so the trimmed text always fits)
+      let chars = 0;
+      for (let i = startIndex; i < endIndex; i++) {
+        chars += segments[i].text.length + (i > startIndex ? 1 : 0);
+        if (chars > maxChars && i > startIndex) {
+          endIndex = i;
+          break;
+        }
+      }
+      const nextStart = endIndex < segments.length && starts[endIndex] < chunkEnd
+        ? starts[endIndex]
+        : chunkEnd;
+
+      const chunkSegments = segments.slice(startIndex, endIndex);
+      segmentIndex = endIndex;
 
       if (chunkSegments.length > 0) {
-        const chunkText = chunkSegments.map((seg) => seg.text.trim()).join(' ');
+        const { text: chunkText } = joinSegmentText(chunkSegments, maxChars, true);
         chunks.push({
           number: chunkNum,
           startTime: currentStart,
-          endTime: Math.min(chunkEnd, totalDuration),
+          endTime: Math.min(nextStart, totalDuration),
           text: chunkText,
           segments: chunkSegments,
+          segmentStart: startIndex,
         });
-        console.log(`[chunkTranscript] Chunk ${chunkNum}: ${chunkSegments.length} segments, time ${currentStart}-${Math.min(chunkEnd, totalDuration)}`);
         chunkNum++;
       }
 
-      currentStart = chunkEnd;
+      currentStart = nextStart;
     }
 
-    console.log(`[chunkTranscript] Created ${chunks.length} chunks total`);
+    this.logger.debug(`[chunkTranscript] Created ${chunks.length} chunks from ${segments.length} segments (${chunkDuration}s each, ${totalDuration}s total)`);
     return chunks;
   }
 
@@ -875,15 +1350,22 @@ export class AIAnalysisService {
    * - Whisper transcription errors
    * - AI quote corrections/paraphrasing
    * - Cross-segment quotes
+   *
+   * Callers looking up several phrases in the same segments should pass
+   * transcriptIndex (from buildSegmentIndex) so it is computed only once
    */
   private findPhraseTimestamp(
     phrase: string,
     segments: Segment[],
+    transcriptIndex: SegmentIndex = buildSegmentIndex(segments),
   ): number | null {
     if (!phrase || !segments || segments.length === 0) {
       return null;
     }
 
+    const normalizedTexts = transcriptIndex.texts;
+    const textOffset = transcriptIndex.offset;
+
     const normalizedPhrase = normalizeForComparison(phrase);
     if (normalizedPhrase.length < 3) {
       return null;
@@ -893,21 +1375,17 @@ export class AIAnalysisService {
     const searchPhrase = normalizedPhrase.substring(0, 50);
 
     // Strategy 1: Direct substring match using first part of phrase
-    for (const segment of segments) {
-      const normalizedText = normalizeForComparison(segment.text);
-      if (normalizedText.includes(searchPhrase)) {
-        return segment.start;
-      }
+    // Most quotes are copied verbatim, so this usually resolves without any fuzzy work
+    const directMatch = findSegmentContaining(transcriptIndex, searchPhrase);
+    if (directMatch !== -1) {
+      return segments[directMatch].start;
     }
 
     // Strategy 2: Shorter prefix match (first 25 chars)
     if (searchPhrase.length > 25) {
-      const shortSearchPhrase = normalizedPhrase.substring(0, 25);
-      for (const segment of segments) {
-        const normalizedText = normalizeForComparison(segment.text);
-        if (normalizedText.includes(shortSearchPhrase)) {
-          return segment.start;
-        }
+      const prefixMatch = findSegmentContaining(transcriptIndex, normalizedPhrase.substring(0, 25));
+      if (prefixMatch !== -1) {
+        return segments[prefixMatch].start;
       }
     }
 
@@ -916,8 +1394,9 @@ export class AIAnalysisService {
     let bestFuzzyMatch: { segment: Segment; score: number } | null = null;
     const FUZZY_THRESHOLD = 0.65; // 65% similarity required
 
-    for (const segment of segments) {
-      const normalizedText = normalizeForComparison(segment.text);
+    for (let i = 0; i < segments.length; i++) {
+      const segment = segments[i];
+      const normalizedText = normalizedTexts[textOffset + i];
 
       // For longer segments, use a sliding window to find best match
       if (normalizedText.length >= searchPhrase.length) {
@@ -925,6 +1404,7 @@ export class AIAnalysisService {
         const similarity = stringSimilarity(
           searchPhrase,
           normalizedText.substring(0, searchPhrase.length + 10), // Allow some overflow
+          Math.max(FUZZY_THRESHOLD, bestFuzzyMatch?.score ?? 0),
         );
 
         if (similarity > FUZZY_THRESHOLD && (!bestFuzzyMatch || similarity > bestFuzzyMatch.score)) {
@@ -936,6 +1416,7 @@ export class AIAnalysisService {
       const fullSimilarity = stringSimilarity(
         normalizedPhrase.substring(0, Math.min(normalizedPhrase.length, normalizedText.length)),
         normalizedText.substring(0, Math.min(normalizedPhrase.length, normalizedText.length)),
+        Math.max(FUZZY_THRESHOLD, bestFuzzyMatch?.score ?? 0),
       );
 
       if (fullSimilarity > FUZZY_THRESHOLD && (!bestFuzzyMatch || fullSimilarity > bestFuzzyMatch.score)) {
@@ -952,46 +1433,56 @@ export class AIAnalysisService {
 
     // Strategy 4: Distinctive word matching
     // Find uncommon words in the quote and search for segments containing them
-    const commonWords = new Set([
-      'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-      'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-      'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-      'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
-      'into', 'through', 'during', 'before', 'after', 'above', 'below',
-      'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
-      'not', 'only', 'own', 'same', 'than', 'too', 'very', 'just',
-      'that', 'this', 'these', 'those', 'what', 'which', 'who', 'whom',
-      'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-      'my', 'your', 'his', 'its', 'our', 'their', 'mine', 'yours', 'hers', 'ours', 'theirs',
-      'about', 'also', 'back', 'because', 'come', 'could', 'day', 'even',
-      'first', 'get', 'give', 'go', 'good', 'know', 'like', 'look', 'make',
-      'new', 'now', 'one', 'people', 'say', 'see', 'some', 'take', 'think',
-      'time', 'two', 'use', 'want', 'way', 'well', 'work', 'year',
-    ]);
-
-    const phraseWords = normalizedPhrase.split(/\s+/).filter((w) => w.length > 3 && !commonWords.has(w));
+    const phraseWords = normalizedPhrase.split(/\s+/).filter((w) => w.length > 3 && !COMMON_WORDS.has(w));
 
     if (phraseWords.length > 0) {
       let bestWordMatch: { segment: Segment; matchCount: number; fuzzyScore: number } | null = null;
 
-      for (const segment of segments) {
-        const segmentText = normalizeForComparison(segment.text);
-        const segmentWords = segmentText.split(/\s+/);
+      // A transcript repeats the same words thousands of times, so classify each distinct
+      // word once per phrase word instead of re-running the comparisons per occurrence
+      const wordMatches = phraseWords.map(() => new Map<string, WordMatch>());
+      const classifyWord = (p: number, segmentWord: string): WordMatch => {
+        const cache = wordMatches[p];
+        let match = cache.get(segmentWord);
+        if (match === undefined) {
+          const phraseWord = phraseWords[p];
+          if (segmentWord === phraseWord || segmentWord.includes(phraseWord) || phraseWord.includes(segmentWord)) {
+            match = WordMatch.Exact;
+          } else if (segmentWord.length > 3 && stringSimilarity(phraseWord, segmentWord, 0.75) > 0.75) {
+            // Fuzzy word match (for typos like "Somalies" vs "Somalis")
+            match = WordMatch.Fuzzy;
+          } else {
+            match = WordMatch.None;
+          }
+          cache.set(segmentWord, match);
+        }
+        return match;
+      };
+
+      for (let i = 0; i < segments.length; i++) {
+        const segment = segments[i];
+        const segmentWords = getSegmentWords(transcriptIndex, i);
         let matchCount = 0;
         let fuzzyMatchCount = 0;
 
-        for (const phraseWord of phraseWords) {
-          // Exact word match
-          if (segmentWords.some((sw) => sw === phraseWord || sw.includes(phraseWord) || phraseWord.includes(sw))) {
-            matchCount++;
-          } else {
-            // Fuzzy word match (for typos like "Somalies" vs "Somalis")
-            for (const segmentWord of segmentWords) {
-              if (segmentWord.length > 3 && stringSimilarity(phraseWord, segmentWord) > 0.75) {
-                fuzzyMatchCount++;
-                break;
-              }
+        for (let p = 0; p < phraseWords.length; p++) {
+          // An exact match on any word beats a fuzzy match on another
+          let best = WordMatch.None;
+          for (const segmentWord of segmentWords) {
+            const match = classifyWord(p, segmentWord);
+            if (match === WordMatch.Exact) {
+              best = match;
+              break;
             }
+            if (match === WordMatch.Fuzzy) {
+              best = match;
+            }
+          }
+
+          if (best === WordMatch.Exact) {
+            matchCount++;
+          } else if (best === WordMatch.Fuzzy) {
+            fuzzyMatchCount++;
           }
         }
 
@@ -1013,7 +1504,9 @@ export class AIAnalysisService {
 
     // Strategy 5: Check across segment boundaries with fuzzy matching
     for (let i = 0; i < segments.length - 1; i++) {
-      const combinedText = normalizeForComparison(segments[i].text + ' ' + segments[i + 1].text);
+      const text = normalizedTexts[textOffset + i];
+      const nextText = normalizedTexts[textOffset + i + 1];
+      const combinedText = text && nextText ? `${text} ${nextText}` : text || nextText;
 
       // Try exact match first
       if (combinedText.includes(searchPhrase)) {
@@ -1024,6 +1517,7 @@ export class AIAnalysisService {
       const similarity = stringSimilarity(
         searchPhrase,
         combinedText.substring(0, searchPhrase.length + 15),
+        FUZZY_THRESHOLD,
       );
 
       if (similarity > FUZZY_THRESHOLD) {
@@ -1048,13 +1542,14 @@ export class AIAnalysisService {
    */
   private async detectChapterBoundaries(
     config: AIProviderConfig,
+    bypassCache: boolean,
     segments: Segment[],
+    transcriptIndex: SegmentIndex,
     videoTitle: string,
     limits: ModelLimits,
     onTokens?: (response: { inputTokens?: number; outputTokens?: number; estimatedCost?: number }) => void,
   ): Promise<number[]> {
     const boundaries: number[] = [0]; // First chapter always starts at 0
-    let previousTopic = '';
 
     if (!segments || segments.length === 0) {
       this.logger.warn('No segments available for boundary detection');
@@ -1065,45 +1560,53 @@ export class AIAnalysisService {
     const lastSegment = segments[segments.length - 1];
     const videoDurationSeconds = lastSegment?.end || lastSegment?.start || 0;
 
-    const chunks = this.chunkTranscript(segments, limits.chunkMinutes);
+    const chunks = this.chunkTranscript(segments, transcriptIndex.starts, limits.chunkMinutes, limits.maxChunkChars);
     this.logger.log(`[Pass 1] Detecting boundaries in ${chunks.length} chunks (${limits.chunkMinutes} min each), video duration: ${Math.round(videoDurationSeconds)}s`);
 
-    for (let i = 0; i < chunks.length; i++) {
-      const chunk = chunks[i];
-      const isFirst = i === 0;
+    const parallelism = getRequestParallelism(config.provider);
+    let chunkTimes: number[][];
 
-      try {
-        const prompt = buildBoundaryDetectionPrompt(
+    if (parallelism > 1) {
+      // Concurrent mode: chunks are sent without the previous chunk's end topic
+      // so they no longer depend on each other
+      this.logger.log(`[Pass 1] Running up to ${parallelism} chunk requests concurrently`);
+      chunkTimes = await mapWithConcurrency(chunks, parallelism, async (chunk, i) => {
+        const result = await this.detectChunkBoundaries(
+          config, bypassCache, chunk, i, videoTitle, '', limits, videoDurationSeconds, onTokens,
+        );
+        // Phrase matching runs while the other requests are still in flight
+        return this.mapBoundaryPhrases(chunk, result, transcriptIndex);
+      });
+    } else {
+      // Sequential mode: each chunk is sent with the previous chunk's end topic
+      chunkTimes = [];
+      let previousTopic = '';
+
+      for (let i = 0; i < chunks.length; i++) {
+        const result = await this.detectChunkBoundaries(
+          config,
+          bypassCache,
+          chunks[i],
+          i,
           videoTitle,
-          chunk.text.substring(0, limits.maxChunkChars),
           previousTopic,
-          isFirst,
+          limits,
           videoDurationSeconds,
+          onTokens,
         );
-
-        const response = await this.aiProviderService.generateText(prompt, config);
-        onTokens?.(response);
-
-        if (!response || !response.text) {
-          this.logger.warn(`[Pass 1] No response for chunk ${i + 1}`);
-          continue;
+        if (result) {
+          previousTopic = result.end_topic;
         }
 
-        const result = this.parseBoundaryResponse(response.text);
+        chunkTimes.push(this.mapBoundaryPhrases(chunks[i], result, transcriptIndex));
+      }
+    }
 
-        // Map phrases to timestamps
-        for (const phrase of result.boundaries) {
-          const time = this.findPhraseTimestamp(phrase, chunk.segments);
-          if (time !== null && !boundaries.includes(time)) {
-            boundaries.push(time);
-            this.logger.debug(`[Pass 1] Found boundary at ${this.formatDisplayTime(time)}: "${phrase.substring(0, 30)}..."`);
-          }
+    for (const times of chunkTimes) {
+      for (const time of times) {
+        if (!boundaries.includes(time)) {
+          boundaries.push(time);
         }
-
-        previousTopic = result.end_topic;
-        this.logger.debug(`[Pass 1] Chunk ${i + 1} end topic: "${previousTopic}"`);
-      } catch (error) {
-        this.logger.warn(`[Pass 1] Error processing chunk ${i + 1}: ${(error as Error).message}`);
       }
     }
 
@@ -1114,12 +1617,109 @@ export class AIAnalysisService {
     return boundaries;
   }
 
+  /**
+   * Map a chunk's boundary phrases to transcript timestamps
+   */
+  private mapBoundaryPhrases(
+    chunk: Chunk,
+    result: BoundaryDetectionResult | null,
+    transcriptIndex: SegmentIndex,
+  ): number[] {
+    if (!result || result.boundaries.length === 0) return [];
+
+    const times: number[] = [];
+    const chunkIndex = sliceSegmentIndex(
+      transcriptIndex,
+      chunk.segmentStart,
+      chunk.segmentStart + chunk.segments.length,
+    );
+    for (const phrase of result.boundaries) {
+      const time = this.findPhraseTimestamp(phrase, chunk.segments, chunkIndex);
+      if (time !== null) {
+        times.push(time);
+        if (Logger.isLevelEnabled('debug')) {
+          this.logger.debug(`[Pass 1] Found boundary at ${this.formatDisplayTime(time)}: "${phrase.substring(0, 30)}..."`);
+        }
+      }
+    }
+    return times;
+  }
+
+  /**
+   * Run boundary detection for a single chunk
+   * Returns null if the request failed or produced no response
+   */
+  private async detectChunkBoundaries(
+    config: AIProviderConfig,
+    bypassCache: boolean,
+    chunk: Chunk,
+    index: number,
+    videoTitle: string,
+    previousTopic: string,
+    limits: ModelLimits,
+    videoDurationSeconds: number,
+    onTokens?: (response: { inputTokens?: number; outputTokens?: number; estimatedCost?: number }) => void,
+  ): Promise<BoundaryDetectionResult | null> {
+    // Silence, music or a few stray words: nothing for the model to find, so
+    // skip the call and carry the previous topic forward
+    const spokenWords = countSpokenWords(chunk.text);
+    if (spokenWords < MIN_CHUNK_SPOKEN_WORDS) {
+      this.logger.log(`[Pass 1] Skipping chunk ${index + 1}: only ${spokenWords} spoken words`);
+      return { boundaries: [], end_topic: previousTopic };
+    }
+
+    try {
+      const prompt = buildBoundaryDetectionPrompt(
+        videoTitle,
+        chunk.text,  // Already sized to maxChunkChars by chunkTranscript
+        previousTopic,
+        index === 0,
+        videoDurationSeconds,
+      );
+
+      // Keep the parse done for the cache check so the reply is only parsed once
+      let parsed: { text: string; json: Record<string, unknown> | null } | undefined;
+      const response = await this.aiProviderService.generateText(prompt, config, {
+        maxTokens: BOUNDARY_MAX_TOKENS,
+        stopWhenJsonComplete: true,
+        json: true,
+        bypassCache,
+        cacheIf: (text) => {
+          parsed = { text, json: safeJsonParse<Record<string, unknown>>(text, this.logger) };
+          // A reply cut off at BOUNDARY_MAX_TOKENS is only usable once repaired
+          return parsed.json !== null && isJsonReplyComplete(text);
+        },
+      });
+      onTokens?.(response);
+
+      if (!response || !response.text) {
+        this.logger.warn(`[Pass 1] No response for chunk ${index + 1}`);
+        return null;
+      }
+
+      const result = this.parseBoundaryResponse(
+        response.text,
+        parsed?.text === response.text ? parsed.json : undefined,
+      );
+      this.logger.debug(`[Pass 1] Chunk ${index + 1} end topic: "${result.end_topic}"`);
+      return result;
+    } catch (error) {
+      this.logger.warn(`[Pass 1] Error processing chunk ${index + 1}: ${(error as Error).message}`);
+      return null;
+    }
+  }
+
   /**
    * Parse boundary detection response with robust JSON handling
    */
-  private parseBoundaryResponse(response: string): BoundaryDetectionResult {
+  private parseBoundaryResponse(
+    response: string,
+    preParsed?: Record<string, unknown> | null,
+  ): BoundaryDetectionResult {
     // Use safe JSON parsing with multiple fallback strategies
-    const parsed = safeJsonParse<Record<string, unknown>>(response, this.logger);
+    const parsed = preParsed !== undefined
+      ? preParsed
+      : safeJsonParse<Record<string, unknown>>(response, this.logger);
 
     if (!parsed) {
       this.logger.warn('[Pass 1] Failed to parse boundary response - all strategies failed');
@@ -1187,6 +1787,7 @@ export class AIAnalysisService {
    */
   private async analyzeChapterWithRetry(
     config: AIProviderConfig,
+    bypassCache: boolean,
     chapterText: string,
     videoTitle: string,
     categories: AnalysisCategory[],
@@ -1198,6 +1799,9 @@ export class AIAnalysisService {
   ): Promise<ChapterAnalysisResult> {
     const maxRetries = JSON_PARSE_RETRIES;
 
+    // A result is usable if it's not just the parser's defaults
+    const isUsable = (result: ChapterAnalysisResult) => result.title !== 'Unknown' || result.summary !== '';
+
     for (let attempt = 0; attempt <= maxRetries; attempt++) {
       try {
         const prompt = buildChapterAnalysisPrompt(
@@ -1210,7 +1814,18 @@ export class AIAnalysisService {
           analysisGranularity,
         );
 
-        const response = await this.aiProviderService.generateText(prompt, config);
+        // Keep the parse done for the cache check so the reply is only parsed once
+        let parsed: { text: string; result: ChapterAnalysisResult } | undefined;
+        const response = await this.aiProviderService.generateText(prompt, config, {
+          stopWhenJsonComplete: true,
+          json: true,
+          bypassCache,
+          // Only usable results are cached, so a cache hit never triggers a retry
+          cacheIf: (text) => {
+            parsed = { text, result: this.parseChapterAnalysisResponse(text) };
+            return isUsable(parsed.result) && isJsonReplyComplete(text);
+          },
+        });
         onTokens?.(response);
 
         if (!response || !response.text) {
@@ -1222,10 +1837,12 @@ export class AIAnalysisService {
           break;
         }
 
-        const result = this.parseChapterAnalysisResponse(response.text);
+        const result = parsed?.text === response.text
+          ? parsed.result
+          : this.parseChapterAnalysisResponse(response.text);
 
         // Check if we got a valid result (not just defaults)
-        if (result.title !== 'Unknown' || result.summary !== '') {
+        if (isUsable(result)) {
           return result;
         }
 
@@ -1266,7 +1883,9 @@ export class AIAnalysisService {
    */
   private async analyzeChaptersPass2(
     config: AIProviderConfig,
+    bypassCache: boolean,
     segments: Segment[],
+    transcriptIndex: SegmentIndex,
     boundaries: number[],
     videoTitle: string,
     categories: AnalysisCategory[],
@@ -1294,115 +1913,127 @@ export class AIAnalysisService {
       );
     }
 
-    let previousChapterSummary = '';
-
     this.logger.log(`[Pass 2] Analyzing ${adjustedBoundaries.length} chapters (max ${limits.maxChapterChars} chars each)`);
 
+    // Extract each chapter's transcript up front so the AI calls can be scheduled independently
+    const chapterInputs: ChapterInput[] = [];
+
+    // Boundaries are sorted, so each chapter's segments are found by binary
+    // search starting from where the previous chapter ended
+    let segmentIndex = 0;
+
     for (let i = 0; i < adjustedBoundaries.length; i++) {
       const startTime = adjustedBoundaries[i];
       const endTime = i < adjustedBoundaries.length - 1 ? adjustedBoundaries[i + 1] : videoDuration;
 
       // Extract chapter transcript
-      const chapterSegments = segments.filter(
-        (s) => s.start >= startTime && s.start < endTime,
-      );
+      const startIndex = lowerBoundByStart(transcriptIndex.starts, startTime, segmentIndex);
+      const endIndex = lowerBoundByStart(transcriptIndex.starts, endTime, startIndex);
+      const chapterSegments = segments.slice(startIndex, endIndex);
+      segmentIndex = startIndex;
 
       if (chapterSegments.length === 0) {
         this.logger.debug(`[Pass 2] No segments for chapter ${i + 1}, skipping`);
         continue;
       }
 
-      const chapterText = chapterSegments.map((s) => s.text).join(' ');
+      // Only the first maxChapterChars are sent, so don't build the rest
+      const { text: chapterText, fullLength } = joinSegmentText(chapterSegments, limits.maxChapterChars);
       const chapterDuration = endTime - startTime;
 
       // Log if we're still truncating (shouldn't happen often after splitting)
-      if (chapterText.length > limits.maxChapterChars) {
+      if (fullLength > limits.maxChapterChars) {
         this.logger.warn(
           `[Pass 2] Chapter ${i + 1} (${Math.round(chapterDuration)}s) still exceeds limit: ` +
-          `${chapterText.length} chars -> truncating to ${limits.maxChapterChars}`,
+          `${fullLength} chars -> truncating to ${limits.maxChapterChars}`,
         );
       }
 
-      // Truncate if needed
-      const truncatedText = chapterText.substring(0, limits.maxChapterChars);
+      chapterInputs.push({
+        number: i + 1,
+        startTime,
+        endTime,
+        segments: chapterSegments,
+        segmentStart: startIndex,
+        text: chapterText,
+      });
+    }
 
-      // Use retry-enabled analysis
-      const result = await this.analyzeChapterWithRetry(
-        config,
-        truncatedText,
-        videoTitle,
-        categories,
-        i + 1,
-        previousChapterSummary,
-        customInstructions,
-        analysisGranularity,
-        onTokens,
-      );
+    // Report progress after each chapter
+    let completedChapters = 0;
+    const reportChapterDone = () => {
+      completedChapters++;
+      if (onChapterProgress) {
+        onChapterProgress(completedChapters, chapterInputs.length);
+      }
+    };
+
+    const parallelism = getRequestParallelism(config.provider);
+    let results: Array<{ result: ChapterAnalysisResult; flags: AnalyzedSection[] }>;
+
+    if (parallelism > 1) {
+      // Concurrent mode: chapters are analyzed without the previous chapter's summary
+      this.logger.log(`[Pass 2] Running up to ${parallelism} chapter requests concurrently`);
+      results = await mapWithConcurrency(chapterInputs, parallelism, async (input) => {
+        const result = await this.analyzeChapterWithRetry(
+          config,
+          bypassCache,
+          input.text,
+          videoTitle,
+          categories,
+          input.number,
+          '',
+          customInstructions,
+          analysisGranularity,
+          onTokens,
+        );
+        reportChapterDone();
+        // Quote matching runs while the other requests are still in flight
+        return { result, flags: this.buildChapterFlags(input, result, transcriptIndex) };
+      });
+    } else {
+      // Sequential mode: each chapter is sent with the previous chapter's summary
+      results = [];
+      let previousChapterSummary = '';
+
+      for (const input of chapterInputs) {
+        const result = await this.analyzeChapterWithRetry(
+          config,
+          bypassCache,
+          input.text,
+          videoTitle,
+          categories,
+          input.number,
+          previousChapterSummary,
+          customInstructions,
+          analysisGranularity,
+          onTokens,
+        );
+        reportChapterDone();
+
+        // Pass this summary as the next chapter's context
+        previousChapterSummary = result.summary;
+
+        results.push({ result, flags: this.buildChapterFlags(input, result, transcriptIndex) });
+      }
+    }
+
+    for (let k = 0; k < chapterInputs.length; k++) {
+      const { number: chapterNumber, startTime, endTime } = chapterInputs[k];
+      const { result, flags } = results[k];
 
       // Create chapter entry
       chapters.push({
-        sequence: i + 1,
+        sequence: chapterNumber,
         start_time: this.formatDisplayTime(startTime),
         end_time: this.formatDisplayTime(endTime),
         title: result.title,
         summary: result.summary,
       });
 
-      // Report progress after each chapter
-      if (onChapterProgress) {
-        onChapterProgress(i + 1, adjustedBoundaries.length);
-      }
-
-      // Save summary for next chapter's context
-      previousChapterSummary = result.summary;
-
-      // Convert flags to AnalyzedSection format - pass through without filtering
-      if (result.flags && result.flags.length > 0) {
-        for (const flag of result.flags) {
-          // Try to find the actual timestamp of the quote in the transcript
-          let flagStartTime = startTime;
-          if (flag.quote) {
-            const foundTime = this.findPhraseTimestamp(flag.quote, chapterSegments);
-            if (foundTime !== null) {
-              flagStartTime = foundTime;
-            } else {
-              // Quote not found - log for debugging
-              this.logger.debug(`[Pass 2] Quote not found in transcript: "${flag.quote.substring(0, 80)}..."`);
-            }
-          } else {
-            this.logger.debug(`[Pass 2] Flag has no quote field: ${JSON.stringify(flag)}`);
-          }
-
-          // Build description: prefer quote (verbatim text), fall back to description
-          // If both exist, show quote first with reason after
-          let displayDescription = flag.description || '';
-          if (flag.quote) {
-            if (flag.description) {
-              displayDescription = `"${flag.quote}" — ${flag.description}`;
-            } else {
-              displayDescription = `"${flag.quote}"`;
-            }
-          }
-
-          allFlags.push({
-            category: flag.category,
-            description: displayDescription,
-            start_time: this.formatDisplayTime(flagStartTime),
-            end_time: this.formatDisplayTime(Math.min(flagStartTime + 30, endTime)), // ~30 sec duration
-            quotes: flag.quote
-              ? [
-                  {
-                    timestamp: this.formatDisplayTime(flagStartTime),
-                    text: flag.quote,
-                    significance: flag.description,
-                  },
-                ]
-              : [],
-          });
-        }
-      }
+      allFlags.push(...flags);
 
-      this.logger.debug(`[Pass 2] Chapter ${i + 1}: "${result.title.substring(0, 50)}..." (${result.flags?.length || 0} flags)`);
+      this.logger.debug(`[Pass 2] Chapter ${chapterNumber}: "${result.title.substring(0, 50)}..." (${result.flags?.length || 0} flags)`);
     }
 
     // Deduplicate flags with the same or very close timestamps (within 5 seconds)
@@ -1437,6 +2068,73 @@ export class AIAnalysisService {
     return { chapters, flags: deduplicatedFlags };
   }
 
+  /**
+   * Convert a chapter's flags to AnalyzedSection format - pass through without filtering
+   * Each flag is placed at its quote's timestamp when the quote can be found
+   */
+  private buildChapterFlags(
+    input: ChapterInput,
+    result: ChapterAnalysisResult,
+    transcriptIndex: SegmentIndex,
+  ): AnalyzedSection[] {
+    const { startTime, endTime, segments: chapterSegments, segmentStart } = input;
+    const sections: AnalyzedSection[] = [];
+
+    if (!result.flags || result.flags.length === 0) {
+      return sections;
+    }
+
+    const chapterIndex = sliceSegmentIndex(
+      transcriptIndex,
+      segmentStart,
+      segmentStart + chapterSegments.length,
+    );
+    for (const flag of result.flags) {
+      // Try to find the actual timestamp of the quote in the transcript
+      let flagStartTime = startTime;
+      if (flag.quote) {
+        const foundTime = this.findPhraseTimestamp(flag.quote, chapterSegments, chapterIndex);
+        if (foundTime !== null) {
+          flagStartTime = foundTime;
+        } else {
+          // Quote not found - log for debugging
+          this.logger.debug(`[Pass 2] Quote not found in transcript: "${flag.quote.substring(0, 80)}..."`);
+        }
+      } else if (Logger.isLevelEnabled('debug')) {
+        this.logger.debug(`[Pass 2] Flag has no quote field: ${JSON.stringify(flag)}`);
+      }
+
+      // Build description: prefer quote (verbatim text), fall back to description
+      // If both exist, show quote first with reason after
+      let displayDescription = flag.description || '';
+      if (flag.quote) {
+        if (flag.description) {
+          displayDescription = `"${flag.quote}" — ${flag.description}`;
+        } else {
+          displayDescription = `"${flag.quote}"`;
+        }
+      }
+
+      sections.push({
+        category: flag.category,
+        description: displayDescription,
+        start_time: this.formatDisplayTime(flagStartTime),
+        end_time: this.formatDisplayTime(Math.min(flagStartTime + 30, endTime)), // ~30 sec duration
+        quotes: flag.quote
+          ? [
+              {
+                timestamp: this.formatDisplayTime(flagStartTime),
+                text: flag.quote,
+                significance: flag.description,
+              },
+            ]
+          : [],
+      });
+    }
+
+    return sections;
+  }
+
   /**
    * Parse chapter analysis response with robust JSON handling
    */
@@ -1455,7 +2153,9 @@ export class AIAnalysisService {
 
     if (!validated) {
       this.logger.warn('[Pass 2] Chapter analysis response failed validation');
-      this.logger.debug(`[Pass 2] Parsed data was: ${JSON.stringify(parsed).substring(0, 500)}`);
+      if (Logger.isLevelEnabled('debug')) {
+        this.logger.debug(`[Pass 2] Parsed data was: ${JSON.stringify(parsed).substring(0, 500)}`);
+      }
       // Try to salvage what we can
       return {
         title: typeof parsed.title === 'string' ? parsed.title : 'Unknown',
@@ -1464,14 +2164,64 @@ export class AIAnalysisService {
       };
     }
 
-    // Debug: Log what the AI returned for flags
-    if (validated.flags && validated.flags.length > 0) {
+    // Debug: Log what the AI returned for flags (skip building the JSON when debug is off)
+    if (validated.flags && validated.flags.length > 0 && Logger.isLevelEnabled('debug')) {
       this.logger.debug(`[Pass 2] Raw flags from AI: ${JSON.stringify(validated.flags, null, 2)}`);
     }
 
     return validated;
   }
 
+  /**
+   * Generate description, tags and suggested title in a single request
+   * Returns null if the response isn't usable, so the caller can fall back
+   * to the separate per-field prompts
+   */
+  private async generateMetadataFromChapters(
+    config: AIProviderConfig,
+    chapters: Chapter[],
+    videoTitle: string,
+    onTokens?: (response: { inputTokens?: number; outputTokens?: number; estimatedCost?: number }) => void,
+  ): Promise<{ description: string; tags: Tags; suggestedTitle: string | null } | null> {
+    try {
+      if (!chapters || chapters.length === 0) {
+        return {
+          description: 'No content could be analyzed in this video.',
+          tags: { people: [], topics: [] },
+          suggestedTitle: null,
+        };
+      }
+
+      const chaptersList = chapters
+        .map((ch) => `${ch.sequence}. [${ch.start_time}] ${ch.title}${ch.summary ? ` - ${ch.summary}` : ''}`)
+        .join('\n');
+
+      const prompt = interpolatePrompt(METADATA_FROM_CHAPTERS_PROMPT, {
+        videoTitle: videoTitle || 'Untitled',
+        chaptersList: clipToBudget(chaptersList, 4000),
+      });
+
+      const response = await this.aiProviderService.generateText(prompt, config, { stopWhenJsonComplete: true, json: true });
+      onTokens?.(response);
+
+      const parsed = response?.text ? safeJsonParse<any>(response.text, this.logger) : null;
+      const description = typeof parsed?.description === 'string' ? this.cleanDescription(parsed.description) : null;
+      if (!description) {
+        this.logger.warn('Combined metadata response had no usable description');
+        return null;
+      }
+
+      return {
+        description,
+        tags: this.parseTags(parsed),
+        suggestedTitle: typeof parsed.title === 'string' ? this.cleanSuggestedTitle(parsed.title) : null,
+      };
+    } catch (error) {
+      this.logger.warn(`Combined metadata generation failed: ${(error as Error).message}`);
+      return null;
+    }
+  }
+
   /**
    * Generate video description from chapter summaries
    */
@@ -1493,38 +2243,19 @@ export class AIAnalysisService {
 
       const prompt = interpolatePrompt(DESCRIPTION_FROM_CHAPTERS_PROMPT, {
         videoTitle: videoTitle || 'Untitled',
-        chaptersList: chaptersList.substring(0, 4000),
+        chaptersList: clipToBudget(chaptersList, 4000),
       });
 
       const response = await this.aiProviderService.generateText(prompt, config);
       onTokens?.(response);
 
-      if (response && response.text) {
-        const description = response.text.trim();
-
-        // Reject AI refusals
-        const invalidPatterns = [
-          /^i apologize/i,
-          /^i'm sorry/i,
-          /^i cannot/i,
-          /^unfortunately/i,
-          /^as an ai/i,
-        ];
-
-        for (const pattern of invalidPatterns) {
-          if (pattern.test(description)) {
-            this.logger.warn(`Rejected AI refusal in description: "${description.substring(0, 50)}..."`);
-            break;
-          }
-        }
-
-        if (!invalidPatterns.some((p) => p.test(description))) {
-          return description;
-        }
+      const description = response && response.text ? this.cleanDescription(response.text) : null;
+      if (description) {
+        return description;
       }
 
       // Fallback
-      return `Video with ${chapters.length} chapter(s) covering: ${chapters.slice(0, 3).map((c) => c.title).join('; ')}.`;
+      return this.fallbackDescription(chapters);
     } catch (error) {
       this.logger.warn(`Description generation failed: ${(error as Error).message}`);
       return 'Description could not be generated for this video.';
@@ -1550,34 +2281,30 @@ export class AIAnalysisService {
         .join('\n');
 
       const prompt = interpolatePrompt(TAGS_FROM_CHAPTERS_PROMPT, {
-        chaptersList: chaptersList.substring(0, 4000),
+        chaptersList: clipToBudget(chaptersList, 4000),
       });
 
-      const response = await this.aiProviderService.generateText(prompt, config);
+      const response = await this.aiProviderService.generateText(prompt, config, { stopWhenJsonComplete: true, json: true });
       onTokens?.(response);
 
       if (response && response.text) {
         try {
           let cleanResponse = response.text.trim();
 
-          // Remove markdown code blocks
+          // Remove markdown code fence lines in one native pass
           if (cleanResponse.startsWith('```')) {
-            const lines = cleanResponse.split('\n');
-            cleanResponse = lines.filter((l) => !l.startsWith('```')).join('\n');
+            cleanResponse = cleanResponse.replace(FENCE_LINE_REGEX, '');
           }
 
           // Extract JSON object
-          const jsonMatch = cleanResponse.match(/\{[\s\S]*\}/);
-          if (!jsonMatch) {
+          const jsonStart = cleanResponse.indexOf('{');
+          const jsonEnd = jsonStart === -1 ? -1 : findObjectEnd(cleanResponse, jsonStart);
+          if (jsonEnd === -1) {
             this.logger.warn('No JSON object found in tags response');
             return { people: [], topics: [] };
           }
 
-          const tagsData = JSON.parse(jsonMatch[0]);
-          return {
-            people: Array.isArray(tagsData.people) ? tagsData.people.slice(0, 20) : [],
-            topics: Array.isArray(tagsData.topics) ? tagsData.topics.slice(0, 15) : [],
-          };
+          return this.parseTags(JSON.parse(cleanResponse.substring(jsonStart, jsonEnd + 1)));
         } catch (parseError) {
           this.logger.warn(`Failed to parse tags JSON: ${(parseError as Error).message}`);
         }
@@ -1611,166 +2338,158 @@ export class AIAnalysisService {
 
       const prompt = interpolatePrompt(TITLE_FROM_CHAPTERS_PROMPT, {
         currentTitle: currentTitle || 'untitled',
-        chaptersList: chaptersList.substring(0, 4000),
+        chaptersList: clipToBudget(chaptersList, 4000),
       });
 
       const response = await this.aiProviderService.generateText(prompt, config);
       onTokens?.(response);
 
       if (response && response.text) {
-        let suggestedTitle = response.text.trim();
+        return this.cleanSuggestedTitle(response.text);
+      }
 
-        // Remove quotes
-        if (suggestedTitle.startsWith('"') && suggestedTitle.endsWith('"')) {
-          suggestedTitle = suggestedTitle.slice(1, -1);
-        }
+      return null;
+    } catch (error) {
+      this.logger.warn(`Title generation failed: ${(error as Error).message}`);
+      return null;
+    }
+  }
 
-        // Remove file extension
-        if (suggestedTitle.includes('.')) {
-          suggestedTitle = suggestedTitle.split('.')[0];
-        }
+  /**
+   * Trim a generated description, rejecting AI refusals
+   */
+  private cleanDescription(raw: string): string | null {
+    const description = raw.trim();
 
-        // Remove date prefix
-        suggestedTitle = suggestedTitle.replace(/^\d{4}-\d{2}-\d{2}[-\s]*/, '');
+    // Reject AI refusals
+    if (REFUSAL_REGEX.test(description)) {
+      this.logger.warn(`Rejected AI refusal in description: "${description.substring(0, 50)}..."`);
+      return null;
+    }
 
-        // Lowercase and clean
-        suggestedTitle = suggestedTitle.toLowerCase().trim();
+    return description || null;
+  }
 
-        // Remove invalid filesystem characters
-        suggestedTitle = suggestedTitle.replace(/[/\\:*?"<>|]/g, '');
+  /**
+   * Description used when the model doesn't produce a usable one
+   */
+  private fallbackDescription(chapters: Chapter[]): string {
+    return `Video with ${chapters.length} chapter(s) covering: ${chapters.slice(0, 3).map((c) => c.title).join('; ')}.`;
+  }
 
-        // Remove parentheses and their contents at the end (e.g., "(source name)")
-        suggestedTitle = suggestedTitle.replace(/\s*\([^)]*\)\s*$/, '');
+  /**
+   * Pick people/topics arrays out of parsed tag JSON
+   */
+  private parseTags(tagsData: any): Tags {
+    return {
+      people: Array.isArray(tagsData?.people) ? tagsData.people.slice(0, 20) : [],
+      topics: Array.isArray(tagsData?.topics) ? tagsData.topics.slice(0, 15) : [],
+    };
+  }
+
+  /**
+   * Turn a generated title into a clean filename, or null if it's unusable
+   */
+  private cleanSuggestedTitle(raw: string): string | null {
+    let suggestedTitle = raw.trim();
 
-        // Remove periods
-        suggestedTitle = suggestedTitle.replace(/\.(?!\s|$)/g, '');
-        suggestedTitle = suggestedTitle.replace(/\.$/, '');
+    // Remove quotes
+    if (suggestedTitle.startsWith('"') && suggestedTitle.endsWith('"')) {
+      suggestedTitle = suggestedTitle.slice(1, -1);
+    }
 
-        // Clean up multiple spaces
-        suggestedTitle = suggestedTitle.replace(/\s+/g, ' ').trim();
+    // Remove file extension (cuts at the first period, so no periods remain)
+    const dotIndex = suggestedTitle.indexOf('.');
+    if (dotIndex !== -1) {
+      suggestedTitle = suggestedTitle.substring(0, dotIndex);
+    }
 
-        // Reject AI meta-commentary
-        const invalidPatterns = [
-          /^based on/i,
-          /^the transcript/i,
-          /^this video/i,
-          /^i would/i,
-          /^i suggest/i,
-          /^here is/i,
-          /^the suggested/i,
-        ];
+    // Remove date prefix
+    suggestedTitle = suggestedTitle.replace(/^\d{4}-\d{2}-\d{2}[-\s]*/, '');
 
-        for (const pattern of invalidPatterns) {
-          if (pattern.test(suggestedTitle)) {
-            this.logger.warn(`Rejected invalid AI title: "${suggestedTitle}"`);
-            return null;
-          }
-        }
+    // Lowercase and clean
+    suggestedTitle = suggestedTitle.toLowerCase().trim();
 
-        // Length limit
-        if (suggestedTitle.length > 200) {
-          suggestedTitle = suggestedTitle.substring(0, 200).split(',').slice(0, -1).join(',');
-        }
+    // Remove invalid filesystem characters
+    suggestedTitle = suggestedTitle.replace(/[/\\:*?"<>|]/g, '');
 
-        // Reject if too short
-        if (suggestedTitle.length < 10) {
-          this.logger.warn(`Rejected too-short AI title: "${suggestedTitle}"`);
-          return null;
-        }
+    // Remove parentheses and their contents at the end (e.g., "(source name)")
+    suggestedTitle = suggestedTitle.replace(/\s*\([^)]*\)\s*$/, '');
 
-        return suggestedTitle || null;
-      }
+    // Clean up multiple spaces
+    suggestedTitle = suggestedTitle.replace(/\s+/g, ' ').trim();
 
+    // Reject AI meta-commentary
+    if (META_COMMENTARY_TITLE_REGEX.test(suggestedTitle)) {
+      this.logger.warn(`Rejected invalid AI title: "${suggestedTitle}"`);
       return null;
-    } catch (error) {
-      this.logger.warn(`Title generation failed: ${(error as Error).message}`);
+    }
+
+    // Length limit
+    if (suggestedTitle.length > 200) {
+      suggestedTitle = suggestedTitle.substring(0, 200).split(',').slice(0, -1).join(',');
+    }
+
+    // Reject if too short
+    if (suggestedTitle.length < 10) {
+      this.logger.warn(`Rejected too-short AI title: "${suggestedTitle}"`);
       return null;
     }
+
+    return suggestedTitle || null;
   }
 
   /**
-   * Write a section to the output file
+   * Format a section as report text
    */
-  private writeSectionToFile(
-    outputFile: string,
-    section: AnalyzedSection,
-  ): void {
-    try {
-      let content = '';
+  private formatSection(section: AnalyzedSection): string {
+    const parts: string[] = [];
 
-      const endTime = section.end_time ? section.end_time : '';
-      if (endTime) {
-        content = `**${section.start_time} - ${endTime} - ${section.description} [${section.category}]**\n\n`;
-      } else {
-        content = `**${section.start_time} - ${section.description} [${section.category}]**\n\n`;
-      }
+    const endTime = section.end_time ? section.end_time : '';
+    if (endTime) {
+      parts.push(`**${section.start_time} - ${endTime} - ${section.description} [${section.category}]**\n\n`);
+    } else {
+      parts.push(`**${section.start_time} - ${section.description} [${section.category}]**\n\n`);
+    }
 
-      for (const quote of section.quotes || []) {
-        content += `${quote.timestamp} - "${quote.text}"\n`;
-        if (quote.significance) {
-          content += `   → ${quote.significance}\n`;
-        }
-        content += '\n';
+    for (const quote of section.quotes || []) {
+      parts.push(`${quote.timestamp} - "${quote.text}"\n`);
+      if (quote.significance) {
+        parts.push(`   → ${quote.significance}\n`);
       }
-
-      content += '-'.repeat(80) + '\n\n';
-      fs.appendFileSync(outputFile, content, 'utf-8');
-    } catch (error) {
-      this.logger.error(
-        `Error writing to file: ${(error as Error).message}`,
-      );
+      parts.push('\n');
     }
+
+    parts.push(SECTION_DIVIDER);
+    return parts.join('');
   }
 
   /**
-   * Prepend the video overview section to the analysis file
+   * Build the text report: header, video overview, then every flagged section
    */
-  private prependSummaryToFile(outputFile: string, summary: string): void {
-    try {
-      const existingContent = fs.readFileSync(outputFile, 'utf-8');
-
-      const headerEnd = existingContent.indexOf('\n\n');
-      if (headerEnd !== -1) {
-        const header = existingContent.substring(0, headerEnd + 2);
-        const rest = existingContent.substring(headerEnd + 2);
-
-        const newContent =
-          header +
-          '**VIDEO OVERVIEW**\n\n' +
-          summary +
-          '\n\n' +
-          '-'.repeat(80) +
-          '\n\n' +
-          rest;
-
-        fs.writeFileSync(outputFile, newContent, 'utf-8');
-      } else {
-        const newContent =
-          '**VIDEO OVERVIEW**\n\n' +
-          summary +
-          '\n\n' +
-          '-'.repeat(80) +
-          '\n\n' +
-          existingContent;
-
-        fs.writeFileSync(outputFile, newContent, 'utf-8');
-      }
-    } catch (error) {
-      this.logger.warn(
-        `Could not prepend summary to file: ${(error as Error).message}`,
-      );
-    }
+  private buildReport(summary: string, sections: AnalyzedSection[]): string {
+    return (
+      '='.repeat(80) + '\n' +
+      'VIDEO ANALYSIS RESULTS\n' +
+      '='.repeat(80) + '\n\n' +
+      '**VIDEO OVERVIEW**\n\n' +
+      summary + '\n\n' +
+      SECTION_DIVIDER +
+      sections.map((section) => this.formatSection(section)).join('')
+    );
   }
 
   /**
    * Format time for display (HH:MM:SS)
    */
   private formatDisplayTime(seconds: number): string {
-    const hours = Math.floor(seconds / 3600);
-    const minutes = Math.floor((seconds % 3600) / 60);
-    const secs = Math.floor(seconds % 60);
+    // Truncate once, then integer math only
+    const total = Math.floor(seconds);
+    const hours = Math.floor(total / 3600);
+    const minutes = Math.floor((total - hours * 3600) / 60);
+    const secs = total - hours * 3600 - minutes * 60;
 
-    return `${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+    return `${hours < 10 ? '0' : ''}${hours}:${minutes < 10 ? '0' : ''}${minutes}:${secs < 10 ? '0' : ''}${secs}`;
   }
 
   /**
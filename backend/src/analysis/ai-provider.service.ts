@@ -1,8 +1,13 @@
 // backend/src/analysis/ai-provider.service.ts
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import * as crypto from 'crypto';
+import * as fs from 'fs/promises';
+import * as os from 'os';
+import * as path from 'path';
 import Anthropic from '@anthropic-ai/sdk';
 import OpenAI from 'openai';
 import { LlamaManager } from '../bridges';
+import { OllamaService, ollamaHttp, OLLAMA_KEEP_ALIVE } from './ollama.service';
 
 export interface AIProviderConfig {
   provider: 'local' | 'ollama' | 'claude' | 'openai';
@@ -11,6 +16,15 @@ export interface AIProviderConfig {
   ollamaEndpoint?: string;
 }
 
+export interface GenerateOptions {
+  maxTokens?: number;              // Cap on generated output tokens
+  stopWhenJsonComplete?: boolean;  // Stop generating once a complete JSON object has been received
+  json?: boolean;                  // Ask the provider to constrain the reply to a JSON object where supported
+  // Enables the on-disk response cache; a fresh response is only stored if this accepts it
+  cacheIf?: (text: string) => boolean;
+  bypassCache?: boolean;           // Ignore any cached reply (re-analysis); the fresh reply is still stored
+}
+
 export interface AIResponse {
   text: string;
   tokensUsed?: number;
@@ -21,13 +35,95 @@ export interface AIResponse {
   model: string;
 }
 
+// Cached responses older than this are regenerated
+const RESPONSE_CACHE_TTL = 30 * 24 * 60 * 60 * 1000; // 30 days in milliseconds
+
+// Set AI_RESPONSE_CACHE=false to always query the provider and never store replies
+function isResponseCacheEnabled(): boolean {
+  const setting = (process.env.AI_RESPONSE_CACHE || '').toLowerCase();
+  return !(setting === 'false' || setting === '0');
+}
+
+/**
+ * App data directory the response cache lives under
+ * Mac: ~/Library/Application Support/ClipChimp
+ * Windows: %APPDATA%/ClipChimp
+ * Linux: ~/.config/ClipChimp
+ */
+function getAppDataPath(): string {
+  if (process.platform === 'darwin') {
+    return path.join(os.homedir(), 'Library', 'Application Support', 'ClipChimp');
+  }
+  if (process.platform === 'win32') {
+    const appData = process.env.APPDATA || path.join(os.homedir(), 'AppData', 'Roaming');
+    return path.join(appData, 'ClipChimp');
+  }
+  const configHome = process.env.XDG_CONFIG_HOME || path.join(os.homedir(), '.config');
+  return path.join(configHome, 'ClipChimp');
+}
+
+/**
+ * Tracks brace depth across streamed text (ignoring braces inside strings)
+ * to detect when the first top-level JSON object has been closed
+ */
+class JsonCompletionTracker {
+  private depth = 0;
+  private started = false;
+  private inString = false;
+  private escaped = false;
+
+  /**
+   * Feed the next piece of text; returns true once the JSON object is complete
+   */
+  feed(text: string): boolean {
+    for (let i = 0; i < text.length; i++) {
+      const ch = text[i];
+
+      if (this.inString) {
+        if (this.escaped) {
+          this.escaped = false;
+        } else if (ch === '\\') {
+          this.escaped = true;
+        } else if (ch === '"') {
+          this.inString = false;
+        }
+        continue;
+      }
+
+      if (ch === '"' && this.started) {
+        this.inString = true;
+      } else if (ch === '{') {
+        this.depth++;
+        this.started = true;
+      } else if (ch === '}' && this.started) {
+        this.depth--;
+        if (this.depth === 0) {
+          return true;
+        }
+      }
+    }
+    return false;
+  }
+}
+
 @Injectable()
-export class AIProviderService {
+export class AIProviderService implements OnModuleInit {
   private readonly logger = new Logger(AIProviderService.name);
   private anthropic: Anthropic | null = null;
   private openai: OpenAI | null = null;
-
-  constructor(private readonly llamaManager: LlamaManager) {}
+  private readonly responseCacheDir = path.join(getAppDataPath(), 'ai-response-cache');
+
+  constructor(
+    private readonly llamaManager: LlamaManager,
+    private readonly ollamaService: OllamaService,
+  ) {}
+
+  onModuleInit(): void {
+    // Expired entries are never read again; clear them without delaying startup
+    this.pruneResponseCache().catch((error) => {
+      this.logger.warn(`Could not prune response cache: ${(error as Error).message}`);
+    });
+  }
 
   // Pricing per 1M tokens (as of January 2025)
   private readonly PRICING: Record<'claude' | 'openai', Record<string, { input: number; output: number }>> = {
@@ -75,29 +171,148 @@ export class AIProviderService {
   async generateText(
     prompt: string,
     config: AIProviderConfig,
+    options: GenerateOptions = {},
   ): Promise<AIResponse> {
     this.logger.log(`Generating text with provider: ${config.provider}, model: ${config.model}`);
 
+    if (!options.cacheIf || !isResponseCacheEnabled()) {
+      return this.generateWithProvider(prompt, config, options);
+    }
+
+    // Re-running an analysis sends the same prompts again; reuse earlier answers
+    // unless the caller explicitly asked for fresh ones
+    const cacheFile = this.getResponseCachePath(prompt, config, options);
+    const cached = options.bypassCache ? null : await this.readCachedResponse(cacheFile, config);
+    if (cached) {
+      this.logger.log(`Using cached response for ${config.provider}:${config.model}`);
+      return cached;
+    }
+
+    const response = await this.generateWithProvider(prompt, config, options);
+    if (response.text && options.cacheIf(response.text)) {
+      await this.writeCachedResponse(cacheFile, response.text);
+    }
+    return response;
+  }
+
+  private generateWithProvider(
+    prompt: string,
+    config: AIProviderConfig,
+    options: GenerateOptions,
+  ): Promise<AIResponse> {
     switch (config.provider) {
       case 'local':
-        return this.generateWithLocal(prompt);
+        return this.generateWithLocal(prompt, options);
       case 'claude':
-        return this.generateWithClaude(prompt, config);
+        return this.generateWithClaude(prompt, config, options);
       case 'openai':
-        return this.generateWithOpenAI(prompt, config);
+        return this.generateWithOpenAI(prompt, config, options);
       case 'ollama':
-        return this.generateWithOllama(prompt, config);
+        return this.generateWithOllama(prompt, config, options);
       default:
         throw new Error(`Unsupported AI provider: ${config.provider}`);
     }
   }
 
+  /**
+   * Cache file for a request, keyed by provider, model, endpoint, every option
+   * that changes the request body, and the prompt. num_ctx is derived from the
+   * prompt; any sampling setting added to a request later must go in the key too
+   * Stored under the app data directory:
+   * Mac: ~/Library/Application Support/ClipChimp/ai-response-cache
+   * Windows: %APPDATA%/ClipChimp/ai-response-cache
+   * Linux: ~/.config/ClipChimp/ai-response-cache
+   */
+  private getResponseCachePath(
+    prompt: string,
+    config: AIProviderConfig,
+    options: GenerateOptions,
+  ): string {
+    const key = crypto
+      .createHash('sha256')
+      .update(JSON.stringify([
+        config.provider,
+        config.model,
+        config.provider === 'ollama' ? config.ollamaEndpoint ?? null : null,
+        options.maxTokens ?? null,
+        !!options.json,
+        !!options.stopWhenJsonComplete,
+        prompt,
+      ]))
+      .digest('hex');
+
+    return path.join(this.responseCacheDir, `${key}.json`);
+  }
+
+  /**
+   * Delete cache entries older than RESPONSE_CACHE_TTL so the directory doesn't
+   * grow forever; file mtime is the save time since entries are never rewritten
+   */
+  private async pruneResponseCache(): Promise<void> {
+    let files: string[];
+    try {
+      files = await fs.readdir(this.responseCacheDir);
+    } catch {
+      return; // No cache yet
+    }
+
+    const cutoff = Date.now() - RESPONSE_CACHE_TTL;
+    let removed = 0;
+    for (const file of files) {
+      const filePath = path.join(this.responseCacheDir, file);
+      const stats = await fs.stat(filePath).catch(() => null);
+      if (stats?.isFile() && stats.mtimeMs < cutoff) {
+        await fs.unlink(filePath).catch(() => undefined);
+        removed++;
+      }
+    }
+
+    if (removed > 0) {
+      this.logger.log(`Pruned ${removed} expired response cache entries`);
+    }
+  }
+
+  private async readCachedResponse(
+    cacheFile: string,
+    config: AIProviderConfig,
+  ): Promise<AIResponse | null> {
+    try {
+      const entry = JSON.parse(await fs.readFile(cacheFile, 'utf-8'));
+      if (typeof entry.text !== 'string' || Date.now() - entry.savedAt > RESPONSE_CACHE_TTL) {
+        return null;
+      }
+
+      // Nothing was generated, so no tokens or cost for this call
+      return {
+        text: entry.text,
+        tokensUsed: 0,
+        inputTokens: 0,
+        outputTokens: 0,
+        estimatedCost: 0,
+        provider: config.provider,
+        model: config.model,
+      };
+    } catch {
+      return null; // Missing or unreadable entry - treat as a miss
+    }
+  }
+
+  private async writeCachedResponse(cacheFile: string, text: string): Promise<void> {
+    try {
+      await fs.mkdir(path.dirname(cacheFile), { recursive: true });
+      await fs.writeFile(cacheFile, JSON.stringify({ savedAt: Date.now(), text }), 'utf-8');
+    } catch (error) {
+      this.logger.warn(`Could not write response cache: ${(error as Error).message}`);
+    }
+  }
+
   /**
    * Generate text using Claude API
    */
   private async generateWithClaude(
     prompt: string,
     config: AIProviderConfig,
+    options: GenerateOptions,
   ): Promise<AIResponse> {
     if (!config.apiKey) {
       throw new Error('Claude API key is required');
@@ -113,7 +328,7 @@ export class AIProviderService {
     try {
       const message = await this.anthropic.messages.create({
         model: config.model,
-        max_tokens: 4096,
+        max_tokens: options.maxTokens ?? 4096,
         messages: [
           {
             role: 'user',
@@ -154,6 +369,7 @@ export class AIProviderService {
   private async generateWithOpenAI(
     prompt: string,
     config: AIProviderConfig,
+    options: GenerateOptions,
   ): Promise<AIResponse> {
     if (!config.apiKey) {
       throw new Error('OpenAI API key is required');
@@ -175,7 +391,9 @@ export class AIProviderService {
             content: prompt,
           },
         ],
-        max_tokens: 4096,
+        max_tokens: options.maxTokens ?? 4096,
+        // JSON mode keeps the reply to a bare object with no surrounding prose
+        ...(options.json ? { response_format: { type: 'json_object' as const } } : {}),
       });
 
       const text = completion.choices[0]?.message?.content || '';
@@ -210,6 +428,7 @@ export class AIProviderService {
   private async generateWithOllama(
     prompt: string,
     config: AIProviderConfig,
+    options: GenerateOptions,
   ): Promise<AIResponse> {
     const ollamaEndpoint = config.ollamaEndpoint || 'http://localhost:11434';
 
@@ -230,42 +449,57 @@ export class AIProviderService {
     );
 
     try {
-      const response = await fetch(`${ollamaEndpoint}/api/generate`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
+      // Stream the response so generation can be cut off as soon as the
+      // expected JSON object is complete instead of waiting for the model to stop
+      // Use the shared keep-alive pool so consecutive chunk/chapter calls reuse the socket
+      const controller = new AbortController();
+      const response = await ollamaHttp.post(
+        `${ollamaEndpoint}/api/generate`,
+        {
           model: config.model,
           prompt: prompt,
-          stream: false,
+          stream: true,
+          // Keep the model resident between chunk/chapter calls so a slow
+          // response never lets it get evicted mid-analysis
+          keep_alive: OLLAMA_KEEP_ALIVE.value,
+          // Grammar-constrained output, so the reply is always parseable JSON
+          ...(options.json ? { format: 'json' } : {}),
           options: {
             num_ctx: numCtx,
+            ...(options.maxTokens ? { num_predict: options.maxTokens } : {}),
           },
-        }),
-      });
+        },
+        { responseType: 'stream', signal: controller.signal, validateStatus: () => true },
+      );
 
-      if (!response.ok) {
+      if (response.status < 200 || response.status >= 300) {
+        response.data.destroy();
         throw new Error(`Ollama API returned status ${response.status}`);
       }
 
-      const data = await response.json();
+      const data = await this.readOllamaStream(
+        response.data,
+        controller,
+        !!options.stopWhenJsonComplete,
+        estimatedInputTokens,
+      );
 
-      // Ollama returns token counts in the response
+      // Generating counts as activity for our own idle-unload timer too
+      this.ollamaService.markModelUsed(config.model, ollamaEndpoint);
+
+      // Ollama returns token counts in the final streamed message
       // Fields: prompt_eval_count (input tokens), eval_count (output tokens)
-      const inputTokens = data.prompt_eval_count || 0;
-      const outputTokens = data.eval_count || 0;
+      const inputTokens = data.inputTokens;
+      const outputTokens = data.outputTokens;
       const tokensUsed = inputTokens + outputTokens;
 
-      // Debug: log raw Ollama response fields for token tracking
-      console.log(`[Ollama Response] prompt_eval_count=${data.prompt_eval_count}, eval_count=${data.eval_count}`);
-      console.log(`[Ollama Tokens] ${inputTokens} input + ${outputTokens} output = ${tokensUsed} total`);
       this.logger.log(
-        `Ollama tokens: ${inputTokens} input + ${outputTokens} output = ${tokensUsed} total (local, $0.00)`,
+        `Ollama tokens: ${inputTokens} input + ${outputTokens} output = ${tokensUsed} total (local, $0.00)` +
+        (data.stoppedEarly ? ' - stopped after complete JSON' : ''),
       );
 
       return {
-        text: data.response,
+        text: data.text,
         tokensUsed,
         inputTokens,
         outputTokens,
@@ -279,16 +513,104 @@ export class AIProviderService {
     }
   }
 
+  /**
+   * Read a streamed Ollama generate response (newline-delimited JSON)
+   * If stopWhenJsonComplete is set, the request is aborted as soon as the
+   * first JSON object in the output closes, so trailing text is never generated
+   */
+  private readOllamaStream(
+    stream: NodeJS.ReadableStream,
+    controller: AbortController,
+    stopWhenJsonComplete: boolean,
+    estimatedInputTokens: number,
+  ): Promise<{ text: string; inputTokens: number; outputTokens: number; stoppedEarly: boolean }> {
+    return new Promise((resolve, reject) => {
+      const jsonTracker = stopWhenJsonComplete ? new JsonCompletionTracker() : null;
+      let buffer = '';
+      let text = '';
+      let streamedTokens = 0;
+      let settled = false;
+
+      const finish = (inputTokens: number, outputTokens: number, stoppedEarly: boolean) => {
+        if (settled) return;
+        settled = true;
+        resolve({ text, inputTokens, outputTokens, stoppedEarly });
+      };
+
+      // Decode as UTF-8 text so multi-byte characters split across chunks survive
+      stream.setEncoding('utf8');
+
+      stream.on('data', (chunk: string) => {
+        if (settled) return;
+        buffer += chunk;
+
+        // Walk complete lines with indexOf rather than splitting the buffer
+        let lineStart = 0;
+        let newline: number;
+        while ((newline = buffer.indexOf('\n', lineStart)) !== -1) {
+          const line = buffer.substring(lineStart, newline);
+          lineStart = newline + 1;
+          if (!line.trim()) continue;
+
+          let data: any;
+          try {
+            data = JSON.parse(line);
+          } catch {
+            this.logger.warn(`[Ollama Stream] Failed to parse line: ${line.substring(0, 100)}`);
+            continue;
+          }
+
+          if (data.error) {
+            settled = true;
+            reject(new Error(data.error));
+            return;
+          }
+
+          if (data.response) {
+            text += data.response;
+            streamedTokens++; // Ollama streams one token per message
+
+            if (jsonTracker?.feed(data.response)) {
+              controller.abort();
+              finish(estimatedInputTokens, streamedTokens, true);
+              return;
+            }
+          }
+
+          if (data.done) {
+            finish(data.prompt_eval_count || 0, data.eval_count || streamedTokens, false);
+            return;
+          }
+        }
+        buffer = buffer.substring(lineStart); // Keep incomplete line in buffer
+      });
+
+      stream.on('end', () => finish(estimatedInputTokens, streamedTokens, false));
+
+      stream.on('error', (error: Error) => {
+        // Errors after we aborted on purpose are expected
+        if (settled) return;
+        settled = true;
+        reject(error);
+      });
+    });
+  }
+
   /**
    * Generate text using bundled local AI (Cogito 8B via llama.cpp)
    */
-  private async generateWithLocal(prompt: string): Promise<AIResponse> {
+  private async generateWithLocal(prompt: string, options: GenerateOptions): Promise<AIResponse> {
     if (!this.llamaManager.isAvailable()) {
       throw new Error('Local AI model not available. Please reinstall the application.');
     }
 
     try {
-      const result = await this.llamaManager.generateText(prompt);
+      // Same early cut-off as the Ollama path: stream and stop once the JSON object closes
+      const jsonTracker = options.stopWhenJsonComplete ? new JsonCompletionTracker() : null;
+      const result = await this.llamaManager.generateText(prompt, {
+        maxTokens: options.maxTokens,
+        shouldStop: jsonTracker ? (text) => jsonTracker.feed(text) : undefined,
+      });
 
       this.logger.log(
         `Local AI tokens: ${result.inputTokens} input + ${result.outputTokens} output = ${result.totalTokens} total (local, $0.00)`,
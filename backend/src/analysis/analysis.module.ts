@@ -6,7 +6,6 @@ import { SimpleAnalyzeController } from './simple-analyze.controller';
 import { OllamaService } from './ollama.service';
 import { AIProviderService } from './ai-provider.service';
 import { AIAnalysisService } from './ai-analysis.service';
-import { LlamaManager } from '../bridges';
 import { FfmpegModule } from '../ffmpeg/ffmpeg.module';
 import { DownloaderModule } from '../downloader/downloader.module';
 import { PathModule } from '../path/path.module';
@@ -34,7 +33,8 @@ import { ApiKeysModule } from '../config/config.module';
     SimpleTranscribeController,
     SimpleAnalyzeController,
   ],
-  providers: [AnalysisService, OllamaService, AIProviderService, AIAnalysisService, LlamaManager],
-  exports: [AnalysisService, OllamaService, AIProviderService, AIAnalysisService, LlamaManager],
+  // LlamaManager comes from the global BridgesModule, so every caller shares one llama-server
+  providers: [AnalysisService, OllamaService, AIProviderService, AIAnalysisService],
+  exports: [AnalysisService, OllamaService, AIProviderService, AIAnalysisService],
 })
 export class AnalysisModule {}
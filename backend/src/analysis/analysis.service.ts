@@ -5,7 +5,7 @@ import * as fs from 'fs/promises';
 import * as fsSync from 'fs';
 import { OllamaService } from './ollama.service';
 import { AIProviderService } from './ai-provider.service';
-import { AIAnalysisService } from './ai-analysis.service';
+import { AIAnalysisService, parseSrtToSegments } from './ai-analysis.service';
 import { WhisperService } from '../media/whisper.service';
 import { FfmpegService } from '../ffmpeg/ffmpeg.service';
 import { DownloaderService } from '../downloader/downloader.service';
@@ -78,6 +78,7 @@ interface AnalysisRequestWithState extends AnalysisRequest {
   videoTitle?: string;
   audioPath?: string;
   phase?: 'download' | 'transcribe' | 'analyze' | 'process' | 'normalize-audio' | 'finalize';
+  modelPrewarm?: Promise<string>;  // Ollama model load started during transcription; resolves to the tag it loaded
 }
 
 @Injectable()
@@ -612,6 +613,11 @@ export class AnalysisService implements OnModuleInit {
 
     this.logger.log(`Transcription started for job ${jobId} using whisper.cpp`);
 
+    // Load the analysis model while whisper runs, so the analyze phase doesn't wait on it
+    if (mode === 'full') {
+      this.prewarmAnalysisModel(request);
+    }
+
     // Use WhisperService which handles audio extraction and whisper.cpp transcription
     const srtFilePath = await this.whisperService.transcribeVideo(
       request.videoPath!,
@@ -627,7 +633,7 @@ export class AnalysisService implements OnModuleInit {
     const srtContent = await fs.readFile(srtFilePath, 'utf-8');
 
     // Parse SRT to get plain text (segments are parsed later in processAnalyzePhase)
-    const segments = this.parseSrtToSegments(srtContent);
+    const segments = parseSrtToSegments(srtContent);
     const plainText = segments.map((seg: any) => seg.text).join(' ');
 
     request.transcriptText = plainText;
@@ -642,6 +648,35 @@ export class AnalysisService implements OnModuleInit {
     await fs.unlink(srtFilePath).catch(() => {});
   }
 
+  /**
+   * Start loading the job's Ollama model in the background
+   * Model loads take seconds to a minute and transcription takes minutes, so
+   * overlapping them takes the load off the analysis critical path
+   */
+  private prewarmAnalysisModel(request: AnalysisRequestWithState): void {
+    const aiModel = request.aiModel;
+    if (!aiModel) return;
+
+    // Same "provider:model" handling as processAnalyzePhase
+    const colonIndex = aiModel.indexOf(':');
+    const prefix = colonIndex > 0 ? aiModel.substring(0, colonIndex) : '';
+    const hasProviderPrefix = ['local', 'ollama', 'claude', 'openai'].includes(prefix);
+    const provider = hasProviderPrefix ? prefix : request.aiProvider;
+    if (provider !== 'ollama') return;
+
+    const modelName = hasProviderPrefix ? aiModel.substring(colonIndex + 1) : aiModel;
+    const endpoint = request.ollamaEndpoint;
+    // Load the tag the analysis will actually use, not the one that was requested
+    request.modelPrewarm = this.ollama.resolvePreferredModel(modelName, endpoint).then(async (resolved) => {
+      try {
+        await this.ollama.prepareModel(resolved, endpoint);
+      } catch (error) {
+        this.logger.warn(`Background load of ${resolved} failed: ${(error as Error).message}`);
+      }
+      return resolved;
+    });
+  }
+
   /**
    * Process analyze phase
    */
@@ -672,9 +707,11 @@ export class AnalysisService implements OnModuleInit {
     }
 
     // Clear existing analysis data if re-analyzing
+    let reanalyzing = false;
     if (request.videoId) {
       const existingAnalysis = this.databaseService.getAnalysis(request.videoId);
       if (existingAnalysis) {
+        reanalyzing = true;
         this.logger.log(`Clearing existing analysis data for video ${request.videoId} before re-analyzing`);
 
         // Delete analysis record and AI-generated sections
@@ -695,25 +732,19 @@ export class AnalysisService implements OnModuleInit {
 
     // Extract provider from model string if not explicitly set (e.g., "local:cogito-8b" -> provider="local", model="cogito-8b")
     const validProviders = ['local', 'ollama', 'claude', 'openai'];
-    try {
-      if (modelName && typeof modelName === 'string' && modelName.includes(':')) {
-        const parts = modelName.split(':');
-        const potentialProvider = parts[0];
-
-        // If first part is a valid provider, extract it
-        if (validProviders.includes(potentialProvider)) {
-          if (!request.aiProvider || request.aiProvider !== potentialProvider) {
-            request.aiProvider = potentialProvider as 'local' | 'ollama' | 'claude' | 'openai';
-            this.logger.log(`[processAnalyzePhase] Extracted provider from model string: ${potentialProvider}`);
-          }
-          modelName = parts.slice(1).join(':');
-          this.logger.log(`[processAnalyzePhase] Stripped model name: ${modelName}`);
+    const colonIndex = modelName && typeof modelName === 'string' ? modelName.indexOf(':') : -1;
+    if (colonIndex > 0) {
+      const potentialProvider = modelName.substring(0, colonIndex);
+
+      // If first part is a valid provider, extract it
+      if (validProviders.includes(potentialProvider)) {
+        if (!request.aiProvider || request.aiProvider !== potentialProvider) {
+          request.aiProvider = potentialProvider as 'local' | 'ollama' | 'claude' | 'openai';
+          this.logger.log(`[processAnalyzePhase] Extracted provider from model string: ${potentialProvider}`);
         }
+        modelName = modelName.substring(colonIndex + 1);
+        this.logger.log(`[processAnalyzePhase] Stripped model name: ${modelName}`);
       }
-    } catch (error) {
-      this.logger.error(`[processAnalyzePhase] Error stripping model name: ${(error as Error).message}`, (error as Error).stack);
-      // Use fallback
-      modelName = 'default-model';
     }
 
     this.updateJob(jobId, {
@@ -728,6 +759,15 @@ export class AnalysisService implements OnModuleInit {
     // Prepare AI model (preload if not loaded, unload others if different model)
     // Only for Ollama - local, claude, and openai providers handle their own model loading
     if (request.aiProvider === 'ollama') {
+      // Swap to an installed quantized copy before anything is loaded, so the
+      // full-precision weights are never made resident alongside it. A load started
+      // during transcription already resolved it; let it finish so it isn't requested twice
+      if (request.modelPrewarm) {
+        modelName = await request.modelPrewarm;
+        request.modelPrewarm = undefined;
+      } else {
+        modelName = await this.ollama.resolvePreferredModel(modelName, request.ollamaEndpoint);
+      }
       try {
         await this.ollama.prepareModel(modelName, request.ollamaEndpoint);
       } catch (error: any) {
@@ -748,7 +788,7 @@ export class AnalysisService implements OnModuleInit {
     const analysisOutputPath = path.join(tmpDir, `${jobId}_${reportFileName}`);
 
     // Parse SRT to get segments
-    const segments = this.parseSrtToSegments(request.transcriptSrt);
+    const segments = parseSrtToSegments(request.transcriptSrt);
 
     // Determine provider and get API key if needed - no fallbacks
     if (!request.aiProvider) {
@@ -789,6 +829,8 @@ export class AnalysisService implements OnModuleInit {
       categories,
       apiKey,
       ollamaEndpoint: request.ollamaEndpoint,
+      // Re-analysis means the earlier answers weren't wanted; don't serve them from cache
+      bypassCache: reanalyzing,
       onProgress: (progress) => {
         // Handle indeterminate progress (single-chunk videos)
         if (progress.progress === -1) {
@@ -807,8 +849,8 @@ export class AnalysisService implements OnModuleInit {
       },
     });
 
-    // Read and save analysis
-    const analysisText = await fs.readFile(analysisOutputPath, 'utf-8');
+    // Save analysis
+    const analysisText = analysisResult.report;
 
     // Save to request for finalize phase
     (request as any).analysisText = analysisText;
@@ -826,7 +868,7 @@ export class AnalysisService implements OnModuleInit {
     });
 
     // Keep-alive will maintain the model in memory for the next job in queue
-    this.logger.log(`Analysis complete for job ${jobId}. Model ${modelName} will stay loaded for ${this.ollama['KEEP_ALIVE_DURATION'] / 60000} minutes.`);
+    this.logger.log(`Analysis complete for job ${jobId}. Model ${modelName} ${this.ollama.describeKeepAlive()}.`);
   }
 
   /**
@@ -1185,24 +1227,14 @@ export class AnalysisService implements OnModuleInit {
         }
 
         // Save chapters (topic-based segments)
-        console.log(`[processFinalizePhase] About to check chapters. analysisResult type: ${typeof analysisResult}`);
-        console.log(`[processFinalizePhase] analysisResult keys: ${analysisResult ? Object.keys(analysisResult).join(', ') : 'NULL'}`);
-        console.log(`[processFinalizePhase] Checking chapters: exists=${!!analysisResult.chapters}, isArray=${Array.isArray(analysisResult.chapters)}, length=${analysisResult.chapters?.length || 0}`);
-        if (analysisResult.chapters && analysisResult.chapters.length > 0) {
-          console.log(`[processFinalizePhase] Chapters data: ${JSON.stringify(analysisResult.chapters)}`);
-        }
         if (analysisResult.chapters && Array.isArray(analysisResult.chapters) && analysisResult.chapters.length > 0) {
           this.logger.log(`Saving ${analysisResult.chapters.length} chapters for video ${videoId}`);
-          console.log(`[processFinalizePhase] SAVING ${analysisResult.chapters.length} CHAPTERS`);
 
           try {
             // Delete existing chapters first
             this.databaseService.deleteChapters(videoId);
-            console.log(`[processFinalizePhase] Deleted existing chapters for video ${videoId}`);
 
             for (const chapter of analysisResult.chapters) {
-              console.log(`[processFinalizePhase] Processing chapter: ${JSON.stringify(chapter)}`);
-
               // Parse start time to seconds
               let startSeconds = 0;
               if (chapter.start_time) {
@@ -1225,7 +1257,7 @@ export class AnalysisService implements OnModuleInit {
                 }
               }
 
-              console.log(`[processFinalizePhase] Inserting chapter: seq=${chapter.sequence}, start=${startSeconds}, end=${endSeconds}, title=${chapter.title}`);
+              this.logger.debug(`[processFinalizePhase] Inserting chapter: seq=${chapter.sequence}, start=${startSeconds}, end=${endSeconds}`);
 
               this.databaseService.insertChapter({
                 id: require('uuid').v4(),
@@ -1237,8 +1269,6 @@ export class AnalysisService implements OnModuleInit {
                 description: chapter.description,
                 source: 'ai',
               });
-
-              console.log(`[processFinalizePhase] Chapter inserted successfully`);
             }
             // Verify chapters were saved
             const savedChapters = this.databaseService.getChapters(videoId);
@@ -1463,75 +1493,6 @@ export class AnalysisService implements OnModuleInit {
     return sanitized;
   }
 
-  /**
-   * Parse SRT format to segments array (for AI analysis timestamp correlation)
-   */
-  private parseSrtToSegments(srtContent: string): any[] {
-    const segments: any[] = [];
-
-    if (!srtContent || typeof srtContent !== 'string') {
-      this.logger.warn('[parseSrtToSegments] SRT content is undefined or not a string');
-      return segments;
-    }
-
-    // Debug: Log raw SRT content info
-    this.logger.log(`[parseSrtToSegments] Raw SRT length: ${srtContent.length}`);
-    this.logger.log(`[parseSrtToSegments] First 200 chars: ${JSON.stringify(srtContent.substring(0, 200))}`);
-    this.logger.log(`[parseSrtToSegments] Contains \\r\\n: ${srtContent.includes('\r\n')}, Contains \\r: ${srtContent.includes('\r')}, Contains \\n: ${srtContent.includes('\n')}`);
-
-    // Normalize line endings: convert \r\n (Windows) to \n (Unix)
-    const normalizedContent = srtContent.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
-    const blocks = normalizedContent.split('\n\n').filter(b => b.trim());
-
-    this.logger.log(`[parseSrtToSegments] After normalization, found ${blocks.length} blocks`);
-    if (blocks.length > 0) {
-      this.logger.log(`[parseSrtToSegments] First block: ${JSON.stringify(blocks[0].substring(0, 150))}`);
-    }
-
-    for (const block of blocks) {
-      const lines = block.split('\n');
-      if (lines.length < 3) continue;
-
-      // Line 0: sequence number
-      // Line 1: timestamp (00:00:01,500 --> 00:00:04,200)
-      // Line 2+: text
-      const timestampLine = lines[1];
-      const textLines = lines.slice(2);
-
-      const match = timestampLine.match(/(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/);
-      if (match) {
-        const startHours = parseInt(match[1]);
-        const startMinutes = parseInt(match[2]);
-        const startSeconds = parseInt(match[3]);
-        const startMs = parseInt(match[4]);
-
-        const endHours = parseInt(match[5]);
-        const endMinutes = parseInt(match[6]);
-        const endSeconds = parseInt(match[7]);
-        const endMs = parseInt(match[8]);
-
-        const start = startHours * 3600 + startMinutes * 60 + startSeconds + startMs / 1000;
-        const end = endHours * 3600 + endMinutes * 60 + endSeconds + endMs / 1000;
-
-        segments.push({
-          start,
-          end,
-          text: textLines.join(' ')
-        });
-      }
-    }
-
-    this.logger.log(`[parseSrtToSegments] Parsed ${segments.length} segments`);
-    if (segments.length > 0) {
-      this.logger.log(`[parseSrtToSegments] First segment: start=${segments[0].start}, end=${segments[0].end}, text="${segments[0].text.substring(0, 50)}..."`);
-      if (segments.length > 1) {
-        this.logger.log(`[parseSrtToSegments] Second segment: start=${segments[1].start}, end=${segments[1].end}`);
-      }
-    }
-
-    return segments;
-  }
-
   /**
    * Update job and emit event
    */
@@ -1544,8 +1505,11 @@ export class AnalysisService implements OnModuleInit {
 
     Object.assign(job, updates);
 
+    // Progress ticks arrive many times per job; log the headline fields rather than
+    // serializing the whole update object on every call
+    this.logger.debug(`[updateJob] Emitting progress for job ${jobId}: ${job.status} ${job.progress}% ${job.currentPhase}`);
+
     // Emit WebSocket event with both jobId and id for frontend compatibility
-    this.logger.log(`[updateJob] Emitting progress for job ${jobId}: ${JSON.stringify(updates)}`);
     this.eventEmitter.emit('analysis.progress', {
       id: jobId,  // Frontend expects 'id' field
       jobId,      // Keep jobId for backwards compatibility
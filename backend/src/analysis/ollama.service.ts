@@ -1,25 +1,136 @@
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
 import axios from 'axios';
+import * as http from 'http';
+import * as https from 'https';
 
 export interface OllamaModel {
   name: string;
   size: number;
   digest: string;
   modified_at: string;
+  details?: {
+    family?: string;
+    parameter_size?: string;
+    quantization_level?: string;
+  };
 }
 
 export interface OllamaModelList {
   models: OllamaModel[];
 }
 
+// 4/5-bit k-quants preferred over a full precision or 8-bit copy of the same model,
+// best first: far less weight traffic per token, with little quality loss for
+// structured extraction. Set PREFER_QUANTIZED_OLLAMA_MODELS=false to opt out
+const PREFERRED_QUANTIZATIONS = ['Q5_K_M', 'Q4_K_M'];
+const HIGH_PRECISION_QUANTIZATIONS = new Set(['F32', 'F16', 'BF16', 'Q8_0']);
+// Precision suffix of a tag ("8b-instruct-fp16" -> "8b-instruct"); what's left
+// names the variant (instruct, text, chat...) that a swap has to keep
+const QUANTIZATION_TAG_SUFFIX_REGEX = /-(?:fp32|fp16|bf16|f32|f16|q\d[a-z0-9_]*)$/i;
+
+/**
+ * "family:tag" with the precision suffix removed, e.g. "llama3.1:8b-instruct"
+ */
+function modelVariantKey(name: string): string {
+  const colonIndex = name.indexOf(':');
+  const family = colonIndex > 0 ? name.substring(0, colonIndex) : name;
+  const tag = colonIndex > 0 ? name.substring(colonIndex + 1) : 'latest';
+  return `${family}:${tag.replace(QUANTIZATION_TAG_SUFFIX_REGEX, '')}`;
+}
+
+// Ollama keep-alive: a bare number of seconds ("300", "-1") or a Go duration
+// ("30m", "1h30m", "-1m"); anything negative keeps the model loaded indefinitely
+const KEEP_ALIVE_SECONDS_REGEX = /^[-+]?(?:\d+(?:\.\d*)?|\.\d+)$/;
+const KEEP_ALIVE_DURATION_REGEX = /^[-+]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:ns|us|µs|ms|s|m|h))+$/;
+const KEEP_ALIVE_PART_REGEX = /(\d+(?:\.\d*)?|\.\d+)(ns|us|µs|ms|s|m|h)/g;
+const KEEP_ALIVE_UNIT_MS: Record<string, number> = {
+  ns: 1e-6, us: 1e-3, 'µs': 1e-3, ms: 1, s: 1000, m: 60 * 1000, h: 60 * 60 * 1000,
+};
+const DEFAULT_KEEP_ALIVE = '30m';
+
+/**
+ * How long a model stays loaded after its last request
+ * Reads Ollama's own OLLAMA_KEEP_ALIVE (as analysis does OLLAMA_NUM_PARALLEL) so the
+ * keep_alive sent with requests and the app's idle unload timer agree with the server.
+ * ms is null when there is no idle unload to mirror: the value keeps the model
+ * loaded indefinitely, or isn't a form parsed here (it is still sent as is).
+ * Bare seconds are sent as a number, since Ollama reads a string as a Go duration
+ */
+function resolveKeepAlive(): { value: string | number; ms: number | null } {
+  const configured = (process.env.OLLAMA_KEEP_ALIVE || '').trim();
+  if (!configured) {
+    return { value: DEFAULT_KEEP_ALIVE, ms: 30 * 60 * 1000 };
+  }
+
+  if (KEEP_ALIVE_SECONDS_REGEX.test(configured)) {
+    const seconds = Number(configured);
+    return { value: seconds, ms: seconds >= 0 ? Math.round(seconds * 1000) : null };
+  }
+
+  if (!KEEP_ALIVE_DURATION_REGEX.test(configured)) {
+    return { value: configured, ms: null };
+  }
+
+  let ms = 0;
+  for (const [, amount, unit] of configured.matchAll(KEEP_ALIVE_PART_REGEX)) {
+    ms += Number(amount) * KEEP_ALIVE_UNIT_MS[unit];
+  }
+  return { value: configured, ms: configured.startsWith('-') ? null : Math.round(ms) };
+}
+
+export const OLLAMA_KEEP_ALIVE = resolveKeepAlive();
+
+// Shared keep-alive connection pool for all Ollama traffic
+// Analysis issues many back-to-back generate calls, so reusing sockets avoids
+// a fresh TCP (and TLS for remote endpoints) handshake on every request
+const ollamaHttpAgent = new http.Agent({ keepAlive: true, maxSockets: 16, maxFreeSockets: 8 });
+const ollamaHttpsAgent = new https.Agent({ keepAlive: true, maxSockets: 16, maxFreeSockets: 8 });
+
+export const ollamaHttp = axios.create({
+  httpAgent: ollamaHttpAgent,
+  httpsAgent: ollamaHttpsAgent,
+  headers: { Connection: 'keep-alive' },
+});
+
 @Injectable()
-export class OllamaService {
+export class OllamaService implements OnModuleDestroy {
   private readonly logger = new Logger(OllamaService.name);
   private defaultEndpoint = 'http://localhost:11434';
 
   // Model keep-alive tracking
   private loadedModels = new Map<string, { endpoint: string; lastUsed: Date; unloadTimer?: NodeJS.Timeout }>();
-  private readonly KEEP_ALIVE_DURATION = 5 * 60 * 1000; // 5 minutes in milliseconds
+  private readonly KEEP_ALIVE_DURATION = OLLAMA_KEEP_ALIVE.ms; // 30 minutes unless OLLAMA_KEEP_ALIVE says otherwise; null = no idle unload
+
+  // Successful model checks, keyed by endpoint:model -> time of check
+  private modelCheckCache = new Map<string, number>();
+  private readonly MODEL_CHECK_TTL = 10 * 60 * 1000; // 10 minutes in milliseconds
+
+  // Recent /api/tags lookups, keyed by endpoint -> fetch time and pending model list
+  // The connection check, model list and model check often ask back to back
+  private tagsCache = new Map<string, { fetchedAt: number; models: Promise<any[]> }>();
+  private readonly TAGS_CACHE_TTL = 30 * 1000; // 30 seconds in milliseconds
+
+  /**
+   * Fetch the model list from /api/tags, sharing recent and in-flight requests
+   * Failures aren't cached, so a server that comes back up is seen immediately
+   */
+  private fetchTags(url: string): Promise<any[]> {
+    const cached = this.tagsCache.get(url);
+    if (cached && Date.now() - cached.fetchedAt < this.TAGS_CACHE_TTL) {
+      return cached.models;
+    }
+
+    const models = ollamaHttp
+      .get<OllamaModelList>(`${url}/api/tags`, { timeout: 5000 })
+      .then((response) => response.data.models || []);
+    this.tagsCache.set(url, { fetchedAt: Date.now(), models });
+    models.catch(() => {
+      if (this.tagsCache.get(url)?.models === models) {
+        this.tagsCache.delete(url);
+      }
+    });
+    return models;
+  }
 
   /**
    * Check if Ollama is running and accessible
@@ -28,8 +139,8 @@ export class OllamaService {
   async checkConnection(endpoint?: string): Promise<boolean> {
     const url = endpoint || this.defaultEndpoint;
     try {
-      const response = await axios.get(`${url}/api/tags`, { timeout: 5000 });
-      return response.status === 200;
+      await this.fetchTags(url);
+      return true;
     } catch (error: any) {
       this.logger.warn(`Cannot connect to Ollama at ${url}: ${(error as Error).message || 'Unknown error'}`);
 
@@ -38,13 +149,11 @@ export class OllamaService {
         const fallbackUrl = url.replace('localhost', '127.0.0.1');
         try {
           this.logger.log(`Trying fallback: ${fallbackUrl}`);
-          const fallbackResponse = await axios.get(`${fallbackUrl}/api/tags`, { timeout: 5000 });
-          if (fallbackResponse.status === 200) {
-            // Update default endpoint to use 127.0.0.1
-            this.defaultEndpoint = fallbackUrl;
-            this.logger.log(`Ollama responding at ${fallbackUrl}, updated default endpoint`);
-            return true;
-          }
+          await this.fetchTags(fallbackUrl);
+          // Update default endpoint to use 127.0.0.1
+          this.defaultEndpoint = fallbackUrl;
+          this.logger.log(`Ollama responding at ${fallbackUrl}, updated default endpoint`);
+          return true;
         } catch (fallbackError: any) {
           this.logger.warn(`Fallback also failed: ${(fallbackError as Error).message || 'Unknown error'}`);
         }
@@ -60,19 +169,61 @@ export class OllamaService {
   async listModels(endpoint?: string): Promise<OllamaModel[]> {
     const url = endpoint || this.defaultEndpoint;
     try {
-      const response = await axios.get<OllamaModelList>(`${url}/api/tags`, {
-        timeout: 5000,
-      });
-      return response.data.models || [];
+      return await this.fetchTags(url);
     } catch (error: any) {
       this.logger.error(`Failed to list Ollama models: ${(error as Error).message || 'Unknown error'}`);
       throw new Error(`Cannot connect to Ollama at ${url}`);
     }
   }
 
+  /**
+   * If the model is a full precision or 8-bit tag and a Q5_K_M/Q4_K_M tag of the
+   * same model, variant and size is installed, return that tag; otherwise the model itself
+   */
+  async resolvePreferredModel(modelName: string, endpoint?: string): Promise<string> {
+    const setting = (process.env.PREFER_QUANTIZED_OLLAMA_MODELS || '').toLowerCase();
+    if (setting === 'false' || setting === '0') {
+      return modelName;
+    }
+
+    const url = endpoint || this.defaultEndpoint;
+    let models: OllamaModel[];
+    try {
+      models = await this.fetchTags(url);
+    } catch {
+      return modelName; // The availability check reports connection problems
+    }
+
+    const requested = models.find((m) => m.name === modelName || m.name === `${modelName}:latest`);
+    const level = requested?.details?.quantization_level?.toUpperCase();
+    if (!requested || !level || !HIGH_PRECISION_QUANTIZATIONS.has(level)) {
+      return modelName;
+    }
+
+    // Only the precision may differ: "8b-instruct-fp16" can become "8b-instruct-q4_K_M"
+    // but never "8b-text-q4_K_M", which is a different (base) model
+    const variantKey = modelVariantKey(requested.name);
+    const parameterSize = requested.details?.parameter_size;
+    for (const quantization of PREFERRED_QUANTIZATIONS) {
+      const variant = models.find((m) =>
+        modelVariantKey(m.name) === variantKey &&
+        m.details?.parameter_size === parameterSize &&
+        m.details?.quantization_level?.toUpperCase() === quantization,
+      );
+      if (variant) {
+        this.logger.log(`[Model Check] Using ${variant.name} (${quantization}) instead of ${modelName} (${level})`);
+        return variant.name;
+      }
+    }
+
+    return modelName;
+  }
+
   /**
    * Check if a specific model is available
-   * Uses ContentStudio's approach: actually test the model with a simple request
+   * Trusts Ollama's model list when it has full model details; only falls back
+   * to reading the model's metadata with /api/show when it doesn't.
+   * Successful checks are cached for MODEL_CHECK_TTL
    */
   async isModelAvailable(
     modelName: string,
@@ -80,6 +231,13 @@ export class OllamaService {
   ): Promise<boolean> {
     const url = endpoint || this.defaultEndpoint;
     const startTime = Date.now();
+    const cacheKey = `${url}:${modelName}`;
+
+    const lastChecked = this.modelCheckCache.get(cacheKey);
+    if (lastChecked !== undefined && startTime - lastChecked < this.MODEL_CHECK_TTL) {
+      this.logger.log(`[Model Check] ✓ Model ${modelName} verified ${Math.round((startTime - lastChecked) / 1000)}s ago, skipping check`);
+      return true;
+    }
 
     try {
       this.logger.log(`[Model Check] Testing availability for: ${modelName}`);
@@ -89,23 +247,30 @@ export class OllamaService {
       // First check if Ollama server is reachable
       try {
         this.logger.log(`[Model Check] Step 1: Checking Ollama server connection...`);
-        const tagsResponse = await axios.get(`${url}/api/tags`, { timeout: 5000 });
-        this.logger.log(`[Model Check] ✓ Ollama server is reachable (HTTP ${tagsResponse.status})`);
+        const models = await this.fetchTags(url);
+        this.logger.log(`[Model Check] ✓ Ollama server is reachable`);
 
         // List available models for debugging
-        const models = tagsResponse.data.models || [];
         const modelNames = models.map((m: any) => m.name);
         this.logger.log(`[Model Check] Available models in Ollama: ${modelNames.join(', ')}`);
 
         // Check if model name exists in list
-        const modelExists = modelNames.includes(modelName) || modelNames.includes(`${modelName}:latest`);
-        if (!modelExists) {
+        const modelInfo = models.find((m: any) => m.name === modelName || m.name === `${modelName}:latest`);
+        if (!modelInfo) {
           this.logger.error(`[Model Check] ✗ Model "${modelName}" not found in Ollama model list`);
           this.logger.error(`[Model Check] Please run: ollama pull ${modelName}`);
           return false;
         }
         this.logger.log(`[Model Check] ✓ Model "${modelName}" found in Ollama model list`);
 
+        // A listed model with populated details is intact on disk; any load
+        // error will surface on the first real prompt, so skip the test generate
+        // (which costs a full cold load when the model isn't resident)
+        if (modelInfo.details?.family) {
+          this.modelCheckCache.set(cacheKey, Date.now());
+          return true;
+        }
+
       } catch (serverError: any) {
         this.logger.error(`[Model Check] ✗ Cannot connect to Ollama server at ${url}`);
         this.logger.error(`[Model Check] Error: ${serverError.message}`);
@@ -113,25 +278,22 @@ export class OllamaService {
         return false;
       }
 
-      // Test model with simple prompt (ContentStudio's approach)
-      this.logger.log(`[Model Check] Step 2: Testing model response with generate request...`);
-      const response = await axios.post(
-        `${url}/api/generate`,
-        {
-          model: modelName,
-          prompt: 'Ready.',
-          stream: false,
-          keep_alive: '5m',  // Keep model loaded for 5 minutes after check
-          options: { num_predict: 5 }
-        },
-        { timeout: 300000 } // 300 second (5 minute) timeout to allow large model loading
+      // Confirm the model's manifest and metadata parse with /api/show, which
+      // doesn't load weights; loading starts in the background so it overlaps
+      // with whatever the caller does before its first prompt
+      this.logger.log(`[Model Check] Step 2: Reading model metadata with show request...`);
+      const response = await ollamaHttp.post(
+        `${url}/api/show`,
+        { model: modelName, name: modelName },  // 'name' for older Ollama versions
+        { timeout: 10000 }
       );
 
       const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
 
       if (response.status === 200) {
-        this.logger.log(`[Model Check] ✓ Model ${modelName} is available and responding (took ${elapsedTime}s)`);
-        this.logger.log(`[Model Check] Response: ${JSON.stringify(response.data).substring(0, 100)}...`);
+        this.modelCheckCache.set(cacheKey, Date.now());
+        this.logger.log(`[Model Check] ✓ Model ${modelName} is available (took ${elapsedTime}s)`);
+        this.preloadModel(modelName, endpoint).catch(() => undefined); // Logged by preloadModel
         return true;
       } else {
         this.logger.error(`[Model Check] ✗ Model ${modelName} returned unexpected status ${response.status}`);
@@ -141,9 +303,8 @@ export class OllamaService {
       const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
 
       if (error.code === 'ECONNABORTED' || error.code === 'ETIMEDOUT') {
-        this.logger.error(`[Model Check] ✗ Model ${modelName} loading timed out after ${elapsedTime}s`);
-        this.logger.error(`[Model Check] This model may be too large or Ollama may be busy`);
-        this.logger.error(`[Model Check] Try a smaller model like qwen2.5:7b or llama3.2:3b`);
+        this.logger.error(`[Model Check] ✗ Model ${modelName} check timed out after ${elapsedTime}s`);
+        this.logger.error(`[Model Check] Ollama may be busy`);
       } else if (error.code === 'ECONNREFUSED') {
         this.logger.error(`[Model Check] ✗ Connection refused to Ollama at ${url}`);
         this.logger.error(`[Model Check] Make sure Ollama is running`);
@@ -205,7 +366,8 @@ Current model status: Not installed
 
   /**
    * Preload a model to keep it in memory
-   * This sends a simple request to warm up the model
+   * A generate request without a prompt makes Ollama load the model and return
+   * immediately, without spending time evaluating a prompt or sampling tokens
    */
   async preloadModel(modelName: string, endpoint?: string): Promise<void> {
     const url = endpoint || this.defaultEndpoint;
@@ -214,15 +376,14 @@ Current model status: Not installed
     this.logger.log(`[Keep-Alive] Preloading model: ${modelName} at ${url}`);
 
     try {
-      // Send a simple request to load the model into memory
-      await axios.post(
+      // Send an empty request to load the model into memory
+      await ollamaHttp.post(
         `${url}/api/generate`,
         {
           model: modelName,
-          prompt: 'Ready.',
+          prompt: '',
           stream: false,
-          keep_alive: '5m',  // Keep model loaded for 5 minutes
-          options: { num_predict: 1 }
+          keep_alive: OLLAMA_KEEP_ALIVE.value,  // Keep model loaded between analysis steps
         },
         { timeout: 300000 } // 5 minute timeout for large models
       );
@@ -251,12 +412,7 @@ Current model status: Not installed
     }
 
     // Set up new keep-alive timer
-    const unloadTimer = setTimeout(() => {
-      this.logger.log(`[Keep-Alive] Model ${modelName} idle timeout reached, unloading...`);
-      this.unloadModel(modelName, endpoint).catch(err => {
-        this.logger.warn(`[Keep-Alive] Failed to unload idle model ${modelName}: ${err.message}`);
-      });
-    }, this.KEEP_ALIVE_DURATION);
+    const unloadTimer = this.scheduleUnload(modelName, endpoint);
 
     this.loadedModels.set(modelKey, {
       endpoint: url,
@@ -264,7 +420,49 @@ Current model status: Not installed
       unloadTimer
     });
 
-    this.logger.log(`[Keep-Alive] Model ${modelName} registered as loaded (will unload after ${this.KEEP_ALIVE_DURATION / 60000} minutes of inactivity)`);
+    this.logger.log(`[Keep-Alive] Model ${modelName} registered as loaded (${this.describeKeepAlive()})`);
+  }
+
+  /**
+   * How long an idle model stays loaded, for log messages
+   */
+  describeKeepAlive(): string {
+    return this.KEEP_ALIVE_DURATION === null
+      ? `kept loaded per OLLAMA_KEEP_ALIVE=${OLLAMA_KEEP_ALIVE.value}`
+      : `will unload after ${this.KEEP_ALIVE_DURATION / 60000} minutes of inactivity`;
+  }
+
+  /**
+   * Start the idle timer that unloads a model after KEEP_ALIVE_DURATION
+   * No timer when the keep-alive is indefinite (or left to the server)
+   */
+  private scheduleUnload(modelName: string, endpoint?: string): NodeJS.Timeout | undefined {
+    if (this.KEEP_ALIVE_DURATION === null) {
+      return undefined;
+    }
+    return setTimeout(() => {
+      this.logger.log(`[Keep-Alive] Model ${modelName} idle timeout reached, unloading...`);
+      this.unloadModel(modelName, endpoint).catch(err => {
+        this.logger.warn(`[Keep-Alive] Failed to unload idle model ${modelName}: ${err.message}`);
+      });
+    }, this.KEEP_ALIVE_DURATION);
+  }
+
+  /**
+   * Record that a loaded model was just used, restarting its idle timer
+   * Unlike touchModel this makes no request - the generate call itself
+   * already refreshed Ollama's own keep-alive
+   */
+  markModelUsed(modelName: string, endpoint?: string): void {
+    const url = endpoint || this.defaultEndpoint;
+    const existing = this.loadedModels.get(`${url}:${modelName}`);
+    if (!existing) return;
+
+    if (existing.unloadTimer) {
+      clearTimeout(existing.unloadTimer);
+    }
+    existing.unloadTimer = this.scheduleUnload(modelName, endpoint);
+    existing.lastUsed = new Date();
   }
 
   /**
@@ -284,13 +482,13 @@ Current model status: Not installed
 
     // Send a keep-alive request to Ollama to refresh ITS timer too
     try {
-      await axios.post(
+      await ollamaHttp.post(
         `${url}/api/generate`,
         {
           model: modelName,
           prompt: '',
           stream: false,
-          keep_alive: '5m',  // Refresh Ollama's keep-alive timer
+          keep_alive: OLLAMA_KEEP_ALIVE.value,  // Refresh Ollama's keep-alive timer
           options: { num_predict: 0 }  // Don't generate anything
         },
         { timeout: 10000 }
@@ -307,12 +505,7 @@ Current model status: Not installed
     }
 
     // Set up new timer
-    const unloadTimer = setTimeout(() => {
-      this.logger.log(`[Keep-Alive] Model ${modelName} idle timeout reached, unloading...`);
-      this.unloadModel(modelName, endpoint).catch(err => {
-        this.logger.warn(`[Keep-Alive] Failed to unload idle model ${modelName}: ${err.message}`);
-      });
-    }, this.KEEP_ALIVE_DURATION);
+    const unloadTimer = this.scheduleUnload(modelName, endpoint);
 
     this.loadedModels.set(modelKey, {
       endpoint: url,
@@ -343,7 +536,7 @@ Current model status: Not installed
       this.loadedModels.delete(modelKey);
 
       // Tell Ollama to unload the model by setting keep_alive to 0
-      await axios.post(
+      await ollamaHttp.post(
         `${url}/api/generate`,
         {
           model: modelName,
@@ -439,7 +632,7 @@ Current model status: Not installed
     this.logger.log(`[Ollama Pull] Starting download of model: ${modelName}`);
 
     try {
-      const response = await axios.post(
+      const response = await ollamaHttp.post(
         `${url}/api/pull`,
         { name: modelName },
         {
@@ -469,6 +662,8 @@ Current model status: Not installed
 
               // Check for completion or error
               if (data.status === 'success') {
+                // The model list just changed
+                this.tagsCache.delete(url);
                 resolve();
               } else if (data.error) {
                 reject(new Error(data.error));
@@ -480,6 +675,7 @@ Current model status: Not installed
         });
 
         response.data.on('end', () => {
+          this.tagsCache.delete(url);
           this.logger.log(`[Ollama Pull] Model ${modelName} downloaded successfully`);
           resolve();
         });
@@ -496,7 +692,7 @@ Current model status: Not installed
   }
 
   /**
-   * Cleanup all timers (call on service shutdown)
+   * Cleanup all timers and pooled sockets (call on service shutdown)
    */
   onModuleDestroy(): void {
     this.logger.log('[Keep-Alive] Cleaning up all model keep-alive timers');
@@ -506,5 +702,7 @@ Current model status: Not installed
       }
     }
     this.loadedModels.clear();
+    ollamaHttpAgent.destroy();
+    ollamaHttpsAgent.destroy();
   }
 }
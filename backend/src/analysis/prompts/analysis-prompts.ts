@@ -195,12 +195,14 @@ export function buildBoundaryDetectionPrompt(
     }
   }
 
+  // Fixed instructions first and per-chunk context last, so consecutive chunks share a
+  // long prompt prefix the server can keep in its KV cache instead of re-evaluating
   return `Mark where the topic/subject changes in this transcript.
-${titleContext}${durationContext}${prevContext}
+
 Rules:
 - Only mark SIGNIFICANT topic changes, not minor tangents
 ${shortVideoGuidance}- Return the exact phrase (3-8 words) where each new topic begins
-${isFirstChunk ? '- Do NOT include the very first words (chapter 1 starts automatically at 0:00)\n' : ''}- Also summarize what topic this section ends with (for context to next chunk)
+- Also summarize what topic this section ends with (for context to next chunk)
 
 Return JSON:
 {
@@ -209,7 +211,8 @@ Return JSON:
 }
 
 If no topic changes occur, return: {"boundaries": [], "end_topic": "..."}
-
+${isFirstChunk ? 'Do NOT include the very first words (chapter 1 starts automatically at 0:00)\n' : ''}
+${titleContext}${durationContext}${prevContext}
 Transcript:
 ${chunkText}`;
 }
@@ -311,7 +314,7 @@ DETECTION SENSITIVITY: ${granularity}/10 - ${granularityInstr.approach}
 
 FLAGS RULES:
 1. ${granularityInstr.rule}
-2. "quote" = copy/paste exact words from TRANSCRIPT above. Do NOT paraphrase or summarize.
+2. "quote" = copy/paste exact words from the TRANSCRIPT. Do NOT paraphrase or summarize.
 3. Each unique quote gets exactly ONE flag with ONE category. Never flag the same quote twice.
 4. category should be one of: ${categoryNames}
    - OR create a new category if content doesn't fit (use lowercase-with-dashes, e.g., "cult-tactics")
@@ -335,10 +338,10 @@ RIGHT: One flag per quote, one category (existing or new), exact transcript word
 
   const flagsListItem = hasCategories ? '\n- flags: array of problematic quotes' : '';
 
+  // Instructions that are identical for every chapter come first, then the per-video
+  // context, then what changes per chapter, so each request reuses the cached prefix
   return `Analyze this transcript chapter.${hasCategories ? ' ' + granularityInstr.approach : ''}
-Video: ${videoTitle}
-Chapter: ${chapterNumber}
-${prevContext}${customContext}
+
 Return JSON with:
 - title: 1-3 sentence description
 - summary: 2-3 sentence summary${flagsListItem}${categorySection}
@@ -349,6 +352,9 @@ JSON format:
   "summary": "..."${flagsInstruction}
 }${flagsNote}
 
+Video: ${videoTitle}
+${customContext}Chapter: ${chapterNumber}
+${prevContext}
 TRANSCRIPT:
 ${chapterText}`;
 }
@@ -408,6 +414,31 @@ Good examples (DO NOT copy these names - identify speakers from the actual chapt
 
 Output ONLY the filename, nothing else:`;
 
+// Description, tags and title in one request - used instead of the three
+// prompts above so the chapter list is only sent (and evaluated) once
+export const METADATA_FROM_CHAPTERS_PROMPT = `Describe this video, extract its people and topics, and suggest a filename, based on its chapters.
+
+Video title: {videoTitle}
+
+Chapters:
+{chaptersList}
+
+Rules:
+- description: 2-3 sentences describing what the video covers; be specific about the content, not generic
+- people: proper names only (from chapter content)
+- topics: 3-8 themes, 1-3 words each, title case
+- title: a filename, lowercase, spaces allowed, max 80 chars
+  - Format: "[speaker name] - [key quote or action]" or "[speaker] on [topic] - [notable statement]"
+  - Lead with the main speaker's name if identifiable FROM THE CHAPTERS; otherwise use a descriptive title without a name
+  - Include the most notable/quotable phrase; be specific about what was SAID, not just the topic
+  - No dates, extensions, special chars, or parentheses
+  - Example (DO NOT copy this name): "pastor claims democrats are demonic and voting for them is sinful"
+
+Return JSON:
+{"description": "...", "people": ["Name"], "topics": ["Topic"], "title": "..."}
+
+JSON:`;
+
 // =============================================================================
 // DEFAULT PROMPTS EXPORT
 // =============================================================================
@@ -425,13 +456,15 @@ export const DEFAULT_PROMPTS = {
 // =============================================================================
 // Replaces {placeholder} tokens in prompt templates with actual values
 
+// Matches any {placeholder} token; compiled once and applied in a single pass
+const PLACEHOLDER_REGEX = /\{(\w+)\}/g;
+
 export function interpolatePrompt(
   template: string,
   values: Record<string, string>,
 ): string {
-  let result = template;
-  for (const [key, value] of Object.entries(values)) {
-    result = result.replace(new RegExp(`\\{${key}\\}`, 'g'), value);
-  }
-  return result;
+  // Unknown tokens (and JSON braces in the examples) are left as they are
+  return template.replace(PLACEHOLDER_REGEX, (match, key: string) =>
+    Object.prototype.hasOwnProperty.call(values, key) ? values[key] : match,
+  );
 }
@@ -8,7 +8,7 @@ import {
 } from '@nestjs/common';
 import { DatabaseService } from '../database/database.service';
 import { MediaEventService } from '../media/media-event.service';
-import { AIAnalysisService } from './ai-analysis.service';
+import { AIAnalysisService, parseSrtToSegments } from './ai-analysis.service';
 import * as path from 'path';
 import * as fs from 'fs/promises';
 
@@ -130,11 +130,11 @@ export class SimpleAnalyzeController {
 
       // Strip provider prefix from model name if present (e.g., "ollama:cogito:14b" -> "cogito:14b")
       let cleanModelName = aiModel;
-      if (aiModel.includes(':')) {
-        const parts = aiModel.split(':');
+      const colonIndex = aiModel.indexOf(':');
+      if (colonIndex > 0) {
         // If first part matches provider, strip it
-        if (aiProvider && parts[0] === aiProvider) {
-          cleanModelName = parts.slice(1).join(':');
+        if (aiProvider && aiModel.substring(0, colonIndex) === aiProvider) {
+          cleanModelName = aiModel.substring(colonIndex + 1);
           this.logger.log(`Stripped model name: ${aiModel} -> ${cleanModelName}`);
         }
       }
@@ -151,6 +151,7 @@ export class SimpleAnalyzeController {
         claudeApiKey,
         openaiApiKey,
         ollamaEndpoint,
+        !!existingAnalysis,
       );
 
       return {
@@ -183,6 +184,7 @@ export class SimpleAnalyzeController {
     claudeApiKey?: string,
     openaiApiKey?: string,
     ollamaEndpoint: string = 'http://localhost:11434',
+    reanalyzing: boolean = false,
   ): Promise<void> {
     const abortController = new AbortController();
     this.activeAnalyses.set(videoId, abortController);
@@ -203,7 +205,7 @@ export class SimpleAnalyzeController {
       }
 
       // Parse SRT to segments
-      const segments = this.parseSrtToSegments(transcript.srt_format);
+      const segments = parseSrtToSegments(transcript.srt_format);
 
       // Create temp output file path
       const os = require('os');
@@ -226,6 +228,8 @@ export class SimpleAnalyzeController {
         categories,
         apiKey: aiProvider === 'claude' ? claudeApiKey : aiProvider === 'openai' ? openaiApiKey : undefined,
         ollamaEndpoint,
+        // Re-analysis means the earlier answers weren't wanted; don't serve them from cache
+        bypassCache: reanalyzing,
         onProgress: (progress) => {
           // Map progress (0-100) to our progress range (0-95)
           const mappedProgress = Math.round((progress.progress / 100) * 95);
@@ -238,8 +242,7 @@ export class SimpleAnalyzeController {
         },
       });
 
-      // Read analysis text from output file
-      const analysisText = await fs.readFile(outputFile, 'utf-8');
+      const analysisText = analysisResult.report;
 
       // Extract results
       const result = {
@@ -366,55 +369,6 @@ export class SimpleAnalyzeController {
     }
   }
 
-  /**
-   * Parse SRT format to segments array (for AI analysis timestamp correlation)
-   */
-  private parseSrtToSegments(srtContent: string): any[] {
-    const segments: any[] = [];
-
-    if (!srtContent || typeof srtContent !== 'string') {
-      this.logger.warn('[parseSrtToSegments] SRT content is undefined or not a string');
-      return segments;
-    }
-
-    const blocks = srtContent.split('\n\n').filter(b => b.trim());
-
-    for (const block of blocks) {
-      const lines = block.split('\n');
-      if (lines.length < 3) continue;
-
-      // Line 0: sequence number
-      // Line 1: timestamp (00:00:01,500 --> 00:00:04,200)
-      // Line 2+: text
-      const timestampLine = lines[1];
-      const textLines = lines.slice(2);
-
-      const match = timestampLine.match(/(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/);
-      if (match) {
-        const startHours = parseInt(match[1]);
-        const startMinutes = parseInt(match[2]);
-        const startSeconds = parseInt(match[3]);
-        const startMs = parseInt(match[4]);
-
-        const endHours = parseInt(match[5]);
-        const endMinutes = parseInt(match[6]);
-        const endSeconds = parseInt(match[7]);
-        const endMs = parseInt(match[8]);
-
-        const start = startHours * 3600 + startMinutes * 60 + startSeconds + startMs / 1000;
-        const end = endHours * 3600 + endMinutes * 60 + endSeconds + endMs / 1000;
-
-        segments.push({
-          start,
-          end,
-          text: textLines.join(' ')
-        });
-      }
-    }
-
-    return segments;
-  }
-
   /**
    * Sanitize filename for safe file system usage
    */
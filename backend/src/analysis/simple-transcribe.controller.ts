@@ -109,8 +109,8 @@ export class SimpleTranscribeController {
       // Read the SRT file content
       const srtContent = await fs.readFile(srtPath, 'utf-8');
 
-      // Normalize line endings: convert \r\n (Windows) to \n (Unix)
-      const normalizedSrt = srtContent.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
+      // Normalize line endings: convert \r\n (Windows) and \r to \n (Unix) in one pass
+      const normalizedSrt = srtContent.replace(/\r\n?/g, '\n');
 
       // Convert SRT to plain text (remove timestamps)
       const plainText = normalizedSrt
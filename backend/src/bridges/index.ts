@@ -74,6 +74,7 @@ export {
   type LlamaConfig,
   type LlamaProgress,
   type LlamaServerStatus,
+  type LlamaGenerateOptions,
   type LlamaGenerateResult,
 } from './llama-bridge';
 
@@ -31,11 +31,18 @@ export interface LlamaServerStatus {
   uptime?: number;
 }
 
+export interface LlamaGenerateOptions {
+  maxTokens?: number;  // Cap on generated tokens (default 4096)
+  // Streams the response and stops generating as soon as this returns true for a piece of text
+  shouldStop?: (text: string) => boolean;
+}
+
 export interface LlamaGenerateResult {
   text: string;
   inputTokens: number;
   outputTokens: number;
   totalTokens: number;
+  stoppedEarly?: boolean;
 }
 
 export class LlamaBridge extends EventEmitter {
@@ -342,7 +349,7 @@ export class LlamaBridge extends EventEmitter {
   /**
    * Generate text using the server's OpenAI-compatible API
    */
-  async generateText(prompt: string): Promise<LlamaGenerateResult> {
+  async generateText(prompt: string, options: LlamaGenerateOptions = {}): Promise<LlamaGenerateResult> {
     // Ensure server is running
     if (!this.isServerReady()) {
       await this.startServer();
@@ -353,6 +360,7 @@ export class LlamaBridge extends EventEmitter {
 
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), this.REQUEST_TIMEOUT_MS);
+    const stream = !!options.shouldStop;
 
     try {
       const response = await fetch(`http://localhost:${this.config.port}/v1/chat/completions`, {
@@ -361,32 +369,27 @@ export class LlamaBridge extends EventEmitter {
         body: JSON.stringify({
           model: 'cogito-8b',
           messages: [{ role: 'user', content: prompt }],
-          max_tokens: 4096,
+          max_tokens: options.maxTokens ?? 4096,
           temperature: 0.7,
+          stream,
         }),
         signal: controller.signal,
       });
 
-      clearTimeout(timeout);
-
       if (!response.ok) {
+        clearTimeout(timeout);
         const errorText = await response.text();
         throw new Error(`Llama server error: ${response.status} - ${errorText}`);
       }
 
-      const data = await response.json();
-      const text = data.choices?.[0]?.message?.content || '';
-      const inputTokens = data.usage?.prompt_tokens || 0;
-      const outputTokens = data.usage?.completion_tokens || 0;
+      const result = stream
+        ? await this.readCompletionStream(response, controller, options.shouldStop!, prompt)
+        : await this.readCompletion(response);
 
+      clearTimeout(timeout);
       this.emitProgress('ready', 100, 'Generation complete');
 
-      return {
-        text,
-        inputTokens,
-        outputTokens,
-        totalTokens: inputTokens + outputTokens,
-      };
+      return result;
     } catch (error: any) {
       clearTimeout(timeout);
 
@@ -395,15 +398,128 @@ export class LlamaBridge extends EventEmitter {
       }
 
       // If fetch failed, server might have crashed
+      // A dropped connection alone doesn't mean that, and marking it down makes the next
+      // request restart the server and reload the whole model, so confirm with /health first
       if (error.code === 'ECONNREFUSED' || error.message?.includes('fetch failed')) {
-        this.isReady = false;
-        throw new Error('Server connection failed - it may have crashed due to memory pressure');
+        if (!(await this.isServerResponsive())) {
+          this.isReady = false;
+          throw new Error('Server connection failed - it may have crashed due to memory pressure');
+        }
+        throw new Error(`Request to local AI server failed: ${error.message}`);
       }
 
       throw error;
     }
   }
 
+  /**
+   * Read a non-streamed chat completion response
+   */
+  private async readCompletion(response: Response): Promise<LlamaGenerateResult> {
+    const data = await response.json();
+    const text = data.choices?.[0]?.message?.content || '';
+    const inputTokens = data.usage?.prompt_tokens || 0;
+    const outputTokens = data.usage?.completion_tokens || 0;
+
+    return {
+      text,
+      inputTokens,
+      outputTokens,
+      totalTokens: inputTokens + outputTokens,
+    };
+  }
+
+  /**
+   * Read a streamed chat completion (server-sent events, one "data: {...}" line per token)
+   * Closing the connection once shouldStop fires makes llama-server stop generating,
+   * so output the caller would throw away is never produced
+   */
+  private async readCompletionStream(
+    response: Response,
+    controller: AbortController,
+    shouldStop: (text: string) => boolean,
+    prompt: string,
+  ): Promise<LlamaGenerateResult> {
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    let streamedTokens = 0;
+    let usage: { prompt_tokens?: number; completion_tokens?: number } | undefined;
+    let stoppedEarly = false;
+
+    read: for await (const chunk of response.body as unknown as AsyncIterable<Uint8Array>) {
+      buffer += decoder.decode(chunk, { stream: true });
+
+      let lineStart = 0;
+      let newline: number;
+      while ((newline = buffer.indexOf('\n', lineStart)) !== -1) {
+        const line = buffer.substring(lineStart, newline).trim();
+        lineStart = newline + 1;
+        if (!line.startsWith('data:')) continue;
+
+        const payload = line.substring(5).trim();
+        if (payload === '[DONE]') break read;
+
+        let data: any;
+        try {
+          data = JSON.parse(payload);
+        } catch {
+          this.logger.warn(`Failed to parse stream line: ${payload.substring(0, 100)}`);
+          continue;
+        }
+
+        if (data.usage) {
+          usage = data.usage;
+        }
+
+        const content: string | undefined = data.choices?.[0]?.delta?.content;
+        if (content) {
+          text += content;
+          streamedTokens++;
+
+          if (shouldStop(content)) {
+            stoppedEarly = true;
+            break read;
+          }
+        }
+      }
+      buffer = buffer.substring(lineStart);
+    }
+
+    if (stoppedEarly) {
+      controller.abort();
+    }
+
+    // Usage only arrives on the final event, so estimate it when generation was cut short
+    const inputTokens = usage?.prompt_tokens || Math.ceil(prompt.length / 4);
+    const outputTokens = usage?.completion_tokens || streamedTokens;
+
+    return {
+      text,
+      inputTokens,
+      outputTokens,
+      totalTokens: inputTokens + outputTokens,
+      stoppedEarly,
+    };
+  }
+
+  /**
+   * Check whether the running server still answers its health endpoint
+   */
+  private async isServerResponsive(): Promise<boolean> {
+    if (!this.serverProcess || this.serverProcess.exitCode !== null) {
+      return false;
+    }
+    try {
+      const response = await fetch(`http://localhost:${this.config.port}/health`, {
+        signal: AbortSignal.timeout(2000),
+      });
+      return response.ok;
+    } catch {
+      return false;
+    }
+  }
+
   /**
    * Emit a progress event
    */
@@ -11,6 +11,7 @@ import {
   LlamaBridge,
   type LlamaProgress,
   type LlamaServerStatus,
+  type LlamaGenerateOptions,
   type LlamaGenerateResult,
 } from './llama-bridge';
 import { getRuntimePaths, getLlamaLibraryPath } from './runtime-paths';
@@ -177,7 +178,7 @@ export class LlamaManager extends EventEmitter implements OnModuleDestroy {
   /**
    * Generate text using the local AI
    */
-  async generateText(prompt: string): Promise<LlamaGenerateResult> {
+  async generateText(prompt: string, options: LlamaGenerateOptions = {}): Promise<LlamaGenerateResult> {
     if (!this.isAvailable()) {
       throw new Error('Local AI model not available');
     }
@@ -186,10 +187,11 @@ export class LlamaManager extends EventEmitter implements OnModuleDestroy {
     this.logger.log(`Prompt length: ${prompt.length} characters`);
 
     try {
-      const result = await this.llama.generateText(prompt);
+      const result = await this.llama.generateText(prompt, options);
 
       this.logger.log(
-        `Generation complete: ${result.inputTokens} input + ${result.outputTokens} output = ${result.totalTokens} tokens`
+        `Generation complete: ${result.inputTokens} input + ${result.outputTokens} output = ${result.totalTokens} tokens` +
+        (result.stoppedEarly ? ' (stopped early)' : '')
       );
 
       return result;
@@ -3,11 +3,12 @@
  * Supports multiple concurrent transcription processes with individualized feedback
  */
 
-import { spawn, ChildProcess } from 'child_process';
+import { spawn, spawnSync, ChildProcess } from 'child_process';
 import { EventEmitter } from 'events';
 import * as crypto from 'crypto';
 import * as path from 'path';
 import * as fs from 'fs';
+import * as os from 'os';
 import { Logger } from '@nestjs/common';
 
 export interface WhisperProgress {
@@ -25,8 +26,10 @@ export interface WhisperProcessInfo {
   aborted: boolean;
   lastReportedPercent: number;
   audioDurationSeconds?: number;
+  offsetSeconds?: number;
   progressTimer?: NodeJS.Timeout;
   inferenceStartTime?: number;
+  hasSegmentProgress?: boolean;  // Real progress from printed segments replaces the estimate
 }
 
 export interface WhisperResult {
@@ -45,6 +48,43 @@ export interface WhisperConfig {
   modelsDir: string;
   libraryPath?: string;  // DYLD_LIBRARY_PATH for macOS
   gpuMode?: WhisperGpuMode;  // GPU preference: auto (try GPU, fallback to CPU), gpu (force), cpu (force)
+  preferQuantizedOnCpu?: boolean;  // Use a quantized copy of the model for CPU runs when one exists (default true)
+  vad?: boolean;  // Skip non-speech with whisper.cpp's Silero VAD when its model is in modelsDir (default true)
+}
+
+// Segment line whisper-cli prints to stdout as it decodes; only the end time is captured:
+// "[00:01:02.340 --> 00:01:05.120]  Some text"
+const SEGMENT_LINE_REGEX = /^\[\d+:\d{2}:\d{2}\.\d{3} --> (\d+):(\d{2}):(\d{2})\.(\d{3})\]/;
+
+// Error text that points at the GPU backend rather than the input, built once
+// 3221226505 is Windows STATUS_STACK_BUFFER_OVERRUN, often from GPU issues
+const GPU_ERROR_REGEX = /GGML_ASSERT|device|cuda|gpu|metal|vulkan|3221226505|backend/i;
+
+// whisper.cpp quantized model suffix, e.g. 'q8_0' in ggml-base-q8_0.bin
+// Quantized weights decode faster and use less memory at a small accuracy cost
+const QUANTIZED_MODEL_SUFFIX = /-(q\d+_[0-9a-z]+)$/;
+
+// Quantizations tried for CPU runs, most accurate first: CPU decoding is bound by
+// weight bandwidth, and 8-bit weights are a quarter the size of FP32 with near identical
+// output. The 5 and 4-bit files are smaller still (what low-memory ARM machines ship)
+const CPU_QUANTIZATIONS = ['q8_0', 'q5_1', 'q5_0', 'q4_1', 'q4_0'];
+
+// Silero voice activity model for whisper.cpp, e.g. ggml-silero-v5.1.2.bin
+const VAD_MODEL_REGEX = /^ggml-silero[a-z0-9._-]*\.bin$/i;
+
+/**
+ * Thread count for CPU decoding: WHISPER_THREADS if set, otherwise half the
+ * logical CPUs. os.cpus() counts SMT siblings, which share a core's math units,
+ * so going past the physical core count just adds contention
+ */
+function getCpuThreadCount(): number {
+  const override = parseInt(process.env.WHISPER_THREADS || '', 10);
+  if (override > 0) {
+    return override;
+  }
+  // Never below whisper.cpp's own default of 4, unless there are fewer CPUs than that
+  const logicalCpus = Math.max(1, os.cpus().length);
+  return Math.min(logicalCpus, Math.max(4, Math.floor(logicalCpus / 2)));
 }
 
 export class WhisperBridge extends EventEmitter {
@@ -52,6 +92,10 @@ export class WhisperBridge extends EventEmitter {
   private activeProcesses = new Map<string, WhisperProcessInfo>();
   private readonly logger = new Logger(WhisperBridge.name);
   private gpuFailedOnce = false;  // Track if GPU failed, for auto mode fallback
+  // Resolved model name -> model file, so repeat transcriptions skip the directory scan
+  private resolvedModelPaths = new Map<string, string>();
+  // Silero VAD model file, looked up on first use (null when there isn't one)
+  private vadModelPath: string | null | undefined;
 
   // All known whisper models (for display names)
   // tiny, base, and small are bundled with the app
@@ -61,6 +105,11 @@ export class WhisperBridge extends EventEmitter {
     'tiny': { name: 'Tiny', description: 'Fastest, lower accuracy' },
   };
   static readonly DEFAULT_MODEL = 'base';
+  // Beam search width; 5 is whisper-cli's own default (-bs 5 -bo 5), passed
+  // explicitly so callers can override it
+  static readonly DEFAULT_BEAM_SIZE = 5;
+  // Pauses shorter than this stay inside a speech region, so sentences aren't cut mid-breath
+  static readonly VAD_MIN_SILENCE_MS = 500;
 
   constructor(config: WhisperConfig) {
     super();
@@ -114,6 +163,87 @@ export class WhisperBridge extends EventEmitter {
    * Get path to a specific model file
    */
   getModelPath(modelName: string = WhisperBridge.DEFAULT_MODEL): string {
+    const cached = this.resolvedModelPaths.get(modelName);
+    if (cached && fs.existsSync(cached)) {
+      return cached;
+    }
+
+    const resolved = this.resolveModelPath(modelName);
+    this.resolvedModelPaths.set(modelName, resolved);
+    return resolved;
+  }
+
+  /**
+   * Get the model file to use for a CPU run
+   * Swaps in the most accurate quantized variant of the resolved model that is on disk
+   */
+  getCpuModelPath(modelName: string = WhisperBridge.DEFAULT_MODEL): string {
+    const modelPath = this.getModelPath(modelName);
+    if (this.config.preferQuantizedOnCpu === false) {
+      return modelPath;
+    }
+
+    const baseName = path.basename(modelPath, '.bin');
+    if (QUANTIZED_MODEL_SUFFIX.test(baseName)) {
+      return modelPath;
+    }
+
+    for (const quantization of CPU_QUANTIZATIONS) {
+      const quantizedPath = path.join(this.config.modelsDir, `${baseName}-${quantization}.bin`);
+      if (fs.existsSync(quantizedPath)) {
+        return quantizedPath;
+      }
+    }
+
+    return modelPath;
+  }
+
+  /**
+   * Get the Silero VAD model to pass to whisper-cli, or null to decode all audio
+   * The directory is scanned once; the model is optional and not bundled everywhere,
+   * and builds of whisper-cli from before VAD support reject the --vad flags
+   */
+  getVadModelPath(): string | null {
+    if (this.config.vad === false) {
+      return null;
+    }
+
+    if (this.vadModelPath === undefined) {
+      try {
+        const file = fs.readdirSync(this.config.modelsDir).find((f) => VAD_MODEL_REGEX.test(f));
+        this.vadModelPath = file ? path.join(this.config.modelsDir, file) : null;
+      } catch {
+        this.vadModelPath = null;
+      }
+      if (this.vadModelPath && !this.binarySupportsVad()) {
+        this.logger.warn(`Ignoring VAD model ${path.basename(this.vadModelPath)}: whisper-cli has no --vad option`);
+        this.vadModelPath = null;
+      }
+      if (this.vadModelPath) {
+        this.logger.log(`VAD model: ${path.basename(this.vadModelPath)}`);
+      }
+    }
+
+    return this.vadModelPath;
+  }
+
+  /**
+   * Whether the bundled whisper-cli lists --vad in its usage text
+   */
+  private binarySupportsVad(): boolean {
+    const env = { ...process.env };
+    if (this.config.libraryPath) {
+      env.DYLD_LIBRARY_PATH = `${this.config.libraryPath}:${env.DYLD_LIBRARY_PATH || ''}`;
+    }
+    try {
+      const result = spawnSync(this.config.binaryPath, ['-h'], { encoding: 'utf8', timeout: 10000, env });
+      return `${result.stdout || ''}${result.stderr || ''}`.includes('--vad');
+    } catch {
+      return false;
+    }
+  }
+
+  private resolveModelPath(modelName: string): string {
     let normalizedName = modelName.toLowerCase();
 
     // Strip prefixes/suffixes
@@ -149,6 +279,27 @@ export class WhisperBridge extends EventEmitter {
     return modelPath;
   }
 
+  /**
+   * Read a model file once so the first transcription loads it from the OS page cache
+   * whisper-cli is a fresh process per file and can't keep weights resident, but a
+   * cold disk read of the model is most of its startup cost
+   */
+  async warmModel(modelName: string = WhisperBridge.DEFAULT_MODEL): Promise<void> {
+    // Warm the file the next run will actually load (CPU runs may use a quantized copy)
+    const cpuRun = this.config.gpuMode === 'cpu' || this.gpuFailedOnce;
+    const modelPath = cpuRun ? this.getCpuModelPath(modelName) : this.getModelPath(modelName);
+    const startTime = Date.now();
+
+    await new Promise<void>((resolve, reject) => {
+      fs.createReadStream(modelPath, { highWaterMark: 4 * 1024 * 1024 })
+        .on('data', () => undefined)
+        .on('end', resolve)
+        .on('error', reject);
+    });
+
+    this.logger.log(`Warmed model ${path.basename(modelPath)} in ${Date.now() - startTime}ms`);
+  }
+
   /**
    * Get list of available models on disk (scans directory for ggml-*.bin files)
    */
@@ -163,19 +314,23 @@ export class WhisperBridge extends EventEmitter {
       const models: string[] = [];
 
       for (const file of files) {
-        // Match ggml-{modelname}.bin pattern
-        const match = file.match(/^ggml-([a-z0-9-]+)\.bin$/i);
+        // Match ggml-{modelname}.bin pattern, including quantized files like ggml-base-q8_0.bin
+        const match = file.match(/^ggml-([a-z0-9_-]+)\.bin$/i);
         if (match) {
           models.push(match[1].toLowerCase());
         }
       }
 
       // Sort with 'base' first (default), then 'small' (for complex audio), then others
+      // Quantized variants sort directly after the full precision model they come from
       const sizeOrder = ['base', 'small', 'tiny', 'medium', 'large'];
       models.sort((a, b) => {
-        const aIndex = sizeOrder.indexOf(a);
-        const bIndex = sizeOrder.indexOf(b);
-        if (aIndex === -1 && bIndex === -1) return a.localeCompare(b);
+        const aBase = a.replace(QUANTIZED_MODEL_SUFFIX, '');
+        const bBase = b.replace(QUANTIZED_MODEL_SUFFIX, '');
+        if (aBase === bBase) return a.localeCompare(b);
+        const aIndex = sizeOrder.indexOf(aBase);
+        const bIndex = sizeOrder.indexOf(bBase);
+        if (aIndex === -1 && bIndex === -1) return aBase.localeCompare(bBase);
         if (aIndex === -1) return 1;
         if (bIndex === -1) return -1;
         return aIndex - bIndex;
@@ -193,11 +348,15 @@ export class WhisperBridge extends EventEmitter {
    */
   getAvailableModelsWithInfo(): Array<{ id: string; name: string; description: string }> {
     const models = this.getAvailableModels();
-    return models.map(id => ({
-      id,
-      name: WhisperBridge.MODEL_INFO[id]?.name || id.charAt(0).toUpperCase() + id.slice(1),
-      description: WhisperBridge.MODEL_INFO[id]?.description || 'Whisper model',
-    }));
+    return models.map(id => {
+      const quantization = id.match(QUANTIZED_MODEL_SUFFIX)?.[1];
+      const baseId = quantization ? id.replace(QUANTIZED_MODEL_SUFFIX, '') : id;
+      const name = WhisperBridge.MODEL_INFO[baseId]?.name || baseId.charAt(0).toUpperCase() + baseId.slice(1);
+      const description = WhisperBridge.MODEL_INFO[baseId]?.description || 'Whisper model';
+      return quantization
+        ? { id, name: `${name} (${quantization.toUpperCase()})`, description: `${description}; quantized, faster with less memory` }
+        : { id, name, description };
+    });
   }
 
   /**
@@ -214,6 +373,9 @@ export class WhisperBridge extends EventEmitter {
       language?: string;
       translate?: boolean;
       audioDurationSeconds?: number;  // For time-based progress estimation
+      offsetSeconds?: number;  // Skip this much audio at the start (timestamps stay absolute)
+      beamSize?: number;  // Beam search width (1 = greedy)
+      cpuOnly?: boolean;  // Run on CPU regardless of GPU mode (GPU busy with another file)
     }
   ): Promise<WhisperResult> {
     const processId = options?.processId || crypto.randomBytes(8).toString('hex');
@@ -222,7 +384,7 @@ export class WhisperBridge extends EventEmitter {
     // Determine if we should use GPU
     let useGpu = gpuMode === 'gpu' || (gpuMode === 'auto' && !this.gpuFailedOnce);
 
-    if (gpuMode === 'cpu') {
+    if (gpuMode === 'cpu' || options?.cpuOnly) {
       useGpu = false;
     }
 
@@ -251,24 +413,7 @@ export class WhisperBridge extends EventEmitter {
    * Check if an error is a GPU-related error
    */
   private isGpuError(result: WhisperResult): boolean {
-    if (!result.error) return false;
-
-    const gpuErrorPatterns = [
-      'GGML_ASSERT',
-      'device',
-      'CUDA',
-      'cuda',
-      'GPU',
-      'gpu',
-      'metal',
-      'Metal',
-      'vulkan',
-      'Vulkan',
-      '3221226505',  // Windows STATUS_STACK_BUFFER_OVERRUN often from GPU issues
-      'backend',
-    ];
-
-    return gpuErrorPatterns.some(pattern => result.error?.includes(pattern));
+    return !!result.error && GPU_ERROR_REGEX.test(result.error);
   }
 
   /**
@@ -284,9 +429,13 @@ export class WhisperBridge extends EventEmitter {
       language?: string;
       translate?: boolean;
       audioDurationSeconds?: number;
+      offsetSeconds?: number;
+      beamSize?: number;
     }
   ): Promise<WhisperResult> {
-    const modelPath = this.getModelPath(options?.model);
+    const modelPath = useGpu
+      ? this.getModelPath(options?.model)
+      : this.getCpuModelPath(options?.model);
 
     return new Promise((resolve, reject) => {
       // Prepare output paths
@@ -302,9 +451,36 @@ export class WhisperBridge extends EventEmitter {
         '-pp',                // Print progress
       ];
 
+      // With VAD on, whisper.cpp cuts the audio down to speech before applying an
+      // offset, so -ot would skip speech rather than the leading silence; VAD
+      // drops that silence itself
+      const vadModelPath = this.getVadModelPath();
+
+      // Start decoding past any leading audio the caller wants skipped
+      if (!vadModelPath && options?.offsetSeconds && options.offsetSeconds > 0) {
+        args.push('-ot', String(Math.round(options.offsetSeconds * 1000)));
+      }
+
+      // Beam search decoding
+      const beamSize = options?.beamSize ?? WhisperBridge.DEFAULT_BEAM_SIZE;
+      args.push('-bs', String(beamSize), '-bo', String(beamSize));
+
+      // Drop silence before it reaches the encoder (lectures and sermons are often
+      // a third pauses); whisper.cpp maps segment times back onto the full audio
+      if (vadModelPath) {
+        args.push(
+          '--vad',
+          '--vad-model', vadModelPath,
+          '--vad-min-silence-duration-ms', String(WhisperBridge.VAD_MIN_SILENCE_MS),
+        );
+      }
+
       // Add no-GPU flag if not using GPU
+      // CPU decoding is compute bound, so use more than whisper.cpp's default of 4 threads
+      // where the machine has the cores for it
       if (!useGpu) {
         args.push('-ng');
+        args.push('-t', String(getCpuThreadCount()));
       }
 
       // Optional language specification
@@ -353,6 +529,7 @@ export class WhisperBridge extends EventEmitter {
         aborted: false,
         lastReportedPercent: 0,
         audioDurationSeconds: options?.audioDurationSeconds,
+        offsetSeconds: options?.offsetSeconds,
       };
 
       this.activeProcesses.set(processId, processInfo);
@@ -363,13 +540,20 @@ export class WhisperBridge extends EventEmitter {
         this.startProgressEstimation(processId, options.audioDurationSeconds, useGpu);
       }
 
-      let stdoutBuffer = '';
+      let stdoutLine = '';
       let stderrBuffer = '';
 
       proc.stdout?.on('data', (data: Buffer) => {
         const chunk = data.toString();
-        stdoutBuffer += chunk;
         this.parseProgress(processId, chunk);
+
+        // Segments are printed as soon as they're decoded, so their end times
+        // give real progress line by line instead of waiting for the SRT at the end
+        const lines = (stdoutLine + chunk).split('\n');
+        stdoutLine = lines.pop() || '';
+        for (const line of lines) {
+          this.parseSegmentLine(processId, line);
+        }
       });
 
       proc.stderr?.on('data', (data: Buffer) => {
@@ -556,6 +740,38 @@ export class WhisperBridge extends EventEmitter {
     }
   }
 
+  /**
+   * Derive real progress from a decoded segment's end time
+   */
+  private parseSegmentLine(processId: string, line: string): void {
+    const match = line.trim().match(SEGMENT_LINE_REGEX);
+    if (!match) return;
+
+    const [hours, minutes, seconds, millis] = match.slice(1, 5).map(Number);
+    const segmentEnd = hours * 3600 + minutes * 60 + seconds + millis / 1000;
+
+    const processInfo = this.activeProcesses.get(processId);
+    if (!processInfo?.audioDurationSeconds) return;
+
+    if (!processInfo.hasSegmentProgress) {
+      processInfo.hasSegmentProgress = true;
+      this.stopProgressEstimation(processId);
+    }
+
+    // Same 35%-94% inference range the time-based estimate uses
+    const decoded = segmentEnd - (processInfo.offsetSeconds || 0);
+    const fraction = Math.min(Math.max(decoded, 0) / processInfo.audioDurationSeconds, 1);
+    const percent = Math.min(94, Math.round(35 + fraction * 60));
+    if (percent > processInfo.lastReportedPercent) {
+      processInfo.lastReportedPercent = percent;
+      this.emit('progress', {
+        processId,
+        percent,
+        message: this.getProgressMessage(percent),
+      } as WhisperProgress);
+    }
+  }
+
   /**
    * Get human-readable progress message
    */
@@ -592,7 +808,7 @@ export class WhisperBridge extends EventEmitter {
 
     setTimeout(() => {
       const currentProcessInfo = this.activeProcesses.get(processId);
-      if (!currentProcessInfo || currentProcessInfo.aborted) return;
+      if (!currentProcessInfo || currentProcessInfo.aborted || currentProcessInfo.hasSegmentProgress) return;
 
       // Record when inference estimation starts
       currentProcessInfo.inferenceStartTime = Date.now();
@@ -721,8 +721,10 @@ export class DownloaderService implements OnModuleInit {
         const output = await ytDlpManager.run();
         
         // Try to extract title from the output
-        if (output && output.trim()) {
-          const info = JSON.parse(output.trim());
+        // Trim once: --dump-json output carries the full format list and can be large
+        const json = output ? output.trim() : '';
+        if (json) {
+          const info = JSON.parse(json);
           if (info && info.title) {
             title = info.title;
             this.logger.log(`Successfully fetched info for Reddit post: ${title}`);
@@ -929,8 +931,9 @@ export class DownloaderService implements OnModuleInit {
       try {
         const output = await ytDlpManager.run();
 
-        if (output && output.trim()) {
-          const info = JSON.parse(output.trim());
+        const json = output ? output.trim() : '';
+        if (json) {
+          const info = JSON.parse(json);
 
           if (info && info.title) {
             const title = info.title;
@@ -698,10 +698,14 @@ export class FfmpegService {
 
       // Track start time for ETA calculation
       const normalizationStartTime = Date.now();
+      let lastPercent = -1;
 
       // Set up progress listener
       const progressHandler = (progress: FfmpegProgress) => {
         if (progress.processId !== processId) return;
+        // FFmpeg prints stats a couple of times a second; only send an event when the percent moves
+        if (progress.percent === lastPercent) return;
+        lastPercent = progress.percent;
         // Reserve 5-85% for FFmpeg processing, 85-100% for verification and copy-back
         const boundedPercent = Math.max(5, Math.min(Math.round(progress.percent * 0.8) + 5, 85));
 
@@ -274,8 +274,12 @@ export class ClipExtractorService {
     let progressHandler: ((progress: FfmpegProgress) => void) | null = null;
 
     if (onProgress && duration > 0) {
+      let lastPercent = -1;
       progressHandler = (progress: FfmpegProgress) => {
         if (progress.processId !== processId) return;
+        // FFmpeg prints stats a couple of times a second; only report when the percent moves
+        if (progress.percent === lastPercent) return;
+        lastPercent = progress.percent;
         this.logger.log(`Progress: ${progress.percent}%`);
         onProgress(progress.percent);
       };
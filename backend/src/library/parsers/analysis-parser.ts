@@ -6,6 +6,16 @@ import {
   AnalysisQuote,
 } from '../interfaces/library.interface';
 
+// Report line patterns, compiled once rather than per line
+// Section header: **...**
+const SECTION_HEADER_REGEX = /^\*\*(.+?)\*\*$/;
+// Section text: "START - END - Description [category]" or "START - Description [category]"
+const SECTION_TEXT_REGEX = /^(\d+:\d+:\d+|\d+:\d+)\s*-\s*(?:(\d+:\d+:\d+|\d+:\d+)\s*-\s*)?(.+?)\s*\[(.+?)\]$/;
+// Quote: TIMESTAMP - "Quote text"
+const QUOTE_REGEX = /^(\d+:\d+:\d+|\d+:\d+)\s*-\s*"(.+?)"$/;
+// Significance: → text
+const SIGNIFICANCE_REGEX = /^→\s*(.+)$/;
+
 /**
  * Parse timestamp in MM:SS format to seconds
  */
@@ -46,27 +56,33 @@ export async function parseAnalysisReport(
   createdAt: string
 ): Promise<ParsedAnalysisMetadata> {
   const content = await fs.readFile(filePath, 'utf-8');
-  const lines = content.split('\n');
 
   const sections: AnalysisSection[] = [];
   let currentSection: AnalysisSection | null = null;
   let currentQuote: Partial<AnalysisQuote> | null = null;
 
-  for (let i = 0; i < lines.length; i++) {
-    const line = lines[i].trim();
-
-    // Skip empty lines and dividers
-    if (line.length === 0 || line.match(/^[=\-]+$/)) {
-      continue;
+  // Walk the report line by line by offset rather than splitting it into an
+  // array up front, so only one line is held alongside the content at a time
+  let lineStart = 0;
+  while (lineStart <= content.length) {
+    let lineEnd = content.indexOf('\n', lineStart);
+    if (lineEnd === -1) {
+      lineEnd = content.length;
     }
+    const line = content.slice(lineStart, lineEnd).trim();
+    lineStart = lineEnd + 1;
 
-    // Skip header
-    if (line === 'VIDEO ANALYSIS RESULTS') {
+    // Skip empty lines
+    if (line.length === 0) {
       continue;
     }
 
+    // Every line kind starts with a different character, so dispatch on it and
+    // only try the one pattern that can match (dividers and the header fall through)
+    const firstChar = line[0];
+
     // Check for section header (lines between ** **)
-    const sectionMatch = line.match(/^\*\*(.+?)\*\*$/);
+    const sectionMatch = firstChar === '*' ? SECTION_HEADER_REGEX.exec(line) : null;
     if (sectionMatch) {
       // Save previous section if exists
       if (currentSection) {
@@ -83,32 +99,27 @@ export async function parseAnalysisReport(
       // Parse new section
       const sectionText = sectionMatch[1];
 
-      // Try to parse: "HH:MM:SS - HH:MM:SS - Description [category]" or "MM:SS - MM:SS - Description [category]"
-      const fullMatch = sectionText.match(/^(\d+:\d+:\d+|\d+:\d+)\s*-\s*(\d+:\d+:\d+|\d+:\d+)\s*-\s*(.+?)\s*\[(.+?)\]$/);
-      if (fullMatch) {
-        const [, startTime, endTime, description, category] = fullMatch;
-        currentSection = {
-          timeRange: `${startTime} - ${endTime}`,
-          startSeconds: parseTimestampToSeconds(startTime),
-          endSeconds: parseTimestampToSeconds(endTime),
-          category: category.trim(),
-          description: description.trim(),
-          quotes: [],
-        };
-        continue;
-      }
-
-      // Try to parse: "HH:MM:SS - Description [category]" or "MM:SS - Description [category]"
-      const simpleMatch = sectionText.match(/^(\d+:\d+:\d+|\d+:\d+)\s*-\s*(.+?)\s*\[(.+?)\]$/);
-      if (simpleMatch) {
-        const [, startTime, description, category] = simpleMatch;
-        currentSection = {
-          timeRange: startTime,
-          startSeconds: parseTimestampToSeconds(startTime),
-          category: category.trim(),
-          description: description.trim(),
-          quotes: [],
-        };
+      // Parse "HH:MM:SS - HH:MM:SS - Description [category]" or "MM:SS - MM:SS - Description [category]",
+      // or the same without an end time
+      const textMatch = SECTION_TEXT_REGEX.exec(sectionText);
+      if (textMatch) {
+        const [, startTime, endTime, description, category] = textMatch;
+        currentSection = endTime
+          ? {
+              timeRange: `${startTime} - ${endTime}`,
+              startSeconds: parseTimestampToSeconds(startTime),
+              endSeconds: parseTimestampToSeconds(endTime),
+              category: category.trim(),
+              description: description.trim(),
+              quotes: [],
+            }
+          : {
+              timeRange: startTime,
+              startSeconds: parseTimestampToSeconds(startTime),
+              category: category.trim(),
+              description: description.trim(),
+              quotes: [],
+            };
         continue;
       }
 
@@ -118,7 +129,9 @@ export async function parseAnalysisReport(
     }
 
     // Check for quote (HH:MM:SS - "Quote text" or MM:SS - "Quote text")
-    const quoteMatch = line.match(/^(\d+:\d+:\d+|\d+:\d+)\s*-\s*"(.+?)"$/);
+    const quoteMatch = currentSection && firstChar >= '0' && firstChar <= '9'
+      ? QUOTE_REGEX.exec(line)
+      : null;
     if (quoteMatch && currentSection) {
       // Save previous quote if exists
       if (currentQuote && currentQuote.timestamp && currentQuote.text) {
@@ -136,7 +149,7 @@ export async function parseAnalysisReport(
     }
 
     // Check for significance line (→ text)
-    const significanceMatch = line.match(/^→\s*(.+)$/);
+    const significanceMatch = currentQuote && firstChar === '→' ? SIGNIFICANCE_REGEX.exec(line) : null;
     if (significanceMatch && currentQuote) {
       currentQuote.significance = significanceMatch[1].trim();
       continue;
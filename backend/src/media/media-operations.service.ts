@@ -7,7 +7,7 @@ import { WhisperService } from './whisper.service';
 import { DownloaderService } from '../downloader/downloader.service';
 import { FileScannerService } from '../database/file-scanner.service';
 import { DatabaseService } from '../database/database.service';
-import { AIAnalysisService } from '../analysis/ai-analysis.service';
+import { AIAnalysisService, parseSrtToSegments } from '../analysis/ai-analysis.service';
 import { ApiKeysService } from '../config/api-keys.service';
 import { FfmpegService } from '../ffmpeg/ffmpeg.service';
 import {
@@ -548,7 +548,7 @@ export class MediaOperationsService {
       const transcriptSrt = transcript.srt_format as string;
 
       // Parse SRT to segments
-      const segments = this.parseSrtToSegments(transcriptSrt);
+      const segments = parseSrtToSegments(transcriptSrt);
 
       // Create temp file for analysis output
       const os = require('os');
@@ -636,8 +636,7 @@ export class MediaOperationsService {
         suggested_title: analysisResult.suggested_title,
       }));
 
-      // Read analysis file
-      const analysisText = fs.readFileSync(analysisOutputPath, 'utf8');
+      const analysisText = analysisResult.report;
 
       // Save analysis to database (including title suggestion in summary field)
       this.databaseService.insertAnalysis({
@@ -841,65 +840,6 @@ export class MediaOperationsService {
     }
   }
 
-  /**
-   * Parse SRT content into segments for AI analysis
-   */
-  private parseSrtToSegments(srtContent: string): any[] {
-    console.log(`[parseSrtToSegments] SRT content length: ${srtContent?.length || 0}`);
-    console.log(`[parseSrtToSegments] SRT preview: ${srtContent?.substring(0, 300)}`);
-
-    const segments: any[] = [];
-
-    // Normalize line endings: convert \r\n (Windows) to \n (Unix)
-    // This is critical on Windows where SRT files may have \r\n line endings
-    const normalizedContent = srtContent.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
-    const blocks = normalizedContent.split('\n\n').filter(b => b.trim());
-    console.log(`[parseSrtToSegments] Found ${blocks.length} blocks (after line ending normalization)`);
-
-    for (const block of blocks) {
-      const lines = block.split('\n');
-      if (lines.length < 3) {
-        console.log(`[parseSrtToSegments] Skipping block with ${lines.length} lines`);
-        continue;
-      }
-
-      const timestampLine = lines[1];
-      const textLines = lines.slice(2);
-
-      const match = timestampLine.match(/(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/);
-      if (match) {
-        const startHours = parseInt(match[1]);
-        const startMinutes = parseInt(match[2]);
-        const startSeconds = parseInt(match[3]);
-        const startMs = parseInt(match[4]);
-
-        const endHours = parseInt(match[5]);
-        const endMinutes = parseInt(match[6]);
-        const endSeconds = parseInt(match[7]);
-        const endMs = parseInt(match[8]);
-
-        const start = startHours * 3600 + startMinutes * 60 + startSeconds + startMs / 1000;
-        const end = endHours * 3600 + endMinutes * 60 + endSeconds + endMs / 1000;
-
-        segments.push({
-          start,
-          end,
-          text: textLines.join(' '),
-        });
-      } else {
-        console.log(`[parseSrtToSegments] No timestamp match for line: "${timestampLine}"`);
-      }
-    }
-
-    console.log(`[parseSrtToSegments] Parsed ${segments.length} segments`);
-    if (segments.length > 0) {
-      console.log(`[parseSrtToSegments] First segment: start=${segments[0].start}, end=${segments[0].end}, text="${segments[0].text.substring(0, 50)}"`);
-      console.log(`[parseSrtToSegments] Last segment: start=${segments[segments.length-1].start}, end=${segments[segments.length-1].end}`);
-    }
-
-    return segments;
-  }
-
   /**
    * Parse time string (HH:MM:SS or MM:SS) to seconds
    */
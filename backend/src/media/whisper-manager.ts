@@ -4,6 +4,7 @@
 
 import { Injectable, Logger } from '@nestjs/common';
 import { EventEmitter } from 'events';
+import * as crypto from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 import {
@@ -18,13 +19,30 @@ import {
 export interface WhisperProgress {
   percent: number;
   task: string;
+  queued?: boolean;  // Status-only update while waiting for a slot; percent is not meaningful
 }
 
 @Injectable()
 export class WhisperManager extends EventEmitter {
   private readonly logger = new Logger(WhisperManager.name);
   private whisper: WhisperBridge;
-  private currentProcessId: string | null = null;
+  // Both slots can run at once, so every in-flight whisper-cli run is tracked
+  private activeProcessIds = new Set<string>();
+  // whisper.cpp gives each process the whole GPU (or every CPU core), so overlapping
+  // runs just fight over the same hardware with a model copy each. One transcription
+  // holds the primary slot. With WHISPER_CPU_OFFLOAD=true, a short file on a small
+  // model may take the idle CPU slot while the primary runs on the GPU, instead
+  // of waiting behind it. Off by default: on a fast GPU, waiting usually wins.
+  private primarySlotBusy = false;
+  private cpuSlotBusy = false;
+  private slotWaiters: Array<() => void> = [];
+  private cpuOffloadEnabled = false;
+  private static readonly CPU_OFFLOAD_MAX_SECONDS = 10 * 60;
+  // Larger models decode too slowly on the CPU to beat a queued GPU run
+  private static readonly CPU_OFFLOAD_MODEL_REGEX = /^(?:tiny|base|small)(?:\.|-|$)/;
+  private static readonly MODEL_WARM_DELAY_MS = 5000;
+  // Models currently being read into the page cache
+  private warmingModels = new Set<string>();
 
   constructor() {
     super();
@@ -58,11 +76,26 @@ export class WhisperManager extends EventEmitter {
       this.logger.log(`  Whisper binary permissions: ${stats.mode.toString(8)}`);
     }
 
+    // Device and precision overrides: WHISPER_GPU_MODE picks the starting device
+    // (auto/gpu/cpu) and PREFER_QUANTIZED_WHISPER_MODELS=false keeps CPU runs on
+    // the full-precision weights instead of a quantized copy
+    const envGpuMode = process.env.WHISPER_GPU_MODE?.toLowerCase();
+    const gpuMode: WhisperGpuMode | undefined =
+      envGpuMode === 'auto' || envGpuMode === 'gpu' || envGpuMode === 'cpu' ? envGpuMode : undefined;
+    if (envGpuMode && !gpuMode) {
+      this.logger.warn(`Ignoring unknown WHISPER_GPU_MODE "${envGpuMode}" (expected auto, gpu or cpu)`);
+    }
+
+    const cpuOffloadSetting = (process.env.WHISPER_CPU_OFFLOAD || '').toLowerCase();
+    this.cpuOffloadEnabled = cpuOffloadSetting === 'true' || cpuOffloadSetting === '1';
+
     // Initialize the WhisperBridge
     this.whisper = new WhisperBridge({
       binaryPath: whisperPath,
       modelsDir: modelsDir,
       libraryPath: getWhisperLibraryPath(),
+      gpuMode,
+      preferQuantizedOnCpu: process.env.PREFER_QUANTIZED_WHISPER_MODELS !== 'false',
     });
 
     // Forward progress events from bridge to this manager
@@ -88,6 +121,29 @@ export class WhisperManager extends EventEmitter {
     }
 
     this.logger.log('='.repeat(60));
+
+    // Pull the default model into the page cache off the startup path, so the
+    // first transcription doesn't pay for a cold read of the weights
+    if (availableModels.length > 0) {
+      setTimeout(() => this.warmModel(), WhisperManager.MODEL_WARM_DELAY_MS);
+    }
+  }
+
+  /**
+   * Start reading a model's weights into the page cache in the background
+   * Called ahead of work that doesn't need whisper (audio extraction), so the
+   * cold read overlaps it instead of delaying whisper-cli's startup
+   * Re-reading a model that is still cached is cheap, and it reloads one that was evicted
+   */
+  warmModel(modelName: string = WhisperBridge.DEFAULT_MODEL): void {
+    if (this.warmingModels.has(modelName)) return;
+    this.warmingModels.add(modelName);
+
+    this.whisper.warmModel(modelName)
+      .catch((error) => {
+        this.logger.warn(`Could not warm whisper model: ${(error as Error).message}`);
+      })
+      .finally(() => this.warmingModels.delete(modelName));
   }
 
   /**
@@ -110,8 +166,77 @@ export class WhisperManager extends EventEmitter {
    * @param outputDir - Directory for output files
    * @param modelName - Whisper model to use (optional)
    * @param audioDurationSeconds - Duration of audio in seconds for progress estimation (optional)
+   * @param onProgress - Progress callback scoped to this transcription only (optional)
+   * @param offsetSeconds - Leading audio to skip, e.g. detected silence (optional)
+   */
+  async transcribe(
+    audioFile: string,
+    outputDir: string,
+    modelName?: string,
+    audioDurationSeconds?: number,
+    onProgress?: (progress: WhisperProgress) => void,
+    offsetSeconds?: number,
+  ): Promise<string> {
+    let slot = this.tryAcquireSlot(modelName, audioDurationSeconds);
+    if (!slot) {
+      onProgress?.({ percent: 0, task: 'Waiting for another transcription to finish', queued: true });
+      while (!slot) {
+        await new Promise<void>((resolve) => this.slotWaiters.push(resolve));
+        slot = this.tryAcquireSlot(modelName, audioDurationSeconds);
+      }
+    }
+
+    try {
+      return await this.runTranscription(audioFile, outputDir, modelName, audioDurationSeconds, onProgress, offsetSeconds, slot === 'cpu');
+    } finally {
+      if (slot === 'cpu') {
+        this.cpuSlotBusy = false;
+      } else {
+        this.primarySlotBusy = false;
+      }
+      // Wake everyone waiting; each re-checks and goes back to waiting if it lost the race
+      for (const wake of this.slotWaiters.splice(0)) {
+        wake();
+      }
+    }
+  }
+
+  /**
+   * Claim a transcription slot, or null if the caller has to wait
+   * The CPU slot is opt-in, only used alongside a GPU run, and only for small
+   * models and files short enough that CPU decoding can beat waiting for the GPU
    */
-  async transcribe(audioFile: string, outputDir: string, modelName?: string, audioDurationSeconds?: number): Promise<string> {
+  private tryAcquireSlot(modelName: string | undefined, audioDurationSeconds?: number): 'primary' | 'cpu' | null {
+    if (!this.primarySlotBusy) {
+      this.primarySlotBusy = true;
+      return 'primary';
+    }
+
+    const smallModel = WhisperManager.CPU_OFFLOAD_MODEL_REGEX.test(modelName || WhisperBridge.DEFAULT_MODEL);
+    if (!this.cpuOffloadEnabled || !smallModel) {
+      return null;
+    }
+
+    const gpuMode = this.whisper.getGpuMode();
+    const primaryOnGpu = gpuMode === 'gpu' || (gpuMode === 'auto' && !this.whisper.hasGpuFailed());
+    const shortFile = !!audioDurationSeconds && audioDurationSeconds <= WhisperManager.CPU_OFFLOAD_MAX_SECONDS;
+    if (!this.cpuSlotBusy && primaryOnGpu && shortFile) {
+      this.cpuSlotBusy = true;
+      return 'cpu';
+    }
+
+    return null;
+  }
+
+  private async runTranscription(
+    audioFile: string,
+    outputDir: string,
+    modelName?: string,
+    audioDurationSeconds?: number,
+    onProgress?: (progress: WhisperProgress) => void,
+    offsetSeconds?: number,
+    cpuOnly = false,
+  ): Promise<string> {
     this.logger.log('='.repeat(60));
     this.logger.log('STARTING TRANSCRIPTION');
     this.logger.log('='.repeat(60));
@@ -140,21 +265,35 @@ export class WhisperManager extends EventEmitter {
       throw new Error(error);
     }
 
-    // Generate a process ID for tracking
-    const processId = `transcribe-${Date.now()}`;
-    this.currentProcessId = processId;
+    // Generate a process ID for tracking; it must be unique, since the bridge keys
+    // processes by it and progress is routed by prefix
+    const processId = `transcribe-${crypto.randomUUID()}`;
+    this.activeProcessIds.add(processId);
+
+    // This manager is shared across jobs, so route bridge progress for this
+    // process (including its CPU fallback retry) to the caller's callback only
+    const report = (progress: WhisperProgress) => {
+      this.emit('progress', progress);
+      onProgress?.(progress);
+    };
+    const bridgeProgressHandler = (progress: BridgeProgress) => {
+      if (onProgress && progress.processId.startsWith(processId)) {
+        onProgress({ percent: progress.percent, task: progress.message });
+      }
+    };
+    this.whisper.on('progress', bridgeProgressHandler);
 
-    this.emit('progress', { percent: 5, task: 'Starting transcription' });
+    report({ percent: 5, task: 'Starting transcription' });
 
     try {
       const result = await this.whisper.transcribe(audioFile, outputDir, {
         model: modelName,
         processId,
         audioDurationSeconds,
+        offsetSeconds,
+        cpuOnly,
       });
 
-      this.currentProcessId = null;
-
       if (!result.success) {
         const error = result.error || 'Transcription failed';
         this.logger.error(error);
@@ -180,7 +319,7 @@ export class WhisperManager extends EventEmitter {
           const foundSrt = path.join(outputDir, srtFiles[0]);
           const stats = fs.statSync(foundSrt);
           this.logger.log(`SRT file found: ${foundSrt} (${stats.size} bytes)`);
-          this.emit('progress', { percent: 100, task: 'Transcription completed' });
+          report({ percent: 100, task: 'Transcription completed' });
           return foundSrt;
         }
 
@@ -188,25 +327,29 @@ export class WhisperManager extends EventEmitter {
       }
 
       this.logger.log(`Transcription completed: ${result.srtPath}`);
-      this.emit('progress', { percent: 100, task: 'Transcription completed' });
+      report({ percent: 100, task: 'Transcription completed' });
       return result.srtPath;
-    } catch (err) {
-      this.currentProcessId = null;
-      throw err;
+    } finally {
+      this.activeProcessIds.delete(processId);
+      this.whisper.off('progress', bridgeProgressHandler);
     }
   }
 
   /**
-   * Cancel the current transcription
+   * Cancel every running transcription (both slots)
    */
   cancel(): void {
-    if (this.currentProcessId && this.whisper.isRunning(this.currentProcessId)) {
-      this.logger.log('='.repeat(60));
-      this.logger.log('CANCELLING TRANSCRIPTION');
-      this.logger.log(`  Process ID: ${this.currentProcessId}`);
-      this.whisper.abort(this.currentProcessId);
-      this.currentProcessId = null;
-      this.logger.log('='.repeat(60));
+    for (const processId of this.activeProcessIds) {
+      // The bridge runs its CPU fallback retry under a suffixed ID
+      for (const id of [processId, `${processId}-cpu`]) {
+        if (this.whisper.isRunning(id)) {
+          this.logger.log('='.repeat(60));
+          this.logger.log('CANCELLING TRANSCRIPTION');
+          this.logger.log(`  Process ID: ${id}`);
+          this.whisper.abort(id);
+          this.logger.log('='.repeat(60));
+        }
+      }
     }
   }
 
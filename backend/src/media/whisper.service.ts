@@ -3,7 +3,7 @@ import { Injectable, Logger } from '@nestjs/common';
 import { MediaEventService } from './media-event.service';
 import * as path from 'path';
 import * as fs from 'fs';
-import { WhisperManager } from './whisper-manager';
+import { WhisperManager, type WhisperProgress } from './whisper-manager';
 import {
   FfmpegBridge,
   FfprobeBridge,
@@ -19,6 +19,7 @@ export class WhisperService {
 
   constructor(
     private readonly eventService: MediaEventService,
+    private readonly whisperManager: WhisperManager,
   ) {
     // ALWAYS use bundled binaries from getRuntimePaths() - NEVER use system binaries
     const paths = getRuntimePaths();
@@ -59,36 +60,6 @@ export class WhisperService {
 
       this.logger.log(`Created dedicated output directory: ${outputDir}`);
 
-      // Quick check: is the first 10 seconds quiet?
-      // If very quiet, run silence detection to skip leading silence
-      let silenceOffset = 0;
-
-      try {
-        this.eventService.emitTaskProgress(jobId || '', 'transcribe', 2, 'Checking audio levels...');
-        const startVolume = await this.ffmpeg.getVolumeLevel(videoFile, 0, 10);
-        this.logger.log(`First 10s volume: mean=${startVolume.mean.toFixed(1)}dB, max=${startVolume.max.toFixed(1)}dB`);
-
-        // If very quiet (< -40dB), run silence detection to skip leading silence
-        if (startVolume.mean < -40) {
-          this.eventService.emitTaskProgress(jobId || '', 'transcribe', 3, 'Quiet start detected, scanning for audio...');
-          silenceOffset = await this.ffmpeg.detectAudioStart(videoFile, {
-            silenceThreshold: -45,
-            minSilenceDuration: 2,
-            maxSearchDuration: 300, // Only search first 5 minutes (faster)
-          });
-          if (silenceOffset > 5) {
-            this.logger.log(`Detected ${silenceOffset.toFixed(1)}s of silence at start, will skip`);
-            const skipMinutes = Math.floor(silenceOffset / 60);
-            const skipSeconds = Math.floor(silenceOffset % 60);
-            this.eventService.emitTaskProgress(jobId || '', 'transcribe', 4, `Skipping ${skipMinutes}m ${skipSeconds}s of silence...`);
-          } else {
-            silenceOffset = 0;
-          }
-        }
-      } catch (err) {
-        this.logger.warn(`Volume/silence detection failed, processing from start: ${err}`);
-      }
-
       // Get video duration for progress tracking during extraction
       let videoDurationSeconds: number | undefined;
       try {
@@ -98,6 +69,9 @@ export class WhisperService {
         this.logger.warn(`Could not determine video duration: ${err}`);
       }
 
+      // Read the model in while FFmpeg extracts the audio
+      this.whisperManager.warmModel(model);
+
       // Extract audio from video first (much more reliable for whisper)
       this.logger.log(`Extracting audio from video...`);
       const extractMessage = 'Extracting audio...';
@@ -116,7 +90,7 @@ export class WhisperService {
       };
       this.ffmpeg.on('progress', extractProgressHandler);
 
-      audioFile = await this.extractAudio(videoFile, outputDir, jobId || 'standalone', silenceOffset, videoDurationSeconds);
+      audioFile = await this.extractAudio(videoFile, outputDir, jobId || 'standalone', videoDurationSeconds);
 
       // Remove the progress handler after extraction
       this.ffmpeg.off('progress', extractProgressHandler);
@@ -124,6 +98,38 @@ export class WhisperService {
       this.eventService.emitTaskProgress(jobId || '', 'transcribe', 12, 'Audio extracted, starting transcription...');
       this.logger.log(`Audio extracted to: ${audioFile}`);
 
+      // Quick check: is the first 10 seconds quiet?
+      // If very quiet, run silence detection to skip leading silence
+      // Both checks read the extracted 16kHz WAV rather than decoding the video again,
+      // and whisper skips the silence itself, so the audio is only decoded once
+      let silenceOffset = 0;
+
+      try {
+        this.eventService.emitTaskProgress(jobId || '', 'transcribe', 13, 'Checking audio levels...');
+        const startVolume = await this.ffmpeg.getVolumeLevel(audioFile, 0, 10);
+        this.logger.log(`First 10s volume: mean=${startVolume.mean.toFixed(1)}dB, max=${startVolume.max.toFixed(1)}dB`);
+
+        // If very quiet (< -40dB), run silence detection to skip leading silence
+        if (startVolume.mean < -40) {
+          this.eventService.emitTaskProgress(jobId || '', 'transcribe', 13, 'Quiet start detected, scanning for audio...');
+          silenceOffset = await this.ffmpeg.detectAudioStart(audioFile, {
+            silenceThreshold: -45,
+            minSilenceDuration: 2,
+            maxSearchDuration: 300, // Only search first 5 minutes (faster)
+          });
+          if (silenceOffset > 5) {
+            this.logger.log(`Detected ${silenceOffset.toFixed(1)}s of silence at start, will skip`);
+            const skipMinutes = Math.floor(silenceOffset / 60);
+            const skipSeconds = Math.floor(silenceOffset % 60);
+            this.eventService.emitTaskProgress(jobId || '', 'transcribe', 14, `Skipping ${skipMinutes}m ${skipSeconds}s of silence...`);
+          } else {
+            silenceOffset = 0;
+          }
+        }
+      } catch (err) {
+        this.logger.warn(`Volume/silence detection failed, processing from start: ${err}`);
+      }
+
       // Use video duration (adjusted for offset) as audio duration estimate
       const audioDurationSeconds = videoDurationSeconds ? videoDurationSeconds - silenceOffset : undefined;
       if (audioDurationSeconds) {
@@ -132,14 +138,22 @@ export class WhisperService {
 
       this.eventService.emitTaskProgress(jobId || '', 'transcribe', 15, 'Starting transcription...');
 
-      const whisperManager = new WhisperManager();
-
       // Track start time for ETA calculation
       const transcriptionStartTime = Date.now();
       let lastWhisperProgress = 15;
 
       // Set up progress tracking
-      whisperManager.on('progress', (progress) => {
+      const onWhisperProgress = (progress: WhisperProgress) => {
+        // The queued notice carries no percent, so show it at the current progress
+        if (progress.queued) {
+          if (jobId) {
+            this.eventService.emitTaskProgress(jobId, 'transcribe', lastWhisperProgress, progress.task);
+          } else {
+            this.eventService.emitTranscriptionProgress(lastWhisperProgress, progress.task, jobId);
+          }
+          return;
+        }
+
         // Only emit if progress increased (prevent bouncing)
         if (progress.percent <= lastWhisperProgress) {
           return;
@@ -156,37 +170,34 @@ export class WhisperService {
           eta = Math.round((elapsedMs * ((100 - progress.percent) / progress.percent)) / 1000);
         }
 
-        // Emit old event for backward compatibility
-        this.eventService.emitTranscriptionProgress(
-          progress.percent,
-          progress.task,
-          jobId
-        );
-        // Emit new task-progress event for queue system with ETA
+        // Queue jobs get the task-progress event with ETA; the old event is only
+        // for callers without a job, so each tick is serialized and sent once
         if (jobId) {
           this.eventService.emitTaskProgress(jobId, 'transcribe', progress.percent, progress.task, {
             eta,
             elapsedMs,
           });
+        } else {
+          this.eventService.emitTranscriptionProgress(
+            progress.percent,
+            progress.task,
+            jobId
+          );
         }
-
-        console.log(`Progress event: ${JSON.stringify(progress)}, ETA: ${eta}s`);
-      });
+      };
 
       this.logger.log(`Starting transcription for ${audioFile}`);
       this.eventService.emitTranscriptionStarted(videoFile, jobId);
 
       // Start transcription on the extracted audio file
       // Pass audio duration for time-based progress estimation
-      const srtFile = await whisperManager.transcribe(audioFile, outputDir, model, audioDurationSeconds);
+      // The injected WhisperManager is shared, so the bridge, model discovery and
+      // GPU fallback state persist across jobs instead of being rebuilt per file
+      // whisper.cpp timestamps stay relative to the start of the file when it skips
+      // the leading silence, so the SRT already lines up with the original video
+      const srtFile = await this.whisperManager.transcribe(audioFile, outputDir, model, audioDurationSeconds, onWhisperProgress, silenceOffset);
 
       if (srtFile && fs.existsSync(srtFile)) {
-        // If we skipped silence at the start, offset all timestamps to match original video
-        if (silenceOffset > 0) {
-          this.logger.log(`Adjusting timestamps by ${silenceOffset.toFixed(1)}s to match original video`);
-          this.offsetSrtTimestamps(srtFile, silenceOffset);
-        }
-
         this.logger.log(`Transcription completed: ${srtFile}`);
         this.eventService.emitTranscriptionCompleted(srtFile, jobId);
 
@@ -247,22 +258,18 @@ export class WhisperService {
    * Extract audio from video using FFmpeg bridge
    * Optimized for whisper: 16kHz, mono, WAV format
    */
-  private async extractAudio(videoPath: string, outputDir: string, jobId: string, startOffset: number = 0, duration?: number): Promise<string> {
+  private async extractAudio(videoPath: string, outputDir: string, jobId: string, duration?: number): Promise<string> {
     const audioFilename = `${jobId}_audio.wav`;
     const audioPath = path.join(outputDir, audioFilename);
 
     this.logger.log(`Extracting audio from: ${videoPath}`);
     this.logger.log(`Audio output: ${audioPath}`);
-    if (startOffset > 0) {
-      this.logger.log(`Skipping first ${startOffset.toFixed(1)} seconds of silence`);
-    }
 
     const result = await this.ffmpeg.extractAudio(videoPath, audioPath, {
       sampleRate: 16000,
       channels: 1,
       format: 'wav',
       processId: `audio-extract-${jobId}`,
-      startOffset: startOffset > 0 ? startOffset : undefined,
       duration: duration,
     });
 
@@ -273,54 +280,4 @@ export class WhisperService {
     this.logger.log(`Audio extraction complete: ${audioPath}`);
     return audioPath;
   }
-
-  /**
-   * Offset all timestamps in an SRT file by a given number of seconds
-   * This is used when we skip silence at the start of the video
-   */
-  private offsetSrtTimestamps(srtPath: string, offsetSeconds: number): void {
-    if (offsetSeconds <= 0) return;
-
-    const content = fs.readFileSync(srtPath, 'utf-8');
-    const lines = content.split('\n');
-    const newLines: string[] = [];
-
-    // SRT timestamp format: 00:01:23,456 --> 00:01:25,789
-    const timestampRegex = /(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/;
-
-    for (const line of lines) {
-      const match = line.match(timestampRegex);
-      if (match) {
-        // Parse start time
-        const startH = parseInt(match[1]);
-        const startM = parseInt(match[2]);
-        const startS = parseInt(match[3]);
-        const startMs = parseInt(match[4]);
-        const startTotal = startH * 3600 + startM * 60 + startS + startMs / 1000 + offsetSeconds;
-
-        // Parse end time
-        const endH = parseInt(match[5]);
-        const endM = parseInt(match[6]);
-        const endS = parseInt(match[7]);
-        const endMs = parseInt(match[8]);
-        const endTotal = endH * 3600 + endM * 60 + endS + endMs / 1000 + offsetSeconds;
-
-        // Format new timestamps
-        const formatTime = (seconds: number): string => {
-          const h = Math.floor(seconds / 3600);
-          const m = Math.floor((seconds % 3600) / 60);
-          const s = Math.floor(seconds % 60);
-          const ms = Math.round((seconds % 1) * 1000);
-          return `${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}:${s.toString().padStart(2, '0')},${ms.toString().padStart(3, '0')}`;
-        };
-
-        newLines.push(`${formatTime(startTotal)} --> ${formatTime(endTotal)}`);
-      } else {
-        newLines.push(line);
-      }
-    }
-
-    fs.writeFileSync(srtPath, newLines.join('\n'));
-    this.logger.log(`Offset SRT timestamps by ${offsetSeconds.toFixed(1)} seconds`);
-  }
 }